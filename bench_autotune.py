@@ -0,0 +1,67 @@
+"""
+Autotune Benchmark
+Runs main.py headless in 'threads' inference mode with a latency target
+it cannot meet, once per --max-in-flight value, and reports how often the
+model autotuner actually swapped tiers. With more than one frame in
+flight the workers are never idle on their own, so this shows that a
+finished build is still installed.
+
+Usage:
+    python bench_autotune.py [--max-in-flight 1 2 3] [--source synthetic:300]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+SUMMARY = re.compile(r"Model autotuner: (\d+) pergantian, tier akhir (.+)")
+
+
+def run_session(max_in_flight, source, latency_target, timeout=600.0):
+    """
+    One headless session with autotuning in 'threads' mode.
+
+    Returns:
+        tuple: (switches started, switches installed, final tier) or None
+               if main.py printed no autotuner summary
+    """
+    command = [sys.executable, '-u', 'main.py', '--headless', '--source', source,
+               '--unthrottled', '--inference', 'threads',
+               '--max-in-flight', str(max_in_flight),
+               '--latency-target', str(latency_target)]
+    try:
+        proc = subprocess.run(command, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None
+    started = 0
+    for line in proc.stdout.splitlines():
+        if line.startswith('[Autotune]'):
+            started += 1
+        match = SUMMARY.match(line)
+        if match:
+            return started, int(match.group(1)), match.group(2)
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cam-Fu model autotune benchmark")
+    parser.add_argument('--max-in-flight', type=int, nargs='+', default=[1, 2, 3])
+    parser.add_argument('--source', default='synthetic:300',
+                        help="Sumber frame untuk main.py (default: synthetic:300)")
+    parser.add_argument('--latency-target', type=float, default=1.0,
+                        help="Target latensi (ms); default 1 ms selalu terlampaui")
+    args = parser.parse_args(argv)
+
+    print(f"{'in-flight':>9}{'dimulai':>9}{'terpasang':>11}  tier akhir")
+    for max_in_flight in args.max_in_flight:
+        result = run_session(max_in_flight, args.source, args.latency_target)
+        if result is None:
+            print(f"{max_in_flight:>9}{'gagal':>9}")
+            continue
+        started, switches, tier = result
+        print(f"{max_in_flight:>9}{started:>9}{switches:>11}  {tier}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Broadphase Benchmark
+Stress scenario with thousands of live objects: runs the same seeded
+endurance session with the spatial hash broadphase and with brute force
+(every object tested every tick), and reports the tick times of both.
+The speedup is on the whole GameEngine.update (grid upkeep included),
+and the p95 tick is shown as a share of a 60 FPS frame.
+
+Usage:
+    python bench_broadphase.py [--sizes 100 1000 5000] [--ticks 300] [--repeats 3]
+"""
+
+import argparse
+import random
+
+import numpy as np
+
+from game_engine import GameEngine
+from game_objects import GameObject
+from headless_runner import ScriptedPlayer, SilentSoundManager
+from profiler import profiler
+from spawn_manager import SpawnManager
+
+
+def run_stress(count, broadphase, ticks, seed, pose_every, screen_size=(1280, 720)):
+    """
+    Play ``ticks`` ticks with ``count`` objects already on the field.
+
+    Targets never expire and everything spawns far faster than in the
+    normal game, so only the player's punches thin the field out. Lives
+    are unlimited so the session never ends.
+
+    Returns:
+        dict: Profiler summary of 'update' and 'collision' plus outcome
+    """
+    GameObject.load_images = False
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    width, height = screen_size
+
+    spawn_manager = SpawnManager(width, height)
+    # Mode endurance: spawn jauh lebih sering dari game biasa
+    spawn_manager.target_spawn_interval = 0.1
+    spawn_manager.obstacle_spawn_interval = 0.5
+    spawn_manager.powerup_spawn_interval = 2.0
+    engine = GameEngine(None, None, None, spawn_manager,
+                        sound_manager=SilentSoundManager(), screen_size=screen_size,
+                        broadphase=broadphase)
+    engine.score_manager.lives = engine.score_manager.max_lives = 10 ** 9
+    for _ in range(count):
+        spawn_manager.spawn_target(engine.targets)
+    for _ in range(count // 10):
+        spawn_manager.spawn_obstacle(engine.obstacles)
+        spawn_manager.spawn_powerup(engine.powerups)
+
+    player = ScriptedPlayer('chaser', rng, width, height)
+    dt = 1.0 / 60.0
+    profiler.reset()
+    profiler.enable(True)
+    landmarks = hand_info = None
+    for tick in range(ticks):
+        sample = player.step(engine, dt)
+        if tick % pose_every == 0:
+            landmarks, hand_info = sample
+        engine.update(dt, landmarks, hand_info)
+    profiler.enable(False)
+
+    summary = profiler.summary()
+    score = engine.score_manager
+    return {
+        'update': summary.get('update', {}),
+        'collision': summary.get('collision', {}),
+        'objects': len(engine.targets) + len(engine.obstacles) + len(engine.powerups),
+        'outcome': (score.score, score.targets_hit, score.lives,
+                    round(score.max_punch_speed, 3)),
+        'grid': engine.grid.get_stats(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cam-Fu broadphase benchmark")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--ticks', type=int, default=300)
+    parser.add_argument('--pose-every', type=int, default=2,
+                        help="Sampel pose tiap N tick (default 2 = kamera 30 Hz)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=3,
+                        help="Ulangi tiap mode; yang dilaporkan run dengan update p50 terkecil")
+    args = parser.parse_args(argv)
+
+    frame_ms = 1000.0 / 60.0
+    print(f"{'awal':>6}{'akhir':>7}  {'mode':<11}{'update p50':>11}{'p95':>8}"
+          f"{'collision p50':>15}{'p95':>8}{'kandidat':>10}{'speedup':>9}"
+          f"{'frame 60':>10}  hasil")
+    for count in args.sizes:
+        results = {}
+        for _ in range(args.repeats):
+            # Mode bergantian per ulangan supaya gangguan mesin kena keduanya
+            for mode, broadphase in (('brute', False), ('broadphase', True)):
+                r = run_stress(count, broadphase, args.ticks, args.seed, args.pose_every)
+                p50 = r['update'].get('p50_ms', 0)
+                if mode not in results or p50 < results[mode]['update'].get('p50_ms', 0):
+                    results[mode] = r
+        same = results['brute']['outcome'] == results['broadphase']['outcome']
+        brute_p50 = results['brute']['update'].get('p50_ms', 0)
+        for mode, r in results.items():
+            update, collision = r['update'], r['collision']
+            candidates = r['grid']['avg_candidates'] if mode == 'broadphase' else '-'
+            p50 = update.get('p50_ms', 0)
+            speedup = f"{brute_p50 / p50:.2f}x" if mode == 'broadphase' and p50 else '-'
+            budget = update.get('p95_ms', 0) / frame_ms * 100
+            print(f"{count:>6}{r['objects']:>7}  {mode:<11}{p50:>9.2f}ms"
+                  f"{update.get('p95_ms', 0):>6.2f}ms{collision.get('p50_ms', 0):>13.2f}ms"
+                  f"{collision.get('p95_ms', 0):>6.2f}ms{candidates:>10}{speedup:>9}"
+                  f"{budget:>9.0f}%  {'sama' if same else 'BEDA'}")
+
+
+if __name__ == "__main__":
+    main()
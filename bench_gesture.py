@@ -0,0 +1,42 @@
+"""
+Gesture Benchmark
+Classifies a long synthetic recording of hand landmarks offline in one
+classify_batch call and reports the time and the gesture counts.
+
+Usage:
+    python bench_gesture.py [--frames 10000] [--hands 2] [--repeats 5]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from gesture_classifier import GESTURE_NAMES, classify_batch
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cam-Fu gesture benchmark")
+    parser.add_argument('--frames', type=int, default=10000)
+    parser.add_argument('--hands', type=int, default=2)
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(args.seed)
+    recording = rng.random((args.frames, args.hands, 21, 3), dtype=np.float32)
+
+    best = None
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        codes = classify_batch(recording)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    counts = {GESTURE_NAMES[c]: int((codes == c).sum()) for c in GESTURE_NAMES}
+    print(f"{codes.size} tangan diklasifikasi dalam {best * 1000:.1f} ms "
+          f"({best / codes.size * 1e6:.2f} us/tangan): {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Startup Benchmark
+Measures module import times (in fresh interpreters) and the cold start of
+main.py up to the first rendered frame.
+
+Usage:
+    python bench_startup.py [--repeats 3] [--source synthetic:120]
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+MODULES = ('pygame', 'cv2', 'mediapipe', 'landmarks', 'renderer', 'game_engine',
+           'headless_runner', 'pose_detector', 'main')
+
+IMPORT_PROBE = (
+    "import sys, time\n"
+    "start = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - start\n"
+    "print('RESULT', elapsed, 'mediapipe' in sys.modules, 'cv2' in sys.modules)\n"
+)
+
+FIRST_FRAME_MARKER = 'Startup: frame pertama'
+
+
+def measure_import(module, repeats):
+    """
+    Best-of-N import time of ``module`` in a fresh interpreter.
+
+    Returns:
+        tuple: (seconds or None if the import failed, loads mediapipe, loads cv2)
+    """
+    best = None
+    loads_mp = loads_cv2 = False
+    for _ in range(repeats):
+        proc = subprocess.run([sys.executable, '-c', IMPORT_PROBE.format(module=module)],
+                              capture_output=True, text=True)
+        for line in proc.stdout.splitlines():
+            if line.startswith('RESULT'):
+                _, elapsed, loads_mp, loads_cv2 = line.split()
+                elapsed = float(elapsed)
+                best = elapsed if best is None else min(best, elapsed)
+                loads_mp, loads_cv2 = loads_mp == 'True', loads_cv2 == 'True'
+    return best, loads_mp, loads_cv2
+
+
+def measure_first_frame(source, repeats, timeout=120.0):
+    """
+    Wall time from spawning ``main.py --headless`` until its first frame.
+
+    Returns:
+        float or None: Best time in seconds (None if no frame was reported)
+    """
+    best = None
+    command = [sys.executable, '-u', 'main.py', '--headless', '--source', source,
+               '--unthrottled']
+    for _ in range(repeats):
+        start = time.perf_counter()
+        proc = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                stderr=subprocess.DEVNULL, text=True)
+        elapsed = None
+        try:
+            for line in proc.stdout:
+                if line.startswith(FIRST_FRAME_MARKER):
+                    elapsed = time.perf_counter() - start
+                    break
+                if time.perf_counter() - start > timeout:
+                    break
+        finally:
+            proc.kill()
+            proc.wait()
+        if elapsed is not None:
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cam-Fu startup benchmark")
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--source', default='synthetic:120',
+                        help="Sumber frame untuk main.py (default: synthetic:120)")
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<18}{'import (ms)':>12}{'mediapipe':>11}{'cv2':>6}")
+    for module in MODULES:
+        elapsed, loads_mp, loads_cv2 = measure_import(module, args.repeats)
+        if elapsed is None:
+            print(f"{module:<18}{'gagal':>12}")
+            continue
+        print(f"{module:<18}{elapsed * 1000:>12.1f}"
+              f"{'ya' if loads_mp else '-':>11}{'ya' if loads_cv2 else '-':>6}")
+
+    first_frame = measure_first_frame(args.source, args.repeats)
+    if first_frame is None:
+        print("Frame pertama: tidak terdeteksi")
+    else:
+        print(f"Cold start sampai frame pertama: {first_frame:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
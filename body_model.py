@@ -0,0 +1,116 @@
+"""
+Body Model Module
+Per-frame capsule model of the player's body in screen space, shared by the
+collision checks and the stickman renderer.
+"""
+
+import numpy as np
+
+from landmarks import PoseLandmark
+
+
+class BodyModel:
+    """
+    Head circle plus capsules (segment + radius) for the rest of the body.
+
+    Built once per PoseFrame from the integer screen points. The renderer
+    draws exactly these shapes and the collision code tests exactly these
+    shapes, so what the player sees is the hitbox.
+
+    Attributes:
+        head_center / head_radius: Head circle (nose, 0.75 x ear distance)
+        neck / pelvis: Mid-shoulder and mid-hip points as (x, y) tuples
+        starts / ends: (C, 2) int64 capsule endpoints, in CAPSULES order
+        radii: (C,) float64 capsule radii
+        joints: (J, 2) int64 unique capsule endpoints (the rounded joints)
+    """
+
+    # Setengah tebal garis stickman (lebar garis = 2 * radius + 1)
+    LIMB_RADIUS = 32
+
+    # Titik tambahan setelah 33 landmark pose
+    _NECK = 33
+    _PELVIS = 34
+
+    CAPSULES = (
+        ('torso', _NECK, _PELVIS),
+        ('neck', PoseLandmark.NOSE, _NECK),
+        ('left_upper_arm', _NECK, PoseLandmark.LEFT_ELBOW),
+        ('left_forearm', PoseLandmark.LEFT_ELBOW, PoseLandmark.LEFT_WRIST),
+        ('right_upper_arm', _NECK, PoseLandmark.RIGHT_ELBOW),
+        ('right_forearm', PoseLandmark.RIGHT_ELBOW, PoseLandmark.RIGHT_WRIST),
+        ('left_thigh', _PELVIS, PoseLandmark.LEFT_KNEE),
+        ('left_shin', PoseLandmark.LEFT_KNEE, PoseLandmark.LEFT_ANKLE),
+        ('right_thigh', _PELVIS, PoseLandmark.RIGHT_KNEE),
+        ('right_shin', PoseLandmark.RIGHT_KNEE, PoseLandmark.RIGHT_ANKLE),
+    )
+
+    CAPSULE_NAMES = tuple(name for name, _, _ in CAPSULES)
+    CAPSULE_INDEX = {name: i for i, name in enumerate(CAPSULE_NAMES)}
+    # Lengan bawah (kiri, kanan): bisa memblok obstacle saat tangan mengepal
+    FOREARMS = (CAPSULE_INDEX['left_forearm'], CAPSULE_INDEX['right_forearm'])
+
+    _STARTS = np.array([start for _, start, _ in CAPSULES])
+    _ENDS = np.array([end for _, _, end in CAPSULES])
+    # Sendi = semua ujung kapsul (termasuk hidung: ujung bulat kapsul leher)
+    _JOINTS = np.array(sorted({int(i) for _, s, e in CAPSULES for i in (s, e)}))
+
+    def __init__(self, screen_points):
+        """
+        Args:
+            screen_points: (33, 2) int64 landmark positions in screen pixels
+        """
+        points = np.empty((35, 2), dtype=np.int64)
+        points[:33] = screen_points
+        points[self._NECK] = (points[PoseLandmark.LEFT_SHOULDER] +
+                              points[PoseLandmark.RIGHT_SHOULDER]) // 2
+        points[self._PELVIS] = (points[PoseLandmark.LEFT_HIP] +
+                                points[PoseLandmark.RIGHT_HIP]) // 2
+
+        self.neck = tuple(points[self._NECK].tolist())
+        self.pelvis = tuple(points[self._PELVIS].tolist())
+        self.head_center = tuple(points[PoseLandmark.NOSE].tolist())
+        ear_distance = abs(int(points[PoseLandmark.LEFT_EAR][0]) -
+                           int(points[PoseLandmark.RIGHT_EAR][0]))
+        self.head_radius = int(ear_distance * 0.75)
+
+        self.starts = points[self._STARTS]
+        self.ends = points[self._ENDS]
+        self.radii = np.full(len(self.CAPSULES), float(self.LIMB_RADIUS))
+        self.joints = points[self._JOINTS]
+
+    def capsule_outlines(self):
+        """
+        Straight part of every capsule as a quad (the round ends are the
+        joint circles).
+
+        Returns:
+            numpy.ndarray: (C, 4, 2) float64 corners; degenerate capsules
+                           collapse to their point
+        """
+        direction = (self.ends - self.starts).astype(np.float64)
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        scale = np.divide(self.radii, length, out=np.zeros_like(length),
+                          where=length > 0)
+        normal = np.column_stack([-direction[:, 1], direction[:, 0]]) * scale[:, None]
+        return np.stack([self.starts + normal, self.ends + normal,
+                         self.ends - normal, self.starts - normal], axis=1)
+
+    def segments(self, indices=None):
+        """
+        Capsule segments as ((x, y), (x, y)) tuples.
+
+        Args:
+            indices: Capsule indices to return (default: all, CAPSULES order)
+        """
+        if indices is None:
+            indices = range(len(self.CAPSULES))
+        starts = self.starts.tolist()
+        ends = self.ends.tolist()
+        return tuple((tuple(starts[i]), tuple(ends[i])) for i in indices)
+
+    def capsule(self, name):
+        """(start, end, radius) of one capsule by name, e.g. 'left_forearm'."""
+        i = self.CAPSULE_INDEX[name]
+        return (tuple(self.starts[i].tolist()), tuple(self.ends[i].tolist()),
+                float(self.radii[i]))
@@ -0,0 +1,219 @@
+"""
+Camera Capture Module
+Reads camera frames on a dedicated thread and always hands the newest one to the game loop.
+"""
+
+import threading
+import time
+from collections import deque
+
+from frame_source import CameraSource
+
+
+class CapturedFrame:
+    """A single camera frame with its capture metadata."""
+
+    __slots__ = ('frame', 'timestamp', 'seq', 'captured_at')
+
+    def __init__(self, frame, timestamp: float, seq: int, captured_at=None):
+        """
+        Args:
+            frame: BGR image as returned by the capture device
+            timestamp: Frame time in seconds: time.perf_counter() right after
+                       a live frame was read, the source time for replayed
+                       sources (see FrameSource.frame_time)
+            seq: Monotonic sequence number (1 = first frame captured)
+            captured_at: time.perf_counter() right after the frame was read
+                         (default: timestamp)
+        """
+        self.frame = frame
+        self.timestamp = timestamp
+        self.seq = seq
+        self.captured_at = timestamp if captured_at is None else captured_at
+
+    @property
+    def age(self) -> float:
+        """Seconds elapsed since the frame was captured."""
+        return time.perf_counter() - self.captured_at
+
+
+class CameraCapture:
+    """
+    Latest-frame camera reader.
+
+    A background thread keeps calling ``read()`` on the device and stores the
+    result in a small ring buffer. The game loop only ever receives the newest
+    frame; anything older that it did not pick up in time is counted as dropped
+    instead of being queued up as input lag. ``read()`` does not wait for the
+    camera: when nothing new arrived it returns the previous frame again (same
+    ``seq``), so the loop keeps running at its own rate.
+    """
+
+    def __init__(self, device, buffer_size=2, threaded=None):
+        """
+        Initialize the capture stage.
+
+        Args:
+            device: Camera index, or an already opened object exposing
+                    read()/isOpened()/release() (a FrameSource or
+                    cv2.VideoCapture)
+            buffer_size: Number of frames kept in the ring buffer
+            threaded: Read on a background thread. When False, read() pulls
+                      synchronously from the device and never drops frames.
+                      None picks threaded for live cameras and synchronous
+                      for replayed sources.
+        """
+        if isinstance(device, int):
+            device = CameraSource(device)
+        self.cap = device
+
+        if threaded is None:
+            threaded = getattr(device, 'is_live', True)
+        self.threaded = threaded
+        self._buffer = deque(maxlen=max(1, buffer_size))
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+        self._ended = False
+        self._exited = False
+        self._release_pending = False
+
+        # Counters
+        self.frames_captured = 0
+        self.frames_delivered = 0
+        self.frames_dropped = 0
+        self._last_seq = 0
+        self._rate_window_start = time.perf_counter()
+        self._rate_window_count = 0
+        self.capture_fps = 0.0
+
+    def isOpened(self) -> bool:
+        """Whether the underlying device is open."""
+        return self.cap is not None and self.cap.isOpened()
+
+    def start(self):
+        """Start the background reader thread (no-op when not threaded)."""
+        if not self.threaded or self._running:
+            return self
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._reader_loop, name="CameraCapture", daemon=True)
+        self._thread.start()
+        return self
+
+    def _store(self, frame):
+        """Wrap a raw frame and push it into the ring buffer."""
+        now = time.perf_counter()
+        # Sumber replay: waktu sumber, bukan jam dinding
+        frame_time = getattr(self.cap, 'frame_time', None)
+        with self._cond:
+            self.frames_captured += 1
+            self._buffer.append(CapturedFrame(
+                frame, now if frame_time is None else frame_time,
+                self.frames_captured, captured_at=now))
+
+            # Capture rate over a rolling one-second window
+            self._rate_window_count += 1
+            elapsed = now - self._rate_window_start
+            if elapsed >= 1.0:
+                self.capture_fps = self._rate_window_count / elapsed
+                self._rate_window_start = now
+                self._rate_window_count = 0
+
+            self._cond.notify_all()
+
+    def _reader_loop(self):
+        """Background thread: read frames until stopped or the device ends."""
+        try:
+            while self._running:
+                ret, frame = self.cap.read()
+                if not ret:
+                    with self._cond:
+                        self._ended = True
+                        self._cond.notify_all()
+                    break
+                self._store(frame)
+        finally:
+            with self._cond:
+                self._exited = True
+                release = self._release_pending
+            if release:
+                # release() tidak bisa menunggu thread ini: lepas device di sini
+                self.cap.release()
+
+    @property
+    def ended(self) -> bool:
+        """Whether the device stopped delivering frames."""
+        return self._ended
+
+    def read(self, timeout=0.0):
+        """
+        Get the newest captured frame.
+
+        Waits at most ``timeout`` seconds for a frame newer than the last one
+        returned (default: not at all). Without a new frame the last one is
+        returned again; callers compare ``seq`` to skip work on it.
+
+        Args:
+            timeout: Maximum seconds to wait for a new frame
+
+        Returns:
+            CapturedFrame, or None before the first frame arrived and once
+            the device stopped delivering frames (see ``ended``)
+        """
+        if not self.threaded:
+            ret, frame = self.cap.read()
+            if not ret:
+                self._ended = True
+                return None
+            self._store(frame)
+
+        with self._cond:
+            if self.threaded and timeout > 0:
+                self._cond.wait_for(
+                    lambda: self._ended or (
+                        self._buffer and self._buffer[-1].seq > self._last_seq),
+                    timeout=timeout)
+
+            if not self._buffer or self._buffer[-1].seq <= self._last_seq:
+                # Tidak ada frame baru: kembalikan frame terakhir jika masih jalan
+                if self._ended or not self._buffer:
+                    return None
+                return self._buffer[-1]
+
+            latest = self._buffer[-1]
+            if self._last_seq:
+                self.frames_dropped += latest.seq - self._last_seq - 1
+            self._last_seq = latest.seq
+            self.frames_delivered += 1
+            return latest
+
+    def get_stats(self) -> dict:
+        """Return capture counters."""
+        with self._cond:
+            return {
+                'captured': self.frames_captured,
+                'delivered': self.frames_delivered,
+                'dropped': self.frames_dropped,
+                'capture_fps': round(self.capture_fps, 1),
+            }
+
+    def release(self):
+        """
+        Stop the reader thread and release the device.
+
+        The device is only released once the reader thread has left
+        ``cap.read()``; if it is still stuck there after the join timeout,
+        the thread releases the device itself when that read returns.
+        """
+        self._running = False
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            with self._cond:
+                if not self._exited:
+                    self._release_pending = True
+                    print("[Warning] Camera thread masih membaca; device dilepas saat thread selesai")
+                    return
+            self._thread = None
+        if self.cap is not None:
+            self.cap.release()
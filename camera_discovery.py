@@ -0,0 +1,156 @@
+"""
+Camera Discovery Module
+Probes camera indices in parallel and remembers the last camera that worked.
+"""
+
+import json
+import os
+import threading
+import time
+
+
+# Lokasi cache kamera terakhir (per user)
+CACHE_PATH = os.path.join(os.path.expanduser('~'), '.camfu', 'last_camera.json')
+
+MAX_CAMERA_INDEX = 10
+PROBE_TIMEOUT = 2.0  # Seconds per probe
+
+
+def backend_id(name):
+    """
+    Map a backend name from VideoCapture.getBackendName() to its cv2.CAP_* id.
+
+    Returns:
+        int or None if the name is unknown to this OpenCV build
+    """
+    if not name:
+        return None
+    import cv2  # Lazy: startup tanpa probe kamera tidak memuat OpenCV
+    return getattr(cv2, f'CAP_{name.upper()}', None)
+
+
+def probe_camera(index, backend=None):
+    """
+    Open a camera index and try to read one frame.
+
+    Args:
+        index: Camera device index
+        backend: Optional cv2.CAP_* API preference
+
+    Returns:
+        dict: {'index', 'width', 'height', 'backend'} or None if unusable
+    """
+    import cv2
+    try:
+        cap = cv2.VideoCapture(index) if backend is None else cv2.VideoCapture(index, backend)
+        try:
+            if not cap.isOpened():
+                return None
+            ret, frame = cap.read()
+            if not ret or frame is None:
+                return None
+            height, width = frame.shape[:2]
+            try:
+                backend_name = cap.getBackendName()
+            except cv2.error:
+                backend_name = None
+            return {
+                'index': index,
+                'width': width,
+                'height': height,
+                'backend': backend_name,
+            }
+        finally:
+            cap.release()
+    except Exception:
+        return None
+
+
+def probe_cameras(indices, timeout=PROBE_TIMEOUT, backends=None):
+    """
+    Probe several camera indices concurrently.
+
+    Each probe runs on its own daemon thread, so an index stuck in a backend
+    timeout is simply abandoned once ``timeout`` has passed instead of
+    delaying startup.
+
+    Args:
+        indices: Camera indices to probe
+        timeout: Seconds to wait for all probes
+        backends: Optional {index: cv2.CAP_*} API preferences
+
+    Returns:
+        list: Probe result dicts of working cameras, sorted by index
+    """
+    backends = backends or {}
+    results = {}
+    lock = threading.Lock()
+
+    def worker(idx):
+        info = probe_camera(idx, backends.get(idx))
+        if info:
+            with lock:
+                results[idx] = info
+
+    threads = []
+    for idx in indices:
+        t = threading.Thread(target=worker, args=(idx,),
+                             name=f"CameraProbe-{idx}", daemon=True)
+        t.start()
+        threads.append(t)
+
+    deadline = time.monotonic() + timeout
+    for t in threads:
+        t.join(timeout=max(0.0, deadline - time.monotonic()))
+
+    with lock:
+        return [results[idx] for idx in sorted(results)]
+
+
+def discover_cameras(max_index=MAX_CAMERA_INDEX, timeout=PROBE_TIMEOUT):
+    """Probe indices 0..max_index-1 concurrently and return working cameras."""
+    return probe_cameras(range(max_index), timeout=timeout)
+
+
+def load_last_camera(path=CACHE_PATH):
+    """
+    Load the last working camera from the cache.
+
+    Returns:
+        dict or None if there is no valid cache entry
+    """
+    try:
+        with open(path) as f:
+            info = json.load(f)
+        if isinstance(info, dict) and isinstance(info.get('index'), int):
+            return info
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def save_last_camera(info, path=CACHE_PATH):
+    """Persist a camera probe result so the next launch can try it first."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(info, f)
+    except OSError as e:
+        print(f"[Warning] Gagal menyimpan cache kamera: {e}")
+
+
+def probe_last_camera(timeout=PROBE_TIMEOUT, path=CACHE_PATH):
+    """
+    Check whether the cached camera still works.
+
+    Returns:
+        dict: Fresh probe result or None if there is no cache or it failed
+    """
+    last = load_last_camera(path)
+    if last is None:
+        return None
+
+    index = last['index']
+    found = probe_cameras([index], timeout=timeout,
+                          backends={index: backend_id(last.get('backend'))})
+    return found[0] if found else None
@@ -6,6 +6,8 @@ Handles collision detection between pose landmarks and game objects.
 import math
 from typing import Tuple, Optional
 
+import numpy as np
+
 
 class CollisionDetector:
     """
@@ -183,3 +185,369 @@ class CollisionDetector:
             object_pos, (int(closest_x), int(closest_y)))
 
         return distance < (self.collision_radius + object_radius)
+
+    # === BATCH API (semua objek sekaligus) ===
+
+    @staticmethod
+    def object_arrays(objects):
+        """
+        Centers and radii of game objects as arrays.
+
+        Centers use get_position(), so they are truncated to ints exactly like
+        the per-object checks.
+
+        Args:
+            objects: Sequence of game objects
+
+        Returns:
+            tuple: (centers (N, 2) float64, radii (N,) float64)
+        """
+        centers = np.array([obj.get_position() for obj in objects],
+                           dtype=np.float64).reshape(-1, 2)
+        radii = np.array([obj.radius for obj in objects], dtype=np.float64)
+        return centers, radii
+
+    @staticmethod
+    def _points_array(points):
+        """(P, 2) float64 array; missing (None) points become NaN (never hit)."""
+        if isinstance(points, np.ndarray):
+            return points.astype(np.float64, copy=False).reshape(-1, 2)
+        return np.array([(np.nan, np.nan) if p is None else p for p in points],
+                        dtype=np.float64).reshape(-1, 2)
+
+    def _reach(self, radii, limb_radii=None):
+        """(N, 1) or (N, L) hit distance: limb radius + object radius."""
+        if limb_radii is None:
+            return (self.collision_radius + radii)[:, None]
+        return np.asarray(limb_radii, dtype=np.float64)[None, :] + radii[:, None]
+
+    @staticmethod
+    def _distances(centers, points):
+        """(N, P) distance from every center to every (P, 2) point."""
+        # Per koordinat dengan ufunc biasa: einsum punya biaya tetap per
+        # panggilan yang mendominasi untuk jumlah objek di game
+        dx = centers[:, 0, None] - points[:, 0]
+        dy = centers[:, 1, None] - points[:, 1]
+        return np.sqrt(dx * dx + dy * dy)
+
+    def points_hit(self, centers, radii, points, limb_radii=None):
+        """
+        Point-vs-object test for every pair.
+
+        Same rule as check_collision: distance < collision_radius + radius.
+
+        Args:
+            centers: (N, 2) object centers
+            radii: (N,) object radii
+            points: Sequence of P (x, y) points or None
+            limb_radii: Optional (P,) radius per point instead of
+                        collision_radius
+
+        Returns:
+            numpy.ndarray: (N, P) bool hit mask
+        """
+        distance = self._distances(centers, self._points_array(points))
+        return distance < self._reach(radii, limb_radii)
+
+    @staticmethod
+    def circle_hits(centers, radii, circle_center, circle_radius):
+        """
+        Object-vs-circle overlap (edges touching counts): distance <= R + r.
+
+        Returns:
+            numpy.ndarray: (N,) bool hit mask
+        """
+        dx = centers[:, 0] - circle_center[0]
+        dy = centers[:, 1] - circle_center[1]
+        return np.sqrt(dx * dx + dy * dy) <= circle_radius + radii
+
+    @staticmethod
+    def segment_distances(centers, seg_start, seg_end):
+        """
+        Distance from every center to every segment.
+
+        The closest point on each segment is truncated to ints before the
+        distance is taken, matching check_arm_collision. Degenerate segments
+        (start == end) use their start point.
+
+        Args:
+            centers: (N, 2) points
+            seg_start: (S, 2) segment start points (e.g. wrists)
+            seg_end: (S, 2) segment end points (e.g. elbows)
+
+        Returns:
+            numpy.ndarray: (N, S) float64 distances
+        """
+        to_array = CollisionDetector._points_array
+        start = to_array(seg_start)
+        direction = to_array(seg_end) - start
+        start_x, start_y = start[:, 0], start[:, 1]
+        dir_x, dir_y = direction[:, 0], direction[:, 1]
+        x, y = centers[:, 0, None], centers[:, 1, None]
+        length_sq = dir_x * dir_x + dir_y * dir_y
+        dot = (x - start_x) * dir_x + (y - start_y) * dir_y
+        # Segmen degenerate: dot / inf = 0, jadi t = 0 (ujung hilang tetap NaN)
+        t = dot / np.where(length_sq > 0, length_sq, np.inf)
+        np.minimum(np.maximum(t, 0.0, out=t), 1.0, out=t)
+        dx = x - np.trunc(start_x + t * dir_x)
+        dy = y - np.trunc(start_y + t * dir_y)
+        return np.sqrt(dx * dx + dy * dy)
+
+    def segments_hit(self, centers, radii, seg_start, seg_end, limb_radii=None):
+        """
+        Segment-vs-object test for every pair (check_arm_collision rule).
+
+        A segment hits when either endpoint or its closest point is within
+        collision_radius + radius (strictly). With ``limb_radii`` each
+        segment is a capsule of its own radius instead.
+
+        Returns:
+            numpy.ndarray: (N, S) bool hit mask
+        """
+        seg_start = self._points_array(seg_start)
+        seg_end = self._points_array(seg_end)
+        threshold = self._reach(radii, limb_radii)
+        # Kedua ujung dalam satu perhitungan jarak; fmin agar ujung yang
+        # hilang (NaN) tidak menutupi ujung lainnya
+        endpoint = self._distances(centers, np.concatenate([seg_start, seg_end]))
+        n_seg = len(seg_start)
+        hits = np.fmin(endpoint[:, :n_seg], endpoint[:, n_seg:]) < threshold
+        hits |= self.segment_distances(centers, seg_start, seg_end) < threshold
+        return hits
+
+    @staticmethod
+    def first_limb(hits, allowed=None):
+        """
+        Index of the first limb (column) that hits each object.
+
+        Columns are checked in order, like check_hand_collision checks the
+        left hand before the right one.
+
+        Args:
+            hits: (N, L) bool hit mask
+            allowed: Optional (L,) bool mask of limbs that may hit (e.g. fists)
+
+        Returns:
+            numpy.ndarray: (N,) int, -1 where nothing hits
+        """
+        if allowed is not None:
+            hits = hits & np.asarray(allowed, dtype=bool)
+        first = np.argmax(hits, axis=1)
+        return np.where(hits.any(axis=1), first, -1)
+
+    def check_batch(self, centers, radii, hand_points=(), head=None, segments=(),
+                    segment_radii=None):
+        """
+        All collisions of N objects against the body in one pass.
+
+        Args:
+            centers: (N, 2) object centers
+            radii: (N,) object radii
+            hand_points: Sequence of hand (x, y) positions or None
+            head: Optional (center, radius) head circle
+            segments: Sequence of (start, end) limb segments (e.g. forearms)
+            segment_radii: Optional (S,) capsule radius per segment
+                           (default: collision_radius)
+
+        Returns:
+            dict: 'hands' (N, H) bool, 'head' (N,) bool, 'segments' (N, S) bool
+        """
+        n = len(centers)
+        result = {
+            'hands': self.points_hit(centers, radii, hand_points) if len(hand_points)
+            else np.zeros((n, 0), dtype=bool),
+            'head': self.circle_hits(centers, radii, *head) if head is not None
+            else np.zeros(n, dtype=bool),
+            'segments': np.zeros((n, 0), dtype=bool),
+        }
+        if len(segments):
+            seg_start = [start for start, _ in segments]
+            seg_end = [end for _, end in segments]
+            result['segments'] = self.segments_hit(centers, radii, seg_start, seg_end,
+                                                   segment_radii)
+        return result
+
+    # === CONTINUOUS (SWEPT) COLLISION ===
+
+    # Maksimum sub-step saat menyapu segmen lengan
+    MAX_SWEEP_STEPS = 16
+
+    def _sweep_points(self, centers0, centers1, radii, points0, points1):
+        """
+        Earliest contact time of moving points against moving objects.
+
+        Both move linearly over the interval [0, 1]; the contact time solves
+        |(p0 - c0) + t * ((p1 - p0) - (c1 - c0))| = collision_radius + radius.
+
+        Returns:
+            tuple: (toi (N, P) with inf where nothing hits,
+                    relative displacement length (N, P) over the interval)
+        """
+        start = points0[None, :, :] - centers0[:, None, :]
+        motion = (points1 - points0)[None, :, :] - (centers1 - centers0)[:, None, :]
+        reach = (self.collision_radius + radii)[:, None]
+
+        a = np.einsum('npk,npk->np', motion, motion)
+        b = np.einsum('npk,npk->np', start, motion)
+        c = np.einsum('npk,npk->np', start, start) - reach ** 2
+        with np.errstate(invalid='ignore', divide='ignore'):
+            root = (-b - np.sqrt(b * b - a * c)) / a
+        toi = np.where(c < 0, 0.0, root)
+        # NaN (titik hilang / tidak pernah bersentuhan) dan t di luar [0, 1]
+        toi = np.where((toi >= 0.0) & (toi <= 1.0), toi, np.inf)
+        return toi, np.sqrt(a)
+
+    def sweep_batch(self, centers0, centers1, radii, hands0=(), hands1=(),
+                    segments0=(), segments1=(), segment_radii=None):
+        """
+        Continuous collision of N moving objects against moving limbs.
+
+        Hands and objects are swept linearly from the previous sample (t=0)
+        to the current one (t=1), so a fast punch that jumps over an object
+        between two pose samples still hits. Limb segments (forearms) are
+        sub-stepped so no step moves further than their radius. The
+        discrete test at t=1 is always included, so every discrete hit is
+        also a swept hit.
+
+        Only pairs where the limb or the object moved further than its own
+        hit radius since t=0 are swept; the others cannot tunnel through
+        each other and keep the discrete result. Capsule pairs whose swept
+        bounding boxes do not overlap are skipped as well.
+
+        A limb missing in the previous sample is treated as static at its
+        current position.
+
+        Args:
+            centers0, centers1: (N, 2) object centers at t=0 and t=1
+            radii: (N,) object radii
+            hands0, hands1: Sequences of hand (x, y) positions or None
+            segments0, segments1: Sequences of (start, end) limb segments
+            segment_radii: Optional (S,) capsule radius per segment
+                           (default: collision_radius)
+
+        Returns:
+            dict: for 'hands' and 'segments': '<key>' (N, L) bool hits,
+                  '<key>_toi' (N, L) time of impact in [0, 1] (inf = no hit),
+                  '<key>_travel' (N, L) relative displacement in pixels over
+                  the interval (divide by the interval for impact speed)
+        """
+        n = len(centers0)
+        result = {}
+        discrete = self.check_batch(centers1, radii, hands1, segments=segments1,
+                                    segment_radii=segment_radii)
+        object_step = centers1 - centers0
+        object_fast = np.hypot(object_step[:, 0], object_step[:, 1]) > radii
+
+        points1 = self._points_array(hands1)
+        points0 = self._points_array(hands0)
+        if len(points0) != len(points1):
+            points0 = points1
+        points0 = np.where(np.isnan(points0), points1, points0)
+        hand_step = points1 - points0
+        # NaN (tangan hilang) tidak pernah cepat: tetap hasil diskrit
+        hand_fast = np.hypot(hand_step[:, 0], hand_step[:, 1]) > self.collision_radius
+        toi = np.where(discrete['hands'], 1.0, np.inf)
+        if object_fast.any() or hand_fast.any():
+            swept, travel = self._sweep_points(centers0, centers1, radii, points0, points1)
+            sweep = object_fast[:, None] | hand_fast[None, :]
+            toi = np.where(sweep, np.minimum(swept, toi), toi)
+        else:
+            motion = hand_step[None, :, :] - object_step[:, None, :]
+            travel = np.sqrt(np.einsum('npk,npk->np', motion, motion))
+        result['hands'] = np.isfinite(toi)
+        result['hands_toi'] = toi
+        result['hands_travel'] = travel
+
+        if not len(segments1):
+            empty = np.zeros((n, 0))
+            result.update(segments=empty.astype(bool), segments_toi=empty,
+                          segments_travel=empty)
+            return result
+
+        start1 = self._points_array([s for s, _ in segments1])
+        end1 = self._points_array([e for _, e in segments1])
+        if len(segments0) == len(segments1):
+            start0 = self._points_array([s for s, _ in segments0])
+            end0 = self._points_array([e for _, e in segments0])
+            missing = np.isnan(start0).any(axis=1) | np.isnan(end0).any(axis=1)
+            start0 = np.where(missing[:, None], start1, start0)
+            end0 = np.where(missing[:, None], end1, end0)
+        else:
+            start0, end0 = start1, end1
+
+        limb_radii = np.full(len(start1), float(self.collision_radius)) \
+            if segment_radii is None else np.asarray(segment_radii, dtype=np.float64)
+        start_step, end_step = start1 - start0, end1 - end0
+        # NaN (ujung hilang) tidak pernah cepat: tetap hasil diskrit
+        limb_motion = np.maximum(np.hypot(start_step[:, 0], start_step[:, 1]),
+                                 np.hypot(end_step[:, 0], end_step[:, 1]))
+        toi = np.where(discrete['segments'], 1.0, np.inf)
+        sweep = object_fast[:, None] | (limb_motion > limb_radii)[None, :]
+        if sweep.any():
+            self._sweep_capsules(toi, sweep, centers0, centers1, radii, start0, start1,
+                                 end0, end1, limb_radii)
+        result['segments'] = np.isfinite(toi)
+        result['segments_toi'] = toi
+        # Kecepatan diukur di ujung akhir segmen (pergelangan untuk lengan bawah)
+        motion = (end1 - end0)[None, :, :] - object_step[:, None, :]
+        result['segments_travel'] = np.sqrt(np.einsum('nsk,nsk->ns', motion, motion))
+        return result
+
+    def _sweep_capsules(self, toi, sweep, centers0, centers1, radii, start0, start1,
+                        end0, end1, limb_radii):
+        """
+        Sub-step the object x capsule pairs marked in ``sweep`` and lower
+        their time of impact in ``toi`` (N, S) in place.
+
+        Pairs whose path boxes (object + radius, capsule over t=0..1 +
+        radius + 1 px for the truncation) do not overlap cannot hit and
+        are dropped first. The rest is sub-stepped as one block of objects
+        x capsules so no step moves further than the smallest capsule
+        radius of the block.
+        """
+        margin = (limb_radii + 1)[:, None]
+        limb_low = np.minimum(np.minimum(start0, start1), np.minimum(end0, end1)) - margin
+        limb_high = np.maximum(np.maximum(start0, start1), np.maximum(end0, end1)) + margin
+        object_low = (np.minimum(centers0, centers1) - radii[:, None])[:, None, :]
+        object_high = (np.maximum(centers0, centers1) + radii[:, None])[:, None, :]
+        # Ujung NaN gagal semua perbandingan, jadi blok di bawah selalu berhingga
+        sweep &= ((object_low <= limb_high) & (object_high >= limb_low)).all(axis=2)
+        rows, cols = np.flatnonzero(sweep.any(axis=1)), np.flatnonzero(sweep.any(axis=0))
+        if not len(rows):
+            return
+        block = np.ix_(rows, cols) if len(rows) * len(cols) < sweep.size else ...
+        c0, c1, r = centers0[rows], centers1[rows], radii[rows]
+        s0, s1, e0, e1 = start0[cols], start1[cols], end0[cols], end1[cols]
+        block_radii = limb_radii[cols]
+        largest = max(np.abs(s1 - s0).max(), np.abs(e1 - e0).max()) + np.abs(c1 - c0).max()
+        steps = int(min(self.MAX_SWEEP_STEPS,
+                        max(1, math.ceil(largest / max(1, block_radii.min())))))
+        swept = np.full((len(rows), len(cols)), np.inf)
+        for k in range(1, steps):
+            t = k / steps
+            hits = self.segments_hit(c0 + (c1 - c0) * t, r, s0 + (s1 - s0) * t,
+                                     e0 + (e1 - e0) * t, block_radii)
+            swept[hits & (swept == np.inf)] = t
+        toi[block] = np.where(sweep[block], np.minimum(swept, toi[block]), toi[block])
+
+    @staticmethod
+    def earliest_limb(toi, allowed=None):
+        """
+        Index of the limb with the earliest time of impact per object.
+
+        Ties go to the lower column, so with only discrete hits (all at
+        t=1) this picks the same limb as first_limb.
+
+        Args:
+            toi: (N, L) time of impact, inf where nothing hits
+            allowed: Optional (L,) bool mask of limbs that may hit
+
+        Returns:
+            numpy.ndarray: (N,) int, -1 where nothing hits
+        """
+        if allowed is not None:
+            toi = np.where(np.asarray(allowed, dtype=bool), toi, np.inf)
+        if toi.shape[1] == 0:
+            return np.full(len(toi), -1)
+        first = np.argmin(toi, axis=1)
+        return np.where(np.isfinite(toi).any(axis=1), first, -1)
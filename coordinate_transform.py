@@ -0,0 +1,177 @@
+"""
+Coordinate Transform Module
+Affine mapping between inference, camera and screen coordinates, and the
+letterboxing resizer that produces the model input.
+"""
+
+import numpy as np
+
+from landmarks import LandmarkList, HandsResult, landmarks_to_array
+
+
+class AffineTransform:
+    """
+    2D affine transform ``p' = A @ p + b`` applied to arrays of points.
+
+    Transforms compose with ``then()``, so a chain such as
+    inference-normalized -> camera-normalized -> screen pixels collapses into
+    a single matrix that is applied once per landmark array.
+    """
+
+    __slots__ = ('matrix',)
+
+    def __init__(self, matrix):
+        """
+        Args:
+            matrix: (2, 3) array [[a, b, tx], [c, d, ty]]
+        """
+        self.matrix = np.asarray(matrix, dtype=np.float64)
+
+    @classmethod
+    def identity(cls):
+        return cls([[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+
+    @classmethod
+    def scale_translate(cls, sx, sy, tx=0.0, ty=0.0):
+        return cls([[sx, 0.0, tx], [0.0, sy, ty]])
+
+    def then(self, other):
+        """Transform that applies ``self`` first, then ``other``."""
+        a = np.vstack([self.matrix, [0.0, 0.0, 1.0]])
+        b = np.vstack([other.matrix, [0.0, 0.0, 1.0]])
+        return AffineTransform((b @ a)[:2])
+
+    @property
+    def x_scale(self) -> float:
+        """Scale applied along x (used for MediaPipe's width-relative z)."""
+        return float(self.matrix[0, 0])
+
+    def apply(self, points):
+        """
+        Transform points.
+
+        Args:
+            points: (..., 2) array of x, y
+
+        Returns:
+            numpy.ndarray: (..., 2) float64 array
+        """
+        points = np.asarray(points, dtype=np.float64)
+        return points @ self.matrix[:, :2].T + self.matrix[:, 2]
+
+    def apply_point(self, x, y):
+        """Transform a single point into an (int, int) pixel tuple."""
+        m = self.matrix
+        return (int(m[0, 0] * x + m[0, 1] * y + m[0, 2]),
+                int(m[1, 0] * x + m[1, 1] * y + m[1, 2]))
+
+
+def normalized_to_screen(screen_width, screen_height):
+    """Transform from normalized (0..1) camera coordinates to screen pixels."""
+    return AffineTransform.scale_translate(screen_width, screen_height)
+
+
+class LetterboxResizer:
+    """
+    Resizes camera frames to a fixed inference resolution.
+
+    Frames are written into preallocated buffers (a small ring, so a frame
+    still being read by a worker is never overwritten). With ``letterbox``
+    the aspect ratio is kept and the rest of the buffer stays black. The
+    transform from inference-normalized back to camera-normalized
+    coordinates is computed once per input shape and cached.
+    """
+
+    def __init__(self, size, letterbox=True, buffers=2, interpolation=None):
+        """
+        Args:
+            size: (width, height) of the model input
+            letterbox: Keep the aspect ratio by padding (otherwise stretch)
+            buffers: Number of output buffers used in rotation
+            interpolation: cv2 interpolation flag (default INTER_AREA)
+        """
+        import cv2  # Lazy: hanya dibutuhkan jalur inference
+        self.size = (int(size[0]), int(size[1]))
+        self.letterbox = letterbox
+        self.interpolation = cv2.INTER_AREA if interpolation is None else interpolation
+        w, h = self.size
+        self._buffers = [np.zeros((h, w, 3), dtype=np.uint8)
+                         for _ in range(max(1, buffers))]
+        self._next = 0
+        self._layout_key = None
+        self._layout = None
+
+    def _compute_layout(self, src_w, src_h):
+        """Content rectangle inside the buffer and the inverse transform."""
+        dst_w, dst_h = self.size
+        if self.letterbox:
+            scale = min(dst_w / src_w, dst_h / src_h)
+            content_w = max(1, int(round(src_w * scale)))
+            content_h = max(1, int(round(src_h * scale)))
+        else:
+            content_w, content_h = dst_w, dst_h
+        pad_x = (dst_w - content_w) // 2
+        pad_y = (dst_h - content_h) // 2
+
+        # Normalized di buffer -> normalized di frame kamera
+        transform = AffineTransform.scale_translate(
+            dst_w / content_w, dst_h / content_h,
+            -pad_x / content_w, -pad_y / content_h)
+        return (pad_x, pad_y, content_w, content_h), transform
+
+    def resize(self, image):
+        """
+        Resize a frame into the next buffer.
+
+        Args:
+            image: (H, W, 3) uint8 image
+
+        Returns:
+            tuple: (model_input, transform) where ``transform`` maps
+                   normalized coordinates of ``model_input`` back to
+                   normalized coordinates of ``image``
+        """
+        src_h, src_w = image.shape[:2]
+        if self._layout_key != (src_w, src_h):
+            self._layout_key = (src_w, src_h)
+            self._layout = self._compute_layout(src_w, src_h)
+            for buffer in self._buffers:
+                buffer[...] = 0
+        (pad_x, pad_y, content_w, content_h), transform = self._layout
+
+        buffer = self._buffers[self._next]
+        self._next = (self._next + 1) % len(self._buffers)
+        import cv2
+        cv2.resize(image, (content_w, content_h),
+                   dst=buffer[pad_y:pad_y + content_h, pad_x:pad_x + content_w],
+                   interpolation=self.interpolation)
+        return buffer, transform
+
+
+def map_landmarks(landmarks, transform):
+    """
+    Map a landmark list through a transform.
+
+    Args:
+        landmarks: Landmarks (protobuf or LandmarkList) or None
+        transform: AffineTransform in normalized coordinates, or None
+
+    Returns:
+        LandmarkList (or ``landmarks`` unchanged when there is nothing to map)
+    """
+    if landmarks is None or transform is None:
+        return landmarks
+    array = landmarks_to_array(landmarks).copy()
+    array[:, :2] = transform.apply(array[:, :2])
+    # z MediaPipe relatif terhadap lebar gambar
+    array[:, 2] *= transform.x_scale
+    return LandmarkList(array)
+
+
+def map_hands_result(hands_results, transform):
+    """Map every hand of a Hands result through a transform."""
+    if transform is None or not hands_results.multi_hand_landmarks:
+        return hands_results
+    return HandsResult(
+        [map_landmarks(hand, transform) for hand in hands_results.multi_hand_landmarks],
+        list(hands_results.multi_handedness))
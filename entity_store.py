@@ -0,0 +1,403 @@
+"""
+Entity Store Module
+Struct-of-arrays storage for game objects: NumPy columns for position,
+velocity, radius, angle, lifetime, type and active flag, with a free-list
+for slot reuse and vectorized motion passes per object type.
+"""
+
+import math
+
+import numpy as np
+
+# Jenis entity (kolom 'kind')
+TARGET = 0
+OBSTACLE = 1
+POWERUP = 2
+OTHER = 3
+KINDS = (TARGET, OBSTACLE, POWERUP, OTHER)
+
+
+class EntityStore:
+    """
+    Column store for every Target, Obstacle and PowerUp of one game.
+
+    Each object occupies one slot (row) from its spawn until the engine
+    prunes it and ``release``s the slot explicitly; the slot then goes on a
+    free-list and is reused by the next spawn. ``seq`` numbers slots in
+    allocation order, so sorting by it gives the order of the engine's lists.
+
+    Motion is advanced per type in one vectorized pass: targets move and
+    bounce off their bounds, obstacles home in on their goal point and
+    power-ups float. The game object classes are thin views that read and
+    write these columns.
+    """
+
+    INITIAL_CAPACITY = 64
+
+    _FLOAT_COLUMNS = ('x', 'y', 'vx', 'vy', 'speed', 'goal_x', 'goal_y', 'radius',
+                      'angle', 'spin', 'age', 'lifetime', 'arrive_distance',
+                      'bound_w', 'bound_h', 'sample_x', 'sample_y')
+
+    def __init__(self, capacity=INITIAL_CAPACITY):
+        """
+        Args:
+            capacity: Initial number of slots (grows by doubling)
+        """
+        self.capacity = 0
+        self.size = 0           # Slot [0, size) pernah dipakai
+        self._free = []
+        self._views = []
+        self._next_seq = 0
+
+        # Perpindahan terbesar satu objek dalam satu update (px)
+        self.max_step = 0.0
+        # Slot hidup per jenis dan yang sudah tidak aktif (menunggu prune)
+        self.counts = [0] * len(KINDS)
+        self.inactive = [0] * len(KINDS)
+
+        # Counters
+        self.allocated = 0
+        self.reused = 0
+
+        self._grow(max(1, capacity))
+
+    def _grow(self, capacity):
+        old = self.capacity
+
+        def resized(array, dtype, fill):
+            new = np.full(capacity, fill, dtype=dtype)
+            if old:
+                new[:old] = array
+            return new
+
+        for name in self._FLOAT_COLUMNS:
+            setattr(self, name, resized(getattr(self, name, None), np.float64, 0.0))
+        self.kind = resized(getattr(self, 'kind', None), np.int8, OTHER)
+        self.active = resized(getattr(self, 'active', None), bool, False)
+        self.alive = resized(getattr(self, 'alive', None), bool, False)
+        self.seq = resized(getattr(self, 'seq', None), np.int64, 0)
+        self.generation = resized(getattr(self, 'generation', None), np.int64, 0)
+        self._views.extend([None] * (capacity - old))
+        self.capacity = capacity
+
+    def __len__(self):
+        return sum(self.counts)
+
+    # === SLOT ===
+
+    def allocate(self, kind, view, x, y, radius, speed=0.0, lifetime=math.inf,
+                 bounds=(0, 0)):
+        """
+        Claim a slot (reusing a released one if possible).
+
+        Args:
+            kind: TARGET, OBSTACLE, POWERUP or OTHER
+            view: Object viewing this slot
+            x, y: Center position
+            radius: Radius in pixels
+            speed: Speed in pixels per second
+            lifetime: Seconds until the object expires (inf = never)
+            bounds: (width, height) of the play field the object lives in
+
+        Returns:
+            int: Slot index
+        """
+        if self._free:
+            slot = self._free.pop()
+            self.reused += 1
+        else:
+            if self.size == self.capacity:
+                self._grow(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        self.allocated += 1
+
+        for name in self._FLOAT_COLUMNS:
+            getattr(self, name)[slot] = 0.0
+        self.x[slot] = x
+        self.y[slot] = y
+        self.radius[slot] = radius
+        self.speed[slot] = speed
+        self.lifetime[slot] = lifetime
+        self.bound_w[slot], self.bound_h[slot] = bounds
+        # Belum ada di sampel pose terakhir
+        self.sample_x[slot] = self.sample_y[slot] = np.nan
+        self.kind[slot] = kind
+        self.active[slot] = True
+        self.alive[slot] = True
+        self.seq[slot] = self._next_seq
+        self._next_seq += 1
+        self._views[slot] = view
+        self.counts[kind] += 1
+        return slot
+
+    def release(self, slot):
+        """
+        Free one slot for reuse. Its view must not be used afterwards.
+
+        Args:
+            slot: Slot index
+        """
+        if not self.alive[slot]:
+            return
+        kind = self.kind[slot]
+        if not self.active[slot]:
+            self.inactive[kind] -= 1
+        self.counts[kind] -= 1
+        self.active[slot] = False
+        self._free_slots(np.array([slot]))
+
+    def release_inactive(self, kind):
+        """
+        Release every alive, inactive slot of ``kind`` (the engine's prune).
+
+        Returns:
+            int: Number of slots released
+        """
+        n = self.size
+        slots = np.flatnonzero(self.alive[:n] & ~self.active[:n] & (self.kind[:n] == kind))
+        self.counts[kind] -= len(slots)
+        self.inactive[kind] -= len(slots)
+        self._free_slots(slots)
+        return len(slots)
+
+    def _free_slots(self, slots):
+        self.alive[slots] = False
+        self.generation[slots] += 1
+        slots = slots.tolist()
+        for slot in slots:
+            self._views[slot] = None
+        self._free.extend(slots)
+
+    def set_active(self, slot, active):
+        """Activate or deactivate one slot (keeps the inactive counts)."""
+        if not self.alive[slot] or bool(self.active[slot]) == bool(active):
+            return
+        self.active[slot] = active
+        self.inactive[self.kind[slot]] += -1 if active else 1
+
+    def adopt(self, view):
+        """
+        Make ``view`` an object of this store.
+
+        A view of another store gets a new slot here with a copy of its row
+        (its old slot is released).
+
+        Returns:
+            int: The view's slot in this store
+        """
+        old, old_slot = view.store, view.slot
+        if old is self:
+            return old_slot
+        slot = self.allocate(int(old.kind[old_slot]), view, 0, 0, 0)
+        for name in self._FLOAT_COLUMNS:
+            getattr(self, name)[slot] = getattr(old, name)[old_slot]
+        self.sample_x[slot] = self.sample_y[slot] = np.nan
+        self.set_active(slot, old.active[old_slot])
+        old.release(old_slot)
+        view.store, view.slot = self, slot
+        return slot
+
+    def view(self, slot):
+        """Object viewing ``slot`` (None if it was released)."""
+        return self._views[slot]
+
+    def views(self, slots):
+        """Objects viewing ``slots``, in the given order."""
+        views = self._views
+        return [views[slot] for slot in slots.tolist()]
+
+    def resequence(self, slots):
+        """Give ``slots`` new, increasing sequence numbers in this order."""
+        slots = np.asarray(slots, dtype=np.int64)
+        self.seq[slots] = np.arange(self._next_seq, self._next_seq + len(slots))
+        self._next_seq += len(slots)
+
+    def clear(self):
+        """Release every slot."""
+        n = self.size
+        self.active[:n] = False
+        self._free_slots(np.flatnonzero(self.alive[:n]))
+        self.counts = [0] * len(KINDS)
+        self.inactive = [0] * len(KINDS)
+        self.max_step = 0.0
+
+    # === QUERY ===
+
+    def live_slots(self, kind=None):
+        """
+        Alive and active slots, in allocation (list) order.
+
+        Args:
+            kind: Only slots of this kind (default: all)
+        """
+        n = self.size
+        mask = self.alive[:n] & self.active[:n]
+        if kind is not None:
+            mask &= self.kind[:n] == kind
+        return self.in_order(np.flatnonzero(mask))
+
+    def in_order(self, slots):
+        """``slots`` sorted by allocation order."""
+        return slots[np.argsort(self.seq[slots], kind='stable')]
+
+    def positions(self, slots):
+        """
+        Integer centers and radii of ``slots`` (int() truncation, like
+        GameObject.get_position).
+
+        Returns:
+            tuple: (centers (N, 2) float64, radii (N,) float64)
+        """
+        centers = np.column_stack([np.trunc(self.x[slots]), np.trunc(self.y[slots])])
+        return centers, self.radius[slots].copy()
+
+    def mark_sample(self):
+        """Remember the current positions as the last pose sample."""
+        n = self.size
+        self.sample_x[:n] = self.x[:n]
+        self.sample_y[:n] = self.y[:n]
+
+    def sample_positions(self, slots):
+        """
+        Integer centers of ``slots`` at the last mark_sample(); slots
+        allocated since then report their current position.
+
+        Returns:
+            numpy.ndarray: (N, 2) float64
+        """
+        sample_x = self.sample_x[slots]
+        sample_y = self.sample_y[slots]
+        fresh = np.isnan(sample_x)
+        return np.column_stack([
+            np.trunc(np.where(fresh, self.x[slots], sample_x)),
+            np.trunc(np.where(fresh, self.y[slots], sample_y))])
+
+    # === MOTION ===
+
+    def update(self, dt, slots=None):
+        """
+        Advance every live object by ``dt`` in one pass per type.
+
+        Args:
+            dt: Delta time in seconds
+            slots: Only update these slots (default: all)
+
+        Returns:
+            int: Obstacles that expired or reached their goal this update
+        """
+        n = self.size
+        if slots is None:
+            live = np.flatnonzero(self.alive[:n] & self.active[:n])
+        else:
+            slots = np.asarray(slots, dtype=np.int64)
+            live = slots[self.alive[slots] & self.active[slots]]
+        kinds = self.kind[live]
+
+        dodged = 0
+        targets = live[kinds == TARGET]
+        if len(targets):
+            self._update_targets(targets, dt)
+        obstacles = live[kinds == OBSTACLE]
+        if len(obstacles):
+            dodged = self._update_obstacles(obstacles, dt)
+        powerups = live[kinds == POWERUP]
+        if len(powerups):
+            self._update_powerups(powerups, dt)
+        return dodged
+
+    def _record_step(self, old_x, old_y, new_x, new_y):
+        if len(new_x):
+            step = float(np.hypot(new_x - old_x, new_y - old_y).max())
+            if step > self.max_step:
+                self.max_step = step
+
+    def _rotate(self, idx, dt):
+        angle = self.angle[idx] + self.spin[idx] * dt
+        self.angle[idx] = np.where(angle >= 360, angle - 360, angle)
+
+    def _deactivate(self, idx, kind):
+        self.active[idx] = False
+        self.inactive[kind] += len(idx)
+
+    def _update_targets(self, idx, dt):
+        """Move in a straight line and bounce off the play field edges."""
+        x = self.x[idx]
+        y = self.y[idx]
+        radius = self.radius[idx]
+        vx = self.vx[idx]
+        vy = self.vy[idx]
+        new_x = x + vx * dt
+        new_y = y + vy * dt
+
+        width = self.bound_w[idx]
+        bounce = (new_x - radius <= 0) | (new_x + radius >= width)
+        self.vx[idx] = np.where(bounce, -vx, vx)
+        new_x = np.where(bounce, np.maximum(radius, np.minimum(new_x, width - radius)), new_x)
+
+        height = self.bound_h[idx]
+        bounce = (new_y - radius <= 0) | (new_y + radius >= height)
+        self.vy[idx] = np.where(bounce, -vy, vy)
+        new_y = np.where(bounce, np.maximum(radius, np.minimum(new_y, height - radius)), new_y)
+
+        self.x[idx] = new_x
+        self.y[idx] = new_y
+        self._record_step(x, y, new_x, new_y)
+        self._rotate(idx, dt)
+
+    def _update_obstacles(self, idx, dt):
+        """Age, then home in on the goal point; expire or arrive = dodged."""
+        age = self.age[idx] + dt
+        self.age[idx] = age
+        expired = age >= self.lifetime[idx]
+
+        moving = idx[~expired]
+        x = self.x[moving]
+        y = self.y[moving]
+        dx = self.goal_x[moving] - x
+        dy = self.goal_y[moving] - y
+        distance = np.sqrt(dx * dx + dy * dy)
+        arrived = distance < self.arrive_distance[moving]
+
+        done = np.concatenate([idx[expired], moving[arrived]])
+        self._deactivate(done, OBSTACLE)
+
+        keep = ~arrived
+        moving, x, y = moving[keep], x[keep], y[keep]
+        dx, dy, distance = dx[keep], dy[keep], distance[keep]
+        speed = self.speed[moving]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            vx = np.where(distance > 0, dx / distance * speed, 0.0)
+            vy = np.where(distance > 0, dy / distance * speed, 0.0)
+        self.vx[moving] = vx
+        self.vy[moving] = vy
+        new_x = x + vx * dt
+        new_y = y + vy * dt
+        self.x[moving] = new_x
+        self.y[moving] = new_y
+        self._record_step(x, y, new_x, new_y)
+        self._rotate(moving, dt)
+        return len(done)
+
+    def _update_powerups(self, idx, dt):
+        """Age and float up and down (sine wave)."""
+        age = self.age[idx] + dt
+        self.age[idx] = age
+        expired = age >= self.lifetime[idx]
+        self._deactivate(idx[expired], POWERUP)
+
+        floating = idx[~expired]
+        y = self.y[floating]
+        new_y = y + np.sin(age[~expired] * 3) * 2
+        self.y[floating] = new_y
+        self._record_step(self.x[floating], y, self.x[floating], new_y)
+
+    def get_stats(self) -> dict:
+        """Return slot counters."""
+        return {
+            'objects': len(self),
+            'capacity': self.capacity,
+            'free': len(self._free),
+            'allocated': self.allocated,
+            'reused': self.reused,
+        }
@@ -0,0 +1,88 @@
+"""
+Frame Context Module
+Per-frame container that shares image conversions between pose, hands and rendering.
+"""
+
+# OpenCV di-import di dalam method: modul ini juga dipakai renderer dan
+# simulasi headless yang tidak boleh memuat cv2 saat startup
+from profiler import profiler
+
+
+class FrameContext:
+    """
+    One camera frame plus its derived images.
+
+    Every conversion (RGB, resized copies) is computed lazily on first use and
+    cached for the rest of the frame, so the pose model, the hands model and
+    the renderer never convert the same frame twice.
+    """
+
+    def __init__(self, bgr, seq=0, timestamp=None):
+        """
+        Args:
+            bgr: BGR image (already mirrored for display)
+            seq: Capture sequence number of the frame
+            timestamp: Frame time in seconds (capture time for cameras,
+                       source time for replays; see CapturedFrame)
+        """
+        self.bgr = bgr
+        self.seq = seq
+        self.timestamp = timestamp
+        self._rgb = None
+        self._resized = {}
+        # (model_input, transform) prepared by PoseDetector for this frame
+        self.model_input = None
+
+    @classmethod
+    def from_capture(cls, captured, mirror=True):
+        """
+        Build a context from a CapturedFrame.
+
+        Args:
+            captured: CapturedFrame from CameraCapture
+            mirror: Flip horizontally (selfie view), as the game expects
+        """
+        import cv2
+        with profiler.stage('flip'):
+            frame = cv2.flip(captured.frame, 1) if mirror else captured.frame
+        return cls(frame, captured.seq, captured.timestamp)
+
+    @property
+    def width(self) -> int:
+        return self.bgr.shape[1]
+
+    @property
+    def height(self) -> int:
+        return self.bgr.shape[0]
+
+    @property
+    def rgb(self):
+        """RGB version of the frame (converted once per frame)."""
+        if self._rgb is None:
+            import cv2
+            with profiler.stage('color'):
+                self._rgb = cv2.cvtColor(self.bgr, cv2.COLOR_BGR2RGB)
+        return self._rgb
+
+    def resized(self, size, color='rgb', interpolation=None):
+        """
+        Downscaled copy of the frame (computed once per size and color).
+
+        Args:
+            size: (width, height) of the result
+            color: 'rgb' or 'bgr'
+            interpolation: cv2 interpolation flag (default INTER_AREA)
+
+        Returns:
+            numpy.ndarray
+        """
+        import cv2
+        if interpolation is None:
+            interpolation = cv2.INTER_AREA
+        key = (tuple(size), color, interpolation)
+        image = self._resized.get(key)
+        if image is None:
+            source = self.rgb if color == 'rgb' else self.bgr
+            image = cv2.resize(source, tuple(size), interpolation=interpolation)
+            self._resized[key] = image
+        return image
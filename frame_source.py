@@ -0,0 +1,345 @@
+"""
+Frame Source Module
+Pluggable frame sources that can stand in for a physical camera.
+
+Every source exposes the same small interface as cv2.VideoCapture
+(read/isOpened/release), so it can be handed straight to CameraCapture.
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+
+
+class FrameSource:
+    """
+    Base class for all frame sources.
+
+    Subclasses implement _read_frame(). Pacing is handled here: with
+    ``realtime=True`` frames are delivered at the source's nominal FPS,
+    otherwise as fast as they can be produced.
+
+    Replayed sources stamp every frame with its source time in
+    ``frame_time`` (frames read / fps), so everything timed by frame
+    (prediction, gates) behaves the same however fast the host replays.
+    Live sources leave it None and are stamped with the capture time.
+    """
+
+    # Live sources (cameras) produce frames on their own clock and may drop
+    # frames; file-backed and synthetic sources are replayed frame by frame.
+    is_live = False
+
+    def __init__(self, fps=30.0, realtime=True, loop=False):
+        """
+        Args:
+            fps: Nominal frames per second of the source
+            realtime: Pace delivery to ``fps`` (True) or run unthrottled (False)
+            loop: Restart from the first frame when the source runs out
+        """
+        self.fps = float(fps) if fps and fps > 0 else 30.0
+        self.realtime = realtime
+        self.loop = loop
+        self.frame_index = 0
+        self.frames_read = 0
+        self.frame_time = None
+        self._opened = True
+        self._next_deadline = None
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def _read_frame(self):
+        """Return the next BGR frame or None at the end of the source."""
+        raise NotImplementedError
+
+    def _rewind(self):
+        """Go back to the first frame (used when looping)."""
+        self.frame_index = 0
+
+    def _pace(self):
+        """Sleep until the next frame is due when running in real time."""
+        if not self.realtime:
+            return
+        now = time.perf_counter()
+        if self._next_deadline is None:
+            self._next_deadline = now
+        delay = self._next_deadline - now
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Tertinggal terlalu jauh: jangan kejar frame yang sudah lewat
+            self._next_deadline = now
+        self._next_deadline += 1.0 / self.fps
+
+    def read(self):
+        """
+        Read the next frame.
+
+        Returns:
+            tuple: (ret, frame) like cv2.VideoCapture.read()
+        """
+        if not self._opened:
+            return False, None
+
+        frame = self._read_frame()
+        if frame is None and self.loop and self.frame_index > 0:
+            self._rewind()
+            frame = self._read_frame()
+        if frame is None:
+            return False, None
+
+        self._pace()
+        if not self.is_live:
+            # Terus naik juga saat loop, seperti jam kamera
+            self.frame_time = self.frames_read / self.fps
+        self.frames_read += 1
+        self.frame_index += 1
+        return True, frame
+
+    def release(self):
+        self._opened = False
+
+
+class CameraSource(FrameSource):
+    """Physical camera through cv2.VideoCapture."""
+
+    is_live = True
+
+    def __init__(self, index=0, backend=None, width=None, height=None):
+        """
+        Args:
+            index: Camera device index
+            backend: Optional cv2.CAP_* API preference
+            width: Requested capture width (None = driver default)
+            height: Requested capture height (None = driver default)
+        """
+        import cv2  # Lazy: modul ini juga dipakai tanpa kamera
+        if backend is None:
+            self.cap = cv2.VideoCapture(index)
+        else:
+            self.cap = cv2.VideoCapture(index, backend)
+        # Minta driver menyimpan antrian sekecil mungkin
+        self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        if width and height:
+            self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
+            self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
+
+        # Kamera sudah punya clock sendiri, tidak perlu dipacing lagi
+        super().__init__(fps=self.cap.get(cv2.CAP_PROP_FPS), realtime=False)
+        self.index = index
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def _read_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class VideoFileSource(FrameSource):
+    """Frames decoded from a video file."""
+
+    def __init__(self, path, realtime=True, loop=False):
+        import cv2
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        super().__init__(fps=self.cap.get(cv2.CAP_PROP_FPS),
+                         realtime=realtime, loop=loop)
+        if not self.cap.isOpened():
+            print(f"[Warning] Video tidak dapat dibuka: {path}")
+            self._opened = False
+
+    def _read_frame(self):
+        ret, frame = self.cap.read()
+        return frame if ret else None
+
+    def _rewind(self):
+        import cv2
+        super()._rewind()
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+
+    def release(self):
+        super().release()
+        self.cap.release()
+
+
+class ImageDirectorySource(FrameSource):
+    """Frames loaded from image files in a directory, in sorted name order."""
+
+    EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+
+    def __init__(self, directory, fps=30.0, realtime=True, loop=False):
+        super().__init__(fps=fps, realtime=realtime, loop=loop)
+        self.directory = directory
+        self.files = []
+        if os.path.isdir(directory):
+            self.files = sorted(
+                os.path.join(directory, name) for name in os.listdir(directory)
+                if name.lower().endswith(self.EXTENSIONS))
+        if not self.files:
+            print(f"[Warning] Tidak ada gambar di folder: {directory}")
+            self._opened = False
+
+    def _read_frame(self):
+        import cv2
+        while self.frame_index < len(self.files):
+            frame = cv2.imread(self.files[self.frame_index])
+            if frame is not None:
+                return frame
+            print(f"[Warning] Gagal membaca gambar: {self.files[self.frame_index]}")
+            self.frame_index += 1
+        return None
+
+
+class RawDumpSource(FrameSource):
+    """
+    Frames from a raw uint8 BGR dump, read through a memory map.
+
+    The dump is a plain concatenation of HxWx3 frames. Its geometry lives in a
+    JSON sidecar (``<path>.json``) written by save_raw_dump().
+    """
+
+    def __init__(self, path, realtime=True, loop=False):
+        meta_path = path + '.json'
+        with open(meta_path) as f:
+            meta = json.load(f)
+        super().__init__(fps=meta.get('fps', 30.0), realtime=realtime, loop=loop)
+
+        self.path = path
+        self.width = int(meta['width'])
+        self.height = int(meta['height'])
+        frame_bytes = self.width * self.height * 3
+        count = os.path.getsize(path) // frame_bytes
+        self.frames = np.memmap(path, dtype=np.uint8, mode='r',
+                                shape=(count, self.height, self.width, 3))
+
+    def _read_frame(self):
+        if self.frame_index >= len(self.frames):
+            return None
+        # Salin keluar dari memmap agar frame bisa ditulis (cv2.flip dst, dll)
+        return np.array(self.frames[self.frame_index])
+
+    def release(self):
+        super().release()
+        self.frames = None
+
+
+def save_raw_dump(path, frames, fps=30.0):
+    """
+    Write frames to a raw dump readable by RawDumpSource.
+
+    Args:
+        path: Output file path
+        frames: Iterable of equally sized HxWx3 uint8 BGR frames
+        fps: Nominal FPS stored in the sidecar
+
+    Returns:
+        int: Number of frames written
+    """
+    count = 0
+    height = width = None
+    with open(path, 'wb') as f:
+        for frame in frames:
+            if height is None:
+                height, width = frame.shape[:2]
+            f.write(np.ascontiguousarray(frame, dtype=np.uint8).tobytes())
+            count += 1
+
+    with open(path + '.json', 'w') as f:
+        json.dump({'width': width, 'height': height, 'fps': fps,
+                   'frames': count}, f)
+    return count
+
+
+class SyntheticSource(FrameSource):
+    """
+    Deterministic generated frames.
+
+    A script is a callable ``script(frame_index, canvas)`` that draws into a
+    preallocated BGR canvas. The default script moves a simple figure across
+    a gradient background so consecutive frames differ.
+    """
+
+    def __init__(self, width=1280, height=720, fps=30.0, num_frames=900,
+                 script=None, realtime=True, loop=False):
+        super().__init__(fps=fps, realtime=realtime, loop=loop)
+        self.width = width
+        self.height = height
+        self.num_frames = num_frames
+        self.script = script or self.default_script
+
+        # Background dibuat sekali, tiap frame hanya disalin lalu digambar
+        ramp = np.linspace(40, 120, width, dtype=np.uint8)
+        self._background = np.empty((height, width, 3), dtype=np.uint8)
+        self._background[:] = ramp[None, :, None]
+
+    def _read_frame(self):
+        if self.num_frames and self.frame_index >= self.num_frames:
+            return None
+        canvas = self._background.copy()
+        self.script(self.frame_index, canvas)
+        return canvas
+
+    def default_script(self, frame_index, canvas):
+        """Draw a stick figure that sways left and right and punches."""
+        import cv2
+        h, w = canvas.shape[:2]
+        t = frame_index / self.fps
+        cx = int(w * (0.5 + 0.2 * np.sin(t * 0.8)))
+        cy = int(h * 0.45)
+        unit = h // 10
+        punch = int(unit * 1.5 * max(0.0, np.sin(t * 4.0)))
+        color = (230, 230, 230)
+
+        cv2.circle(canvas, (cx, cy - 2 * unit), unit // 2 + 10, color, -1)
+        cv2.line(canvas, (cx, cy - unit), (cx, cy + 2 * unit), color, 24)
+        cv2.line(canvas, (cx, cy - unit), (cx - unit - punch, cy), color, 18)
+        cv2.line(canvas, (cx, cy - unit), (cx + unit + punch, cy), color, 18)
+        cv2.line(canvas, (cx, cy + 2 * unit), (cx - unit, cy + 4 * unit), color, 20)
+        cv2.line(canvas, (cx, cy + 2 * unit), (cx + unit, cy + 4 * unit), color, 20)
+
+
+def open_source(spec, realtime=True, loop=False):
+    """
+    Create a frame source from a command line spec.
+
+    Supported specs:
+        camera:<index>          Physical camera
+        video:<path>            Video file
+        images:<directory>      Directory of images
+        raw:<path>              Raw dump written by save_raw_dump()
+        synthetic[:<frames>]    Generated frames (default 900)
+
+    Args:
+        spec: Source spec string
+        realtime: Pace non-live sources to their FPS
+        loop: Restart non-live sources when they run out
+
+    Returns:
+        FrameSource
+
+    Raises:
+        ValueError: If the spec is not recognised
+    """
+    kind, _, arg = spec.partition(':')
+    kind = kind.lower()
+
+    if kind == 'camera':
+        return CameraSource(int(arg or 0))
+    if kind == 'video':
+        return VideoFileSource(arg, realtime=realtime, loop=loop)
+    if kind == 'images':
+        return ImageDirectorySource(arg, realtime=realtime, loop=loop)
+    if kind == 'raw':
+        return RawDumpSource(arg, realtime=realtime, loop=loop)
+    if kind == 'synthetic':
+        num_frames = int(arg) if arg else 900
+        return SyntheticSource(num_frames=num_frames, realtime=realtime, loop=loop)
+
+    raise ValueError(f"Sumber frame tidak dikenal: {spec}")
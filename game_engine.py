@@ -1,17 +1,16 @@
 import pygame
-import cv2
 import numpy as np
 import random
-import mediapipe as mp
 
 # Import modul eksternal
-from pose_detector import PoseDetector
 from collision_detector import CollisionDetector
-from game_objects import Target, Obstacle, PowerUp
+from entity_store import EntityStore, TARGET, OBSTACLE, POWERUP
 from score_manager import ScoreManager
 from sound_manager import SoundManager
-from renderer import GameRenderer
 from spawn_manager import SpawnManager
+from pose_frame import PoseFrame
+from spatial_hash import SpatialHash
+from profiler import profiler
 
 
 class GameEngine:
@@ -20,10 +19,27 @@ class GameEngine:
     Loop utama ditangani oleh main.py.
     """
 
-    def __init__(self, screen, pose_detector, game_renderer, spawn_manager):
+    def __init__(self, screen, pose_detector, game_renderer, spawn_manager,
+                 sound_manager=None, screen_size=None, continuous_collision=True,
+                 broadphase=True):
+        """
+        Args:
+            screen: pygame display surface (None when running headless)
+            pose_detector: PoseDetector (closed on cleanup) or None
+            game_renderer: GameRenderer or None
+            spawn_manager: SpawnManager that creates the game objects
+            sound_manager: Sound manager to use (default: a new SoundManager)
+            screen_size: (width, height) of the play field (default: screen size)
+            continuous_collision: Sweep hands/forearms and objects between
+                                  pose samples (False = test only the
+                                  current sample)
+            broadphase: Only test objects in spatial hash cells near the
+                        hands, head and forearms (False = test every object)
+        """
         self.screen = screen
-        self.screen_width = screen.get_width()
-        self.screen_height = screen.get_height()
+        if screen_size is None:
+            screen_size = (screen.get_width(), screen.get_height())
+        self.screen_width, self.screen_height = screen_size
 
         # Komponen eksternal
         self.pose_detector = pose_detector
@@ -33,16 +49,29 @@ class GameEngine:
         # Komponen internal
         self.collision_detector = CollisionDetector(collision_radius=25)
         self.score_manager = ScoreManager(starting_lives=3)
-        self.sound_manager = SoundManager()
+        self.sound_manager = sound_manager if sound_manager is not None \
+            else SoundManager()
 
-        # List objek game
+        # List objek game (view atas baris EntityStore)
         self.targets = []
         self.obstacles = []
         self.powerups = []
+        self.entities = EntityStore()
+        self.spawn_manager.entity_store = self.entities
+
+        # Broadphase: satu grid untuk semua slot, diperbarui sebelum tes tabrakan
+        self.broadphase = broadphase
+        self.grid = SpatialHash(self.entities)
 
         # State
         self.paused = False
-        self.mp_pose = mp.solutions.pose.PoseLandmark
+        self.continuous_collision = continuous_collision
+
+        # Sampel pose sebelumnya untuk continuous collision
+        self._previous_limbs = None
+        self._limb_elapsed = 0.0
+        self._limb_interval = None
+        self._ticks_since_sample = 0
 
         # Hand tracking state
         self.hand_info = {
@@ -50,45 +79,6 @@ class GameEngine:
             'right_hand': {'position': None, 'is_fist': False}
         }
 
-    def initialize(self):
-        """Initialize camera and pose detector."""
-        print("Initializing camera...")
-        self.cap = cv2.VideoCapture(self.camera_id)
-
-        if not self.cap.isOpened():
-            print(f"Error: Could not open camera {self.camera_id}")
-            return False
-
-        self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
-        self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
-
-        print("Initializing pose detector with hand tracking...")
-        self.pose_detector = PoseDetector(
-            static_image_mode=False,
-            model_complexity=1,
-            smooth_landmarks=True,
-            min_detection_confidence=0.5,
-            min_tracking_confidence=0.5
-        )
-
-        print("Initialization complete!")
-        return True
-
-    def handle_events(self):
-        """Handle pygame events."""
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE or event.key == pygame.K_q:
-                    self.running = False
-                elif event.key == pygame.K_SPACE:
-                    self.paused = not self.paused
-                elif event.key == pygame.K_r and self.score_manager.game_over:
-                    self.reset_game()
-                elif event.key == pygame.K_c:
-                    self.show_camera = not self.show_camera
-
     def reset_game(self):
         """Reset seluruh state permainan."""
         print("Mereset game...")
@@ -96,15 +86,64 @@ class GameEngine:
         self.targets.clear()
         self.obstacles.clear()
         self.powerups.clear()
+        self.entities.clear()
+        self.grid.clear()
         self.spawn_manager.reset_timers()
+        self._forget_limbs()
+
+    def _groups(self):
+        return ((TARGET, self.targets), (OBSTACLE, self.obstacles),
+                (POWERUP, self.powerups))
 
-    def update(self, dt: float, landmarks, hand_info):
+    def _sync_lists(self):
+        """
+        Make the entity store list exactly the objects of the engine lists.
+
+        Spawns allocate in the engine's store and append, so normally the
+        counts already match; objects added from outside (another store) are
+        adopted and the slots of objects removed from outside are released,
+        then the store order is set to list order.
+        """
+        store = self.entities
+        for kind, objects in self._groups():
+            if store.counts[kind] == len(objects) and \
+                    (not objects or objects[-1].store is store):
+                continue
+            slots = [store.adopt(obj) for obj in objects]
+            alive = np.flatnonzero(store.alive[:store.size] &
+                                   (store.kind[:store.size] == kind))
+            for slot in np.setdiff1d(alive, slots).tolist():
+                store.release(slot)
+            store.resequence(slots)
+
+    def _prune(self, kind, objects):
+        """
+        Objects of a group without the inactive ones, whose slots are
+        released here (under the world lock in pipelined mode, like every
+        other engine update).
+        """
+        store = self.entities
+        if not store.inactive[kind]:
+            return objects
+        store.release_inactive(kind)
+        return store.views(store.live_slots(kind))
+
+    def _forget_limbs(self):
+        """Drop the previous pose sample (nothing to sweep from)."""
+        self._previous_limbs = None
+        self._limb_elapsed = 0.0
+        self._limb_interval = None
+        self._ticks_since_sample = 0
+
+    @profiler.timed('update')
+    def update(self, dt: float, pose_frame, hand_info):
         """
         Update game logic.
 
         Args:
             dt: Delta time in seconds
-            landmarks: Body pose landmarks
+            pose_frame: PoseFrame of the current frame (raw landmarks are
+                        converted), or None
             hand_info: Hand tracking information with fist status
         """
         if self.paused or self.score_manager.game_over:
@@ -112,6 +151,9 @@ class GameEngine:
 
         # Store hand info for rendering
         self.hand_info = hand_info
+        # Waktu nyata antar sampel pose (untuk kecepatan pukulan)
+        self._limb_elapsed += dt
+        self._ticks_since_sample += 1
 
         # Apply slow motion if active
         if self.score_manager.slow_motion_active:
@@ -121,225 +163,233 @@ class GameEngine:
         self.score_manager.update(dt)
         self.spawn_manager.update(
             dt, self.targets, self.obstacles, self.powerups)
+        self._sync_lists()
 
-        # Update semua objek
-        for obj in self.targets:
-            obj.update(dt)
-        for obj in self.obstacles:
-            obj.update(dt)
-        for obj in self.powerups[:]:
-            obj.update(dt)
-            if not obj.active:
-                self.powerups.remove(obj)
+        # Update semua objek: satu pass vektor per jenis; obstacle yang
+        # habis umur / sampai tujuan tanpa mengenai pemain = dihindari
+        self.score_manager.obstacles_dodged += self.entities.update(dt)
+        self.powerups = self._prune(POWERUP, self.powerups)
 
         # Deteksi tabrakan jika pose terdeteksi
-        if landmarks:
-            self.check_collisions(landmarks, hand_info)
+        pose_frame = PoseFrame.from_landmarks(
+            pose_frame, self.screen_width, self.screen_height)
+        if pose_frame is not None:
+            self.check_collisions(pose_frame, hand_info)
+        else:
+            self._forget_limbs()
 
         # Bersihkan objek tak aktif
-        self.targets = [t for t in self.targets if t.active]
-        self.obstacles = [o for o in self.obstacles if o.active]
+        self.targets = self._prune(TARGET, self.targets)
+        self.obstacles = self._prune(OBSTACLE, self.obstacles)
+
+    def hand_regions(self):
+        """
+        Circles (x, y, radius) of every object a hand can interact with:
+        targets to punch, power-ups to grab and obstacles to block.
+
+        Returns:
+            numpy.ndarray: (N, 3) float64
+        """
+        store = self.entities
+        slots = np.concatenate([store.live_slots(kind)
+                                for kind in (TARGET, POWERUP, OBSTACLE)])
+        centers, radii = store.positions(slots)
+        return np.column_stack([centers, radii])
+
+    def _nearby(self, kind, boxes):
+        """
+        Active slots of one entity kind that may touch any of ``boxes``.
+
+        With the broadphase only slots filed in grid cells overlapping a
+        box are returned (in list order); otherwise every active slot.
+        """
+        if not self.broadphase:
+            return self.entities.live_slots(kind)
+        boxes = [box for box in boxes if box is not None]
+        if not boxes:
+            return np.zeros(0, dtype=np.int64)
+        return self.grid.query(boxes, kind)
+
+    def _query_boxes(self, limbs, capsule_radii, sweep):
+        """
+        Broadphase boxes around each hand and each body capsule.
+
+        Boxes are grown by the hand collision radius or the capsule radius
+        (plus 1 px for the int truncation of positions); when sweeping they
+        also cover the limb's previous sample and how far any object can
+        have moved since then.
 
-    def check_collisions(self, landmarks, hand_info):
+        Returns:
+            tuple: (hand boxes, capsule boxes)
+        """
+        motion = 1
+        previous = self._previous_limbs if sweep else None
+        if previous is not None:
+            motion += self.entities.max_step * self._ticks_since_sample
+        hands, capsules = limbs
+        hand_margin = self.collision_detector.collision_radius + motion
+        hand_boxes = []
+        for i, hand in enumerate(hands):
+            points = [hand] if previous is None else [hand, previous[0][i]]
+            hand_boxes.append(SpatialHash.box_around(points, hand_margin))
+        # Titik ujung kapsul dibuka langsung (lebih murah dari box_around
+        # per kapsul; kotak ini dihitung setiap tick)
+        capsule_boxes = []
+        radii = (np.asarray(capsule_radii, dtype=np.float64) + motion).tolist()
+        if previous is None:
+            for ((ax, ay), (bx, by)), margin in zip(capsules, radii):
+                capsule_boxes.append((min(ax, bx) - margin, min(ay, by) - margin,
+                                      max(ax, bx) + margin, max(ay, by) + margin))
+        else:
+            for ((ax, ay), (bx, by)), ((cx, cy), (dx, dy)), margin in zip(
+                    capsules, previous[1], radii):
+                capsule_boxes.append((min(ax, bx, cx, dx) - margin,
+                                      min(ay, by, cy, dy) - margin,
+                                      max(ax, bx, cx, dx) + margin,
+                                      max(ay, by, cy, dy) + margin))
+        return hand_boxes, capsule_boxes
+
+    def _limb_hits(self, slots, hands, segments=(), sweep=False, segment_radii=None):
+        """
+        Hits of objects (entity slots) against the hands and limb segments.
+
+        With ``sweep`` the limbs and objects are swept from the previous
+        pose sample to the current one; otherwise (or when there is no
+        previous sample) only the current sample is tested. Segments are
+        capsules of ``segment_radii`` (default: the hand collision radius).
+
+        Returns:
+            tuple: (centers, radii, hits) where hits has the 'hands' and
+                   'segments' masks plus '<key>_toi' and '<key>_speed'
+                   (impact speed in pixels per second) arrays
+        """
+        detector = self.collision_detector
+        centers, radii = self.entities.positions(slots)
+        previous = self._previous_limbs
+        if not sweep or previous is None:
+            hits = detector.check_batch(centers, radii, hands, segments=segments,
+                                        segment_radii=segment_radii)
+            for key in ('hands', 'segments'):
+                hits[key + '_toi'] = np.where(hits[key], 1.0, np.inf)
+                hits[key + '_speed'] = np.zeros(hits[key].shape)
+            return centers, radii, hits
+
+        previous_hands, previous_segments = previous
+        centers0 = self.entities.sample_positions(slots)
+        hits = detector.sweep_batch(centers0, centers, radii, previous_hands, hands,
+                                    previous_segments if segments else (), segments,
+                                    segment_radii)
+        interval = self._limb_interval
+        for key in ('hands', 'segments'):
+            travel = hits.pop(key + '_travel')
+            hits[key + '_speed'] = travel / interval if interval else np.zeros(travel.shape)
+        return centers, radii, hits
+
+    @profiler.timed('collision')
+    def check_collisions(self, pose_frame, hand_info):
         """
         Check collisions between pose/hands and game objects.
 
+        The body is the PoseFrame's BodyModel (head circle + capsules), the
+        same shapes the stickman is drawn with. The spatial hash broadphase
+        picks the objects near the hands, head and capsules; those are
+        tested against all body parts in one batch. With continuous
+        collision the hands and capsules are swept since the previous pose
+        sample, so fast punches at low camera rates are not missed. Side
+        effects are then applied per hit in list order, through the views
+        of the hit slots only.
+
         Args:
-            landmarks: Body pose landmarks
+            pose_frame: PoseFrame of the current frame
             hand_info: Hand tracking information with fist status
         """
-        # Extract hand positions and fist status
-        left_hand_pos = hand_info['left_hand']['position']
-        right_hand_pos = hand_info['right_hand']['position']
-        left_is_fist = hand_info['left_hand']['is_fist']
-        right_is_fist = hand_info['right_hand']['is_fist']
+        detector = self.collision_detector
+        store = self.entities
+        hand_points = (hand_info['left_hand']['position'],
+                       hand_info['right_hand']['position'])
+        fists = (hand_info['left_hand']['is_fist'],
+                 hand_info['right_hand']['is_fist'])
+        body = pose_frame.body
+        capsules = body.segments()
+
+        # Sampel pose baru: sapu dari sampel sebelumnya (tick dengan sampel
+        # yang sama cukup dites diskrit, tangan tidak bergerak)
+        limbs = (hand_points, capsules)
+        new_sample = limbs != self._previous_limbs
+        if new_sample and self._previous_limbs is not None:
+            self._limb_interval = self._limb_elapsed
+        sweep = self.continuous_collision and new_sample
+        hand_boxes, capsule_boxes = self._query_boxes(limbs, body.radii, sweep)
+        head_box = SpatialHash.box_around([body.head_center], body.head_radius + 1)
+        self._sync_lists()
+        if self.broadphase:
+            self.grid.update()
 
         # Check target collisions (REQUIRES FIST to punch!)
-        for target in self.targets[:]:
-            if not target.active:
-                continue
-
-            collision_hand = self.collision_detector.check_hand_collision(
-                left_hand_pos, right_hand_pos,
-                left_is_fist, right_is_fist,
-                target.get_position(), target.radius,
-                require_fist=True  # Must be fist to punch targets!
-            )
-
-            if collision_hand:  # Returns 'left', 'right', or ''
+        targets = self._nearby(TARGET, hand_boxes)
+        if len(targets):
+            _, _, hits = self._limb_hits(targets, hand_points, sweep=sweep)
+            limbs_hit = detector.earliest_limb(hits['hands_toi'], fists)
+            for i in np.flatnonzero(limbs_hit >= 0):
+                target, limb = store.view(targets[i]), limbs_hit[i]
                 target.active = False
                 self.score_manager.add_score(target.points, self.sound_manager)
                 self.score_manager.targets_hit += 1
+                if sweep:
+                    self.score_manager.record_punch(hits['hands_speed'][i, limb])
                 self.sound_manager.play_sound('hit')
 
         # Check powerup collisions (NO FIST REQUIRED - open hand can grab)
-        for powerup in self.powerups[:]:
-            if not powerup.active:
-                continue
-
-            collision_hand = self.collision_detector.check_hand_collision(
-                left_hand_pos, right_hand_pos,
-                left_is_fist, right_is_fist,
-                powerup.get_position(), powerup.radius,
-                require_fist=False  # Open hand can grab powerups
-            )
-
-            if collision_hand:
+        powerups = self._nearby(POWERUP, hand_boxes)
+        if len(powerups):
+            _, _, hits = self._limb_hits(powerups, hand_points, sweep=sweep)
+            limbs_hit = detector.earliest_limb(hits['hands_toi'])
+            for i in np.flatnonzero(limbs_hit >= 0):
+                powerup = store.view(powerups[i])
                 powerup.active = False
                 self.score_manager.activate_powerup(powerup.type)
                 self.sound_manager.play_sound('powerup')
 
-        # Check obstacle collisions - hanya dengan lingkaran kepala
-        # Dapatkan posisi nose dan telinga untuk menghitung head circle
-        nose = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.NOSE.value,
-            self.screen_width, self.screen_height
-        )
-        left_ear = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_EAR.value,
-            self.screen_width, self.screen_height
-        )
-        right_ear = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_EAR.value,
-            self.screen_width, self.screen_height
-        )
-
-        # Hitung head_center dan head_radius (sama seperti di renderer)
-        head_center = None
-        head_radius = 30
-
-        if nose:
-            head_center = (nose[0], nose[1])
-
-            # Hitung radius berdasarkan jarak telinga (SAMA dengan renderer.py)
-            if left_ear and right_ear:
-                ear_distance = abs(left_ear[0] - right_ear[0])
-                head_radius = int(ear_distance * 0.75)
-
-        # Cek collision dengan obstacle menggunakan lingkaran kepala
-        for obstacle in self.obstacles[:]:
-            if not obstacle.active:
-                continue
-
-            # Hanya cek collision jika head_center ada
-            if head_center:
-                # Hitung jarak antara pusat kepala dan pusat obstacle
-                distance = self.collision_detector.point_distance(
-                    head_center, obstacle.get_position()
-                )
-
-                # Collision terjadi ketika TEPI kedua lingkaran bersentuhan
-                # Jarak antar pusat <= jumlah kedua radius
-                collision_threshold = head_radius + obstacle.radius
-
-                if distance <= collision_threshold:
-                    obstacle.active = False
-                    if self.score_manager.lose_life(self.sound_manager):
-                        self.score_manager.subtract_score(obstacle.damage)
-
-        # === CHECK ARM BLOCKING (DESTROY OBSTACLE WITH HANDS) ===
-        # Get arm positions (wrist to elbow)
-        left_wrist = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_WRIST.value,
-            self.screen_width, self.screen_height
-        )
-        left_elbow = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_ELBOW.value,
-            self.screen_width, self.screen_height
-        )
-        right_wrist = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_WRIST.value,
-            self.screen_width, self.screen_height
-        )
-        right_elbow = self.pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_ELBOW.value,
-            self.screen_width, self.screen_height
-        )
-
-        # Check if arms block/destroy obstacles
-        for obstacle in self.obstacles[:]:
-            if not obstacle.active:
-                continue
-
-            # Check left arm collision (REQUIRE FIST)
-            left_arm_hit = False
-            if left_is_fist:  # Harus mengepal
-                left_arm_hit = self.collision_detector.check_arm_collision(
-                    left_wrist, left_elbow,
-                    obstacle.get_position(), obstacle.radius
-                )
-
-            # Check right arm collision (REQUIRE FIST)
-            right_arm_hit = False
-            if right_is_fist:  # Harus mengepal
-                right_arm_hit = self.collision_detector.check_arm_collision(
-                    right_wrist, right_elbow,
-                    obstacle.get_position(), obstacle.radius
-                )
-
-            if left_arm_hit or right_arm_hit:
+        obstacles = self._nearby(OBSTACLE, capsule_boxes + [head_box])
+        if len(obstacles):
+            # Obstacle vs semua kapsul tubuh (disapu) dan vs lingkaran kepala
+            # (hanya sampel kini)
+            centers, radii, hits = self._limb_hits(obstacles, (), capsules, sweep=sweep,
+                                                   segment_radii=body.radii)
+            head_hits = detector.circle_hits(centers, radii, body.head_center,
+                                             body.head_radius)
+
+            # Lengan bawah hanya memblok saat tangannya mengepal; kapsul
+            # lain (dan lengan bawah tanpa kepalan) = badan terkena
+            forearms = list(body.FOREARMS)
+            capsule_toi = hits['segments_toi']
+            blocks = detector.earliest_limb(capsule_toi[:, forearms], fists)
+            body_toi = capsule_toi.copy()
+            body_toi[:, forearms] = np.where(fists, np.inf, capsule_toi[:, forearms])
+            body_hits = np.isfinite(body_toi).any(axis=1)
+            damaged = head_hits | (body_hits & (blocks < 0))
+
+            # Kena kepala/badan: kehilangan nyawa (TEPI lingkaran bersentuhan)
+            for i in np.flatnonzero(damaged):
+                obstacle = store.view(obstacles[i])
                 obstacle.active = False
+                if self.score_manager.lose_life(self.sound_manager):
+                    self.score_manager.subtract_score(obstacle.damage)
+
+            # === CHECK ARM BLOCKING (DESTROY OBSTACLE WITH HANDS) ===
+            for i in np.flatnonzero(~damaged & (blocks >= 0)):
+                store.set_active(obstacles[i], False)
                 # Kurangi 5 poin untuk blocking
                 self.score_manager.subtract_score(5)
                 self.sound_manager.play_sound('hit')
-                # Remove from list so it won't check head collision
-                continue
 
-    def run(self):
-        """Main game loop."""
-        if not self.initialize():
+        if not new_sample:
             return
-
-        print("\n" + "=" * 50)
-        print("CAM-FU - Pose Fighting Game")
-        print("=" * 50 + "\n")
-
-        while self.running:
-            dt = self.clock.tick(self.fps) / 1000.0
-
-            # Handle events
-            self.handle_events()
-
-            # Capture frame
-            ret, frame = self.cap.read()
-            if not ret:
-                print("Failed to capture frame")
-                break
-
-            frame = cv2.flip(frame, 1)
-
-            # Detect pose
-            frame_rgb, landmarks = self.pose_detector.detect_pose(frame)
-
-            # Detect hands and get fist status
-            hand_info = self.pose_detector.get_hand_info(
-                frame_rgb,
-                self.screen_width,
-                self.screen_height
-            )
-
-            # Update game logic
-            self.update(dt, landmarks, hand_info)
-
-            # 1. Clear screen
-            self.renderer.clear_screen()
-
-            # 2. Draw all game objects
-            self.renderer.draw_game_objects(
-                self.targets, self.obstacles, self.powerups)
-
-            # 3. Draw stickman overlay
-            if landmarks:
-                self.renderer.draw_stickman(landmarks, self.pose_detector)
-
-            # 4. Draw hand landmarks and fist indicators
-            self.renderer.draw_hand_indicators(hand_info)
-
-            # 5. Draw UI elements
-            self.renderer.draw_ui(self.score_manager, self.clock, hand_info)
-
-            # 6. Update display
-            pygame.display.flip()
+        # Simpan sampel ini sebagai awal sapuan berikutnya
+        self._limb_elapsed = 0.0
+        self._ticks_since_sample = 0
+        self._previous_limbs = limbs
+        store.mark_sample()
 
     # CLEANUP
     def cleanup(self):
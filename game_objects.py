@@ -1,6 +1,11 @@
 """
 Game Objects Module
 Defines Target, Obstacle, and PowerUp classes for the game.
+
+The classes are thin views over an EntityStore row: position, velocity,
+radius, angle, lifetime and active flag live in the store's NumPy columns,
+which the engine advances for all objects at once. The engine releases a
+row when it prunes the object.
 """
 
 import pygame
@@ -9,29 +14,79 @@ import math
 import os
 from typing import Tuple
 
+from entity_store import EntityStore, TARGET, OBSTACLE, POWERUP, OTHER
+
+
+def _column(name, cast=float, doc=None):
+    """Property reading/writing column ``name`` of the object's store row."""
+    def fget(self):
+        return cast(getattr(self.store, name)[self.slot])
+
+    def fset(self, value):
+        getattr(self.store, name)[self.slot] = value
+    return property(fget, fset, doc=doc)
+
 
 class GameObject:
     """Base class for all game objects."""
 
-    def __init__(self, x: int, y: int, radius: int, color: Tuple[int, int, int], speed: float):
+    # False = jangan muat gambar (simulasi headless tanpa display)
+    load_images = True
+    # Store untuk objek yang dibuat tanpa store (mis. di luar GameEngine)
+    default_store = EntityStore()
+
+    KIND = OTHER
+    ROTATION_SPEED = 0  # Degrees per second
+    LIFETIME = math.inf  # Seconds
+    original_image = None
+
+    def __init__(self, x: int, y: int, radius: int, color: Tuple[int, int, int], speed: float,
+                 store: EntityStore = None):
         """
         Initialize game object.
+
+        Args:
+            store: EntityStore holding the object's row (default: the shared
+                   GameObject.default_store)
         """
-        self.x = x
-        self.y = y
-        self.radius = radius
         self.color = color
-        self.speed = speed
-        self.active = True
+        self.store = store if store is not None else GameObject.default_store
+        self.slot = self.store.allocate(self.KIND, self, x, y, radius, speed,
+                                        lifetime=self.LIFETIME)
+        self.store.spin[self.slot] = self.ROTATION_SPEED
+
+    x = _column('x')
+    y = _column('y')
+    radius = _column('radius', int)
+    speed = _column('speed')
+    angle = _column('angle', doc="Current rotation angle in degrees")
+    screen_width = _column('bound_w', int)
+    screen_height = _column('bound_h', int)
+
+    @property
+    def active(self) -> bool:
+        return bool(self.store.active[self.slot])
+
+    @active.setter
+    def active(self, value):
+        self.store.set_active(self.slot, value)
+
+    @property
+    def image(self):
+        """Image rotated to the current angle (None without image)."""
+        if self.original_image is None:
+            return None
+        return pygame.transform.rotate(self.original_image, self.angle)
 
     def update(self, dt: float):
-        """Update object position."""
-        pass  # To be overridden by subclasses
+        """Update this object only (the engine updates all objects at once)."""
+        self.store.update(dt, slots=[self.slot])
 
-    def draw(self, surface: pygame.Surface):
-        """Draw object on surface."""
+    def draw(self, surface: pygame.Surface, position=None):
+        """Draw object on surface (at ``position`` if given, e.g. interpolated)."""
+        x, y = (self.x, self.y) if position is None else position
         if self.active:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+            pygame.draw.circle(surface, self.color, (int(x), int(y)), self.radius)
 
     def get_position(self) -> Tuple[int, int]:
         """Get object center position."""
@@ -48,12 +103,14 @@ class Target(GameObject):
     POINTS = 10
     COLOR = (0, 255, 0)  # Green (fallback if image not found)
     ROTATION_SPEED = 120  # Degrees per second
+    KIND = TARGET
     
     # Class-level cache for loaded images
     _images_cache = {}
     _assets_dir = 'assets/images'
 
-    def __init__(self, x: int, y: int, screen_width: int, screen_height: int):
+    def __init__(self, x: int, y: int, screen_width: int, screen_height: int,
+                 store: EntityStore = None):
         """
         Initialize Target with rotating image.
         """
@@ -61,7 +118,8 @@ class Target(GameObject):
             x, y,
             radius=self.DEFAULT_RADIUS,
             color=self.COLOR,
-            speed=random.uniform(*self.SPEED_RANGE)  
+            speed=random.uniform(*self.SPEED_RANGE),
+            store=store
         )
         self.screen_width = screen_width
         self.screen_height = screen_height
@@ -69,24 +127,49 @@ class Target(GameObject):
         self.direction_y = random.choice([-1, 1])
         self.points = self.POINTS
         
-        # Rotation
-        self.angle = 0  # Current rotation angle
-        
         # Load random poin image
-        self.image = None
         self.original_image = None
         self._load_image()
 
+    # Arah gerak = tanda kecepatan di store (vx = arah * speed)
+    @property
+    def direction_x(self) -> int:
+        return 1 if self.store.vx[self.slot] >= 0 else -1
+
+    @direction_x.setter
+    def direction_x(self, value):
+        self.store.vx[self.slot] = value * self.speed
+
+    @property
+    def direction_y(self) -> int:
+        return 1 if self.store.vy[self.slot] >= 0 else -1
+
+    @direction_y.setter
+    def direction_y(self, value):
+        self.store.vy[self.slot] = value * self.speed
+
+    @property
+    def speed(self) -> float:
+        return float(self.store.speed[self.slot])
+
+    @speed.setter
+    def speed(self, value):
+        direction_x, direction_y = self.direction_x, self.direction_y
+        self.store.speed[self.slot] = value
+        self.direction_x, self.direction_y = direction_x, direction_y
+
     def _load_image(self):
         """Load a random poin image from assets."""
         # Choose random poin image (1 or 2)
         poin_num = random.randint(1, 3)
         image_name = f'poin_{poin_num}.png'
-        
+        if not GameObject.load_images:
+            # Headless: tanpa display, hanya gambar fallback
+            return
+
         # Check cache first
         if image_name in self._images_cache:
             self.original_image = self._images_cache[image_name]
-            self.image = self.original_image.copy()
             return
         
         # Try to load image
@@ -99,57 +182,29 @@ class Target(GameObject):
                 img = pygame.transform.smoothscale(img, (size, size))
                 self._images_cache[image_name] = img
                 self.original_image = img
-                self.image = img.copy()
             except Exception as e:
                 print(f"[Warning] Failed to load {image_name}: {e}")
                 self.original_image = None
-                self.image = None
         else:
             print(f"[Warning] Image not found: {image_path}")
             self.original_image = None
-            self.image = None
-
-    def update(self, dt: float):
-        """Move target, bounce off walls, and rotate."""
-        if not self.active:
-            return
-
-        # Move target
-        self.x += self.direction_x * self.speed * dt
-        self.y += self.direction_y * self.speed * dt
-
-        # Bounce off walls
-        if self.x - self.radius <= 0 or self.x + self.radius >= self.screen_width:
-            self.direction_x *= -1
-            self.x = max(self.radius, min(self.x, self.screen_width - self.radius))
-
-        if self.y - self.radius <= 0 or self.y + self.radius >= self.screen_height:
-            self.direction_y *= -1
-            self.y = max(self.radius, min(self.y, self.screen_height - self.radius))
-        
-        # Rotate image
-        self.angle += self.ROTATION_SPEED * dt
-        if self.angle >= 360:
-            self.angle -= 360
-        
-        # Update rotated image
-        if self.original_image:
-            self.image = pygame.transform.rotate(self.original_image, self.angle)
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, position=None):
         """Draw rotating target image."""
+        x, y = (self.x, self.y) if position is None else position
         if not self.active:
             return
         
-        if self.image:
+        image = self.image
+        if image:
             # Get rect and center it on position
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            surface.blit(self.image, rect)
+            rect = image.get_rect(center=(int(x), int(y)))
+            surface.blit(image, rect)
         else:
             # Fallback to circle with bullseye if image not loaded
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
-            pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), self.radius // 2)
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), 5)
+            pygame.draw.circle(surface, self.color, (int(x), int(y)), self.radius)
+            pygame.draw.circle(surface, (255, 255, 255), (int(x), int(y)), self.radius // 2)
+            pygame.draw.circle(surface, self.color, (int(x), int(y)), 5)
 
 
 class Obstacle(GameObject):
@@ -166,11 +221,14 @@ class Obstacle(GameObject):
     DEACTIVATE_DISTANCE = 50  # Distance from target to deactivate
     ROTATION_SPEED = 360  # Degrees per second
     
+    KIND = OBSTACLE
+
     # Class-level cache for loaded images
     _images_cache = {}
     _assets_dir = 'assets/images'
 
-    def __init__(self, x: int, y: int, screen_width: int, screen_height: int):
+    def __init__(self, x: int, y: int, screen_width: int, screen_height: int,
+                 store: EntityStore = None):
         """
         Initialize Obstacle with rotating image.
         """
@@ -178,36 +236,39 @@ class Obstacle(GameObject):
             x, y,
             radius=self.DEFAULT_RADIUS,
             color=self.COLOR,
-            speed=random.uniform(*self.SPEED_RANGE)
+            speed=random.uniform(*self.SPEED_RANGE),
+            store=store
         )
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.damage = self.DAMAGE
         self.lives_cost = self.LIVES_COST
-        self.time_alive = 0
+        self.store.arrive_distance[self.slot] = self.DEACTIVATE_DISTANCE
         
         # Target position (center of screen with randomness)
         self.target_x = self.screen_width // 2 + random.randint(-100, 100)
         self.target_y = self.screen_height // 2 + random.randint(-100, 100)
         
-        # Rotation
-        self.angle = 0  # Current rotation angle
-        
         # Load random hit image
-        self.image = None
         self.original_image = None
         self._load_image()
 
+    target_x = _column('goal_x', int)
+    target_y = _column('goal_y', int)
+    time_alive = _column('age')
+
     def _load_image(self):
         """Load a random hit image from assets."""
         # Choose random hit image (1 or 2)
         hit_num = random.randint(1, 2)
         image_name = f'hit_{hit_num}.png'
-        
+        if not GameObject.load_images:
+            # Headless: tanpa display, hanya gambar fallback
+            return
+
         # Check cache first
         if image_name in self._images_cache:
             self.original_image = self._images_cache[image_name]
-            self.image = self.original_image.copy()
             return
         
         # Try to load image
@@ -220,72 +281,36 @@ class Obstacle(GameObject):
                 img = pygame.transform.smoothscale(img, (size, size))
                 self._images_cache[image_name] = img
                 self.original_image = img
-                self.image = img.copy()
             except Exception as e:
                 print(f"[Warning] Failed to load {image_name}: {e}")
                 self.original_image = None
-                self.image = None
         else:
             print(f"[Warning] Image not found: {image_path}")
             self.original_image = None
-            self.image = None
-
-    def update(self, dt: float):
-        """Move obstacle towards target and rotate."""
-        if not self.active:
-            return
-
-        # Update lifetime
-        self.time_alive += dt
-        if self.time_alive >= self.LIFETIME:
-            self.active = False
-            return
 
-        # Calculate distance to target
-        dx = self.target_x - self.x
-        dy = self.target_y - self.y
-        distance = (dx**2 + dy**2) ** 0.5
-
-        # Deactivate if reached target
-        if distance < self.DEACTIVATE_DISTANCE:
-            self.active = False
-            return
-
-        # Move towards target
-        if distance > 0:
-            self.x += (dx / distance) * self.speed * dt
-            self.y += (dy / distance) * self.speed * dt
-        
-        # Rotate image
-        self.angle += self.ROTATION_SPEED * dt
-        if self.angle >= 360:
-            self.angle -= 360
-        
-        # Update rotated image
-        if self.original_image:
-            self.image = pygame.transform.rotate(self.original_image, self.angle)
-
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, position=None):
         """Draw rotating obstacle image."""
+        x, y = (self.x, self.y) if position is None else position
         if not self.active:
             return
         
-        if self.image:
+        image = self.image
+        if image:
             # Get rect and center it on position
-            rect = self.image.get_rect(center=(int(self.x), int(self.y)))
-            surface.blit(self.image, rect)
+            rect = image.get_rect(center=(int(x), int(y)))
+            surface.blit(image, rect)
         else:
             # Fallback to circle with X if image not loaded
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+            pygame.draw.circle(surface, self.color, (int(x), int(y)), self.radius)
             pygame.draw.line(
                 surface, (255, 255, 255),
-                (int(self.x - 10), int(self.y - 10)),
-                (int(self.x + 10), int(self.y + 10)), 3
+                (int(x - 10), int(y - 10)),
+                (int(x + 10), int(y + 10)), 3
             )
             pygame.draw.line(
                 surface, (255, 255, 255),
-                (int(self.x + 10), int(self.y - 10)),
-                (int(self.x - 10), int(self.y + 10)), 3
+                (int(x + 10), int(y - 10)),
+                (int(x - 10), int(y + 10)), 3
             )
 
 
@@ -299,7 +324,10 @@ class PowerUp(GameObject):
     SPEED = 100  
     LIFETIME = 5.0  # Seconds
 
-    def __init__(self, x: int, y: int, screen_width: int, screen_height: int):
+    KIND = POWERUP
+
+    def __init__(self, x: int, y: int, screen_width: int, screen_height: int,
+                 store: EntityStore = None):
         """
         Initialize PowerUp.
         """
@@ -307,37 +335,27 @@ class PowerUp(GameObject):
             x, y,
             radius=self.DEFAULT_RADIUS,
             color=self.COLOR,
-            speed=self.SPEED
+            speed=self.SPEED,
+            store=store
         )
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.type = random.choice(self.TYPES)
-        self.time_alive = 0
-
-    def update(self, dt: float):
-        """Update power-up (floating effect)."""
-        if not self.active:
-            return
-
-        self.time_alive += dt
-        if self.time_alive >= self.LIFETIME:
-            self.active = False
-            return
 
-        # Floating effect (sine wave)
-        self.y += math.sin(self.time_alive * 3) * 2
+    time_alive = _column('age')
 
-    def draw(self, surface: pygame.Surface):
+    def draw(self, surface: pygame.Surface, position=None):
         """Draw power-up with star effect."""
+        x, y = (self.x, self.y) if position is None else position
         if self.active:
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), self.radius)
+            pygame.draw.circle(surface, self.color, (int(x), int(y)), self.radius)
             
             # Star points
             points = []
             for i in range(5):
                 angle = math.pi * 2 * i / 5 - math.pi / 2
-                px = self.x + math.cos(angle) * (self.radius - 5)
-                py = self.y + math.sin(angle) * (self.radius - 5)
+                px = x + math.cos(angle) * (self.radius - 5)
+                py = y + math.sin(angle) * (self.radius - 5)
                 points.append((int(px), int(py)))
             if len(points) >= 3:
                 pygame.draw.polygon(surface, (255, 165, 0), points)
\ No newline at end of file
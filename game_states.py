@@ -0,0 +1,96 @@
+"""
+Game States Module
+Game state constants, the pipeline stages each state needs, and per-state
+frame-time statistics.
+"""
+
+from collections import deque
+
+import numpy as np
+
+# Game States
+GAME_MENU = 0
+GAME_COUNTDOWN = 1
+GAME_PLAY = 2
+GAME_OVER = 3
+GAME_CREDITS = 4
+GAME_GUIDE = 5
+
+STATE_NAMES = {
+    GAME_MENU: 'MENU',
+    GAME_COUNTDOWN: 'COUNTDOWN',
+    GAME_PLAY: 'PLAY',
+    GAME_OVER: 'GAME_OVER',
+    GAME_CREDITS: 'CREDITS',
+    GAME_GUIDE: 'GUIDE',
+}
+
+# Pipeline stages
+CAPTURE = 'capture'        # Baca frame kamera
+POSE = 'pose'              # Inference pose (kursor, stickman, collision)
+HANDS = 'hands'            # Inference hands (kepalan untuk klik & pukulan)
+CAMERA_BG = 'camera_bg'    # Kamera sebagai background
+SIMULATION = 'simulation'  # GameEngine.update
+HUD = 'hud'                # Kursor tangan / UI permainan
+
+# Stage yang dibutuhkan tiap state; stage lain tidak dijalankan sama sekali
+STATE_STAGES = {
+    GAME_MENU: frozenset({CAPTURE, POSE, HANDS, CAMERA_BG, HUD}),
+    # Pose tetap jalan agar tracking sudah stabil saat permainan dimulai
+    GAME_COUNTDOWN: frozenset({CAPTURE, POSE, HUD}),
+    GAME_PLAY: frozenset({CAPTURE, POSE, HANDS, SIMULATION, HUD}),
+    # Layar game over hanya gambar statis + keyboard
+    GAME_OVER: frozenset(),
+    GAME_CREDITS: frozenset({CAPTURE, POSE, HANDS, CAMERA_BG, HUD}),
+    GAME_GUIDE: frozenset({CAPTURE, POSE, HANDS, CAMERA_BG, HUD}),
+}
+
+
+def stages_for(state):
+    """Pipeline stages needed by a game state."""
+    return STATE_STAGES[state]
+
+
+class StateFrameStats:
+    """
+    Frame-time statistics per game state.
+
+    Keeps the last ``window`` frame times of every state so the cost of each
+    state's pipeline can be compared at exit.
+    """
+
+    def __init__(self, window=600):
+        """
+        Args:
+            window: Number of recent frames kept per state
+        """
+        self.window = window
+        self._times = {}
+        self._frames = {}
+
+    def record(self, state, seconds):
+        """
+        Record the work time of one frame.
+
+        Args:
+            state: Game state the frame was processed in
+            seconds: Frame time excluding the frame-rate limiter wait
+        """
+        times = self._times.get(state)
+        if times is None:
+            times = self._times[state] = deque(maxlen=self.window)
+        times.append(seconds)
+        self._frames[state] = self._frames.get(state, 0) + 1
+
+    def get_stats(self) -> dict:
+        """Return {state name: {frames, avg_ms, p95_ms, stages}}."""
+        stats = {}
+        for state, times in self._times.items():
+            ms = np.array(times) * 1000.0
+            stats[STATE_NAMES[state]] = {
+                'frames': self._frames[state],
+                'avg_ms': round(float(ms.mean()), 2),
+                'p95_ms': round(float(np.percentile(ms, 95)), 2),
+                'stages': sorted(STATE_STAGES[state]),
+            }
+        return stats
@@ -0,0 +1,166 @@
+"""
+Gesture Classifier Module
+Vectorized hand gesture classification (fist, open palm, pointing).
+"""
+
+import numpy as np
+
+from landmarks import landmarks_to_array
+
+
+# Gesture codes
+NONE = 0
+FIST = 1
+OPEN = 2
+POINTING = 3
+
+GESTURE_NAMES = {NONE: 'none', FIST: 'fist', OPEN: 'open', POINTING: 'pointing'}
+
+# Hand landmark indices: index, middle, ring, pinky
+WRIST = 0
+FINGER_TIPS = np.array([8, 12, 16, 20])
+FINGER_PIPS = np.array([6, 10, 14, 18])
+
+
+def hands_to_array(multi_hand_landmarks):
+    """
+    Stack MediaPipe hand landmark lists into one array.
+
+    Args:
+        multi_hand_landmarks: List of hand landmark lists (or None)
+
+    Returns:
+        numpy.ndarray: (hands, 21, 3) float32 array of x, y, z
+    """
+    if not multi_hand_landmarks:
+        return np.zeros((0, 21, 3), dtype=np.float32)
+    return np.stack([landmarks_to_array(hand)[:, :3]
+                     for hand in multi_hand_landmarks])
+
+
+def extension_ratios(hands):
+    """
+    Per-finger extension ratio: |tip - wrist| / |pip - wrist|.
+
+    The ratio does not depend on how large the hand appears in the frame:
+    an extended finger is ~1.3-1.6, a curled one drops below ~1.0.
+
+    Args:
+        hands: (..., 21, 3) array of hand landmarks
+
+    Returns:
+        numpy.ndarray: (..., 4) ratios for index, middle, ring, pinky
+    """
+    wrist = hands[..., WRIST:WRIST + 1, :]
+    tip_dist = np.linalg.norm(hands[..., FINGER_TIPS, :] - wrist, axis=-1)
+    pip_dist = np.linalg.norm(hands[..., FINGER_PIPS, :] - wrist, axis=-1)
+    return tip_dist / np.maximum(pip_dist, 1e-6)
+
+
+def classify_batch(hands, curled_below=1.0, extended_above=1.2,
+                   curled_below_fist=None):
+    """
+    Classify any number of hands in one vectorized pass.
+
+    Works on a single frame (hands, 21, 3) or a whole recording
+    (frames, hands, 21, 3) alike.
+
+    Args:
+        hands: (..., 21, 3) array of hand landmarks
+        curled_below: A finger is curled when its ratio is below this
+        extended_above: A finger is extended when its ratio is above this
+        curled_below_fist: Optional (...) array of per-hand curled
+                           thresholds (used for hysteresis)
+
+    Returns:
+        numpy.ndarray: (...) int array of gesture codes
+    """
+    hands = np.asarray(hands, dtype=np.float32)
+    ratios = extension_ratios(hands)
+
+    curled_threshold = curled_below
+    if curled_below_fist is not None:
+        curled_threshold = np.asarray(curled_below_fist)[..., None]
+    curled = ratios < curled_threshold
+    extended = ratios > extended_above
+
+    codes = np.full(ratios.shape[:-1], NONE, dtype=np.int8)
+    codes[extended.all(axis=-1)] = OPEN
+    codes[extended[..., 0] & curled[..., 1:].all(axis=-1)] = POINTING
+    codes[curled.all(axis=-1)] = FIST
+    return codes
+
+
+class GestureClassifier:
+    """
+    Live gesture classification with per-hand hysteresis.
+
+    A hand that is already a fist keeps being one until its fingers open
+    past a looser threshold, and must be seen open for ``release_frames``
+    frames before the fist is released. Tracking noise around the threshold
+    therefore does not turn into a burst of fist on/off changes (repeated
+    punches).
+    """
+
+    def __init__(self, curled_below=1.0, extended_above=1.2,
+                 release_below=1.1, release_frames=2):
+        """
+        Args:
+            curled_below: Curled-finger ratio threshold to enter a fist
+            extended_above: Extended-finger ratio threshold
+            release_below: Looser curled threshold while already a fist
+            release_frames: Frames a fist must be gone before it is released
+        """
+        self.curled_below = curled_below
+        self.extended_above = extended_above
+        self.release_below = release_below
+        self.release_frames = release_frames
+
+        self._state = {}     # hand key -> gesture code
+        self._release = {}   # hand key -> frames seen without fist
+
+    def classify(self, hands, keys):
+        """
+        Classify the hands of one frame.
+
+        Args:
+            hands: (n, 21, 3) array of hand landmarks
+            keys: n hand identifiers (e.g. 'left_hand'), used for hysteresis
+
+        Returns:
+            list: Gesture code per hand
+        """
+        keys = list(keys)
+        if not keys:
+            self.reset()
+            return []
+
+        thresholds = np.array(
+            [self.release_below if self._state.get(key) == FIST
+             else self.curled_below for key in keys], dtype=np.float32)
+        codes = classify_batch(hands, self.curled_below, self.extended_above,
+                               curled_below_fist=thresholds)
+
+        gestures = []
+        for key, code in zip(keys, codes.tolist()):
+            if code == FIST:
+                self._release[key] = 0
+            elif self._state.get(key) == FIST:
+                # Lepas kepalan hanya setelah beberapa frame berturut-turut
+                self._release[key] = self._release.get(key, 0) + 1
+                if self._release[key] < self.release_frames:
+                    code = FIST
+            self._state[key] = code
+            gestures.append(code)
+
+        # Tangan yang hilang: lupakan state-nya
+        for key in list(self._state):
+            if key not in keys:
+                del self._state[key]
+                self._release.pop(key, None)
+        return gestures
+
+    def reset(self):
+        self._state.clear()
+        self._release.clear()
+
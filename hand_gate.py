@@ -0,0 +1,124 @@
+"""
+Hand Gate Module
+Decides per frame whether fresh hand inference is worth running.
+"""
+
+import numpy as np
+
+from landmarks import PoseLandmark, landmarks_to_array
+
+
+# Titik pose yang mewakili posisi tangan
+HAND_POSE_POINTS = (PoseLandmark.LEFT_WRIST, PoseLandmark.RIGHT_WRIST,
+                    PoseLandmark.LEFT_INDEX, PoseLandmark.RIGHT_INDEX)
+
+
+class HandGate:
+    """
+    Relevance policy for Hands inference.
+
+    Fresh fist state only matters when a hand can actually touch something:
+    a target, power-up or obstacle during play, or a menu button. The pose
+    hand points are tested against those regions (grown by ``margin``) in
+    one vectorized pass. Away from every region, hands are refreshed only
+    every ``min_refresh_interval`` seconds and the last state is reused (or
+    predicted) in between.
+    """
+
+    def __init__(self, margin=150, min_refresh_interval=0.25, min_visibility=0.3):
+        """
+        Args:
+            margin: Extra distance in screen pixels around every region
+            min_refresh_interval: Maximum age of the hand state (seconds)
+            min_visibility: Minimum pose visibility for a hand point to count
+        """
+        self.margin = margin
+        self.min_refresh_interval = min_refresh_interval
+        self.min_visibility = min_visibility
+
+        self._circles = np.zeros((0, 3), dtype=np.float64)
+        self._rects = np.zeros((0, 4), dtype=np.float64)
+        self._last_refresh = None
+
+        # Counters
+        self.frames_checked = 0
+        self.frames_gated = 0
+
+    def set_regions(self, circles=(), rects=()):
+        """
+        Set the interactive regions for the current frame.
+
+        Args:
+            circles: Iterable of (x, y, radius) in screen pixels
+            rects: Iterable of pygame.Rect or (x, y, w, h) in screen pixels
+        """
+        self._circles = np.array(list(circles), dtype=np.float64).reshape(-1, 3)
+        self._rects = np.array([tuple(r) for r in rects],
+                               dtype=np.float64).reshape(-1, 4)
+
+    def needs_hands(self, pose_landmarks, screen_width, screen_height, now):
+        """
+        Decide whether Hands should run on this frame.
+
+        Args:
+            pose_landmarks: Latest pose landmarks (normalized) or None
+            screen_width: Screen width the regions are expressed in
+            screen_height: Screen height the regions are expressed in
+            now: Current time in seconds
+
+        Returns:
+            bool: True if fresh hand inference is needed
+        """
+        self.frames_checked += 1
+        if self._last_refresh is None or \
+                now - self._last_refresh >= self.min_refresh_interval:
+            return self._refresh(now)
+
+        pose = landmarks_to_array(pose_landmarks)
+        if pose is None:
+            # Tanpa pose tidak bisa menilai relevansi: jalankan saja
+            return self._refresh(now)
+
+        points = pose[list(HAND_POSE_POINTS)]
+        points = points[points[:, 3] >= self.min_visibility, :2]
+        if len(points) == 0:
+            return self._refresh(now)
+        points = points * (screen_width, screen_height)
+
+        if self._near_regions(points):
+            return self._refresh(now)
+
+        self.frames_gated += 1
+        return False
+
+    def _near_regions(self, points):
+        """Whether any point is within ``margin`` of any region."""
+        if len(self._circles):
+            delta = points[:, None, :] - self._circles[None, :, :2]
+            dist_sq = np.einsum('ijk,ijk->ij', delta, delta)
+            reach = self._circles[:, 2] + self.margin
+            if np.any(dist_sq <= reach * reach):
+                return True
+
+        if len(self._rects):
+            x0 = self._rects[:, 0] - self.margin
+            y0 = self._rects[:, 1] - self.margin
+            x1 = self._rects[:, 0] + self._rects[:, 2] + self.margin
+            y1 = self._rects[:, 1] + self._rects[:, 3] + self.margin
+            px = points[:, 0:1]
+            py = points[:, 1:2]
+            inside = (px >= x0) & (px <= x1) & (py >= y0) & (py <= y1)
+            if np.any(inside):
+                return True
+        return False
+
+    def _refresh(self, now):
+        self._last_refresh = now
+        return True
+
+    def get_stats(self) -> dict:
+        """Return gate counters."""
+        return {
+            'checked': self.frames_checked,
+            'gated': self.frames_gated,
+        }
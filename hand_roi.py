@@ -0,0 +1,173 @@
+"""
+Hand ROI Module
+Runs MediaPipe Hands on small crops around the hands located by the Pose model.
+"""
+
+import numpy as np
+
+from landmarks import (PoseLandmark, LandmarkList, Handedness, HandsResult,
+                       landmarks_to_array)
+
+
+# Pose landmark indices used to place the crops
+POSE_HAND_POINTS = {
+    'left': {'elbow': PoseLandmark.LEFT_ELBOW, 'wrist': PoseLandmark.LEFT_WRIST,
+             'hand': (PoseLandmark.LEFT_PINKY, PoseLandmark.LEFT_INDEX,
+                      PoseLandmark.LEFT_THUMB)},
+    'right': {'elbow': PoseLandmark.RIGHT_ELBOW, 'wrist': PoseLandmark.RIGHT_WRIST,
+              'hand': (PoseLandmark.RIGHT_PINKY, PoseLandmark.RIGHT_INDEX,
+                       PoseLandmark.RIGHT_THUMB)},
+}
+
+
+class HandRoiCropper:
+    """
+    Pose-guided hand inference.
+
+    Both hands are cut out of the frame as square crops centred on the pose
+    hand landmarks, resized into two tiles of one small canvas and passed to
+    a single Hands graph call. Detected landmarks are mapped back into
+    full-frame normalized coordinates, so callers get the same result shape
+    as running Hands on the whole frame.
+    """
+
+    def __init__(self, hands, tile_size=192, min_visibility=0.3,
+                 crop_scale=2.2, min_crop_px=64):
+        """
+        Args:
+            hands: A dedicated mp.solutions.hands.Hands instance (max 2 hands)
+            tile_size: Side of each square tile in pixels
+            min_visibility: Minimum pose wrist visibility to place a crop
+            crop_scale: Crop side relative to the wrist-to-hand distance
+                        (or the forearm length, whichever is larger after
+                        scaling)
+            min_crop_px: Smallest crop side in frame pixels
+        """
+        self.hands = hands
+        self.tile_size = tile_size
+        self.min_visibility = min_visibility
+        self.crop_scale = crop_scale
+        self.min_crop_px = min_crop_px
+
+        # Canvas tetap (2 tile berdampingan) agar tracking Hands stabil
+        self._canvas = np.zeros((tile_size, tile_size * 2, 3), dtype=np.uint8)
+        self._tile = np.empty((tile_size, tile_size, 3), dtype=np.uint8)
+
+    def compute_rois(self, pose_array, frame_width, frame_height):
+        """
+        Square crop boxes around both hands.
+
+        Args:
+            pose_array: (33, 4) normalized pose landmarks
+            frame_width: Frame width in pixels
+            frame_height: Frame height in pixels
+
+        Returns:
+            list: [(x0, y0, side) or None] for the left and right tile
+        """
+        rois = []
+        scale = np.array([frame_width, frame_height], dtype=np.float32)
+        max_side = min(frame_width, frame_height)
+
+        for side in ('left', 'right'):
+            idx = POSE_HAND_POINTS[side]
+            wrist = pose_array[idx['wrist']]
+            if wrist[3] < self.min_visibility:
+                rois.append(None)
+                continue
+
+            wrist_px = wrist[:2] * scale
+            hand_px = pose_array[list(idx['hand']), :2] * scale
+            elbow_px = pose_array[idx['elbow'], :2] * scale
+
+            # Pusat sedikit ke arah jari, ukuran dari panjang tangan/lengan
+            hand_center = hand_px.mean(axis=0)
+            center = (wrist_px + hand_center) / 2.0
+            hand_len = np.linalg.norm(hand_center - wrist_px)
+            forearm_len = np.linalg.norm(wrist_px - elbow_px)
+            side_px = max(self.crop_scale * 2.0 * hand_len,
+                          0.9 * forearm_len, self.min_crop_px)
+            side_px = int(min(side_px, max_side))
+
+            x0 = int(round(center[0] - side_px / 2))
+            y0 = int(round(center[1] - side_px / 2))
+            x0 = max(0, min(x0, frame_width - side_px))
+            y0 = max(0, min(y0, frame_height - side_px))
+            rois.append((x0, y0, side_px))
+
+        return rois
+
+    def detect(self, frame_rgb, pose_landmarks):
+        """
+        Run hand inference on pose-guided crops.
+
+        Args:
+            frame_rgb: Full RGB frame
+            pose_landmarks: Pose landmarks (protobuf or LandmarkList)
+
+        Returns:
+            HandsResult with full-frame normalized landmarks, or None when no
+            crop could be placed (caller should fall back to the full frame)
+        """
+        pose_array = landmarks_to_array(pose_landmarks)
+        if pose_array is None:
+            return None
+
+        frame_h, frame_w = frame_rgb.shape[:2]
+        rois = self.compute_rois(pose_array, frame_w, frame_h)
+        if not any(rois):
+            return None
+
+        import cv2  # Dimuat bersama MediaPipe, bukan saat import modul
+
+        ts = self.tile_size
+        for i, roi in enumerate(rois):
+            tile_view = self._canvas[:, i * ts:(i + 1) * ts]
+            if roi is None:
+                tile_view[...] = 0
+                continue
+            x0, y0, side = roi
+            cv2.resize(frame_rgb[y0:y0 + side, x0:x0 + side], (ts, ts),
+                       dst=self._tile, interpolation=cv2.INTER_AREA)
+            tile_view[...] = self._tile
+
+        results = self.hands.process(self._canvas)
+        if not results.multi_hand_landmarks:
+            return HandsResult()
+
+        # Satu tangan per tile: simpan deteksi dengan skor tertinggi
+        best = {}
+        for hand_lms, handed in zip(results.multi_hand_landmarks,
+                                    results.multi_handedness):
+            arr = landmarks_to_array(hand_lms)
+            tile = 0 if arr[0, 0] < 0.5 else 1
+            if rois[tile] is None:
+                continue
+            cls = handed.classification[0]
+            if tile not in best or cls.score > best[tile][2]:
+                best[tile] = (arr, cls.label, cls.score)
+
+        hand_landmarks = []
+        handedness = []
+        for tile, (arr, label, score) in sorted(best.items()):
+            x0, y0, side = rois[tile]
+            mapped = arr.copy()
+            # Canvas-normalized → tile-normalized → full-frame normalized
+            mapped[:, 0] = (x0 + (arr[:, 0] * 2.0 - tile) * side) / frame_w
+            mapped[:, 1] = (y0 + arr[:, 1] * side) / frame_h
+            mapped[:, 2] = arr[:, 2] * 2.0 * side / frame_w
+            hand_landmarks.append(LandmarkList(mapped))
+            handedness.append((label, score))
+
+        # Dua tile dengan label sama: yang skornya lebih rendah dibalik
+        if len(handedness) == 2 and handedness[0][0] == handedness[1][0]:
+            weaker = 0 if handedness[0][1] < handedness[1][1] else 1
+            label = handedness[weaker][0]
+            handedness[weaker] = ('Right' if label == 'Left' else 'Left',
+                                  handedness[weaker][1])
+
+        return HandsResult(hand_landmarks,
+                           [Handedness(label, score) for label, score in handedness])
+
+    def close(self):
+        self.hands.close()
@@ -0,0 +1,417 @@
+"""
+Headless Runner Module
+Runs GameEngine sessions without display, audio or camera, driven by
+scripted or recorded landmark streams, across a process pool.
+
+Usage:
+    python headless_runner.py --sessions 200 --duration 120 --script chaser
+    python headless_runner.py --recording session.npz --sessions 50
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from game_engine import GameEngine
+from game_objects import GameObject
+from landmarks import PoseLandmark, LandmarkList
+from spawn_manager import SpawnManager
+
+SCRIPTS = ('idle', 'chaser')
+
+
+class SilentSoundManager:
+    """Sound manager stand-in that only counts the sounds requested."""
+
+    def __init__(self):
+        self.played = {}
+
+    def play_sound(self, sound_name):
+        self.played[sound_name] = self.played.get(sound_name, 0) + 1
+
+    def cleanup(self):
+        pass
+
+
+def hand_state(position, is_fist):
+    """One hand entry in the PoseDetector.get_hand_info format."""
+    return {
+        'position': position,
+        'is_fist': is_fist,
+        'gesture': 'fist' if is_fist else 'open',
+        'predicted': False,
+    }
+
+
+class ScriptedPlayer:
+    """
+    Synthetic player producing a pose and hand info every tick.
+
+    ``idle`` stands still with open hands. ``chaser`` reacts to the game
+    state like a player would: the right fist moves to the nearest target,
+    the left hand blocks the nearest obstacle with a fist (or grabs a
+    power-up with an open hand) and the head steps away from obstacles.
+    Hand speed and aim jitter are drawn per session from the seeded RNG, so
+    sessions differ in skill but replay identically for the same seed.
+    """
+
+    HEAD_RADIUS_EARS = 30      # Setengah jarak telinga (px)
+    SHOULDER_OFFSET = (110, 110)
+    HIP_OFFSET = (70, 330)
+    DODGE_DISTANCE = 250
+    BLOCK_DISTANCE = 300
+    LEFT_HAND_POINTS = [PoseLandmark.LEFT_WRIST, PoseLandmark.LEFT_PINKY,
+                        PoseLandmark.LEFT_INDEX, PoseLandmark.LEFT_THUMB]
+    RIGHT_HAND_POINTS = [PoseLandmark.RIGHT_WRIST, PoseLandmark.RIGHT_PINKY,
+                         PoseLandmark.RIGHT_INDEX, PoseLandmark.RIGHT_THUMB]
+
+    def __init__(self, script, rng, screen_width, screen_height):
+        """
+        Args:
+            script: 'idle' or 'chaser'
+            rng: numpy Generator seeded for this session
+            screen_width: Play field width in pixels
+            screen_height: Play field height in pixels
+        """
+        self.script = script
+        self.rng = rng
+        self.width = screen_width
+        self.height = screen_height
+
+        self.home = np.array([screen_width / 2, screen_height * 0.3])
+        self.head = self.home.copy()
+        self.left = self.home + (-120, 300)
+        self.right = self.home + (120, 300)
+
+        self.hand_speed = rng.uniform(400, 1400)   # px/s
+        self.head_speed = rng.uniform(200, 600)
+        self.jitter = rng.uniform(2, 12)           # px
+
+        # Posisi landmark relatif terhadap kepala (lengan diisi per tick)
+        shoulder_dx, shoulder_dy = self.SHOULDER_OFFSET
+        hip_dx, hip_dy = self.HIP_OFFSET
+        template = np.zeros((33, 2), dtype=np.float64)
+        template[PoseLandmark.LEFT_EAR] = (-self.HEAD_RADIUS_EARS, 0)
+        template[PoseLandmark.RIGHT_EAR] = (self.HEAD_RADIUS_EARS, 0)
+        template[PoseLandmark.LEFT_SHOULDER] = (-shoulder_dx, shoulder_dy)
+        template[PoseLandmark.RIGHT_SHOULDER] = (shoulder_dx, shoulder_dy)
+        template[PoseLandmark.LEFT_HIP:] = (0, hip_dy)
+        template[PoseLandmark.LEFT_HIP] = (-hip_dx, hip_dy)
+        template[PoseLandmark.RIGHT_HIP] = (hip_dx, hip_dy)
+        self._template = template
+        self._scale = np.array([1.0 / screen_width, 1.0 / screen_height])
+        self._array = np.ones((33, 4), dtype=np.float32)
+        self._array[:, 2] = 0.0
+
+    @staticmethod
+    def _nearest(objects, point):
+        best, best_dist = None, None
+        for obj in objects:
+            if not obj.active:
+                continue
+            dist = np.hypot(obj.x - point[0], obj.y - point[1])
+            if best is None or dist < best_dist:
+                best, best_dist = obj, dist
+        return best, best_dist
+
+    @staticmethod
+    def _move(current, goal, max_step):
+        delta = goal - current
+        dist = np.hypot(*delta)
+        if dist <= max_step:
+            return goal.astype(np.float64)
+        return current + delta * (max_step / dist)
+
+    def step(self, engine, dt):
+        """
+        Advance the player by one tick.
+
+        Returns:
+            tuple: (LandmarkList, hand_info)
+        """
+        left_fist = right_fist = False
+        if self.script == 'chaser':
+            left_fist, right_fist = self._react(engine, dt)
+
+        noise = self.rng.normal(0.0, self.jitter, size=(2, 2))
+        left = self.left + noise[0]
+        right = self.right + noise[1]
+        hand_info = {
+            'left_hand': hand_state((int(left[0]), int(left[1])), left_fist),
+            'right_hand': hand_state((int(right[0]), int(right[1])), right_fist),
+        }
+        return self._pose(left, right), hand_info
+
+    def _react(self, engine, dt):
+        hand_step = self.hand_speed * dt
+
+        target, _ = self._nearest(engine.targets, self.right)
+        goal = np.array([target.x, target.y]) if target else self.home + (120, 300)
+        self.right = self._move(self.right, goal, hand_step)
+        right_fist = target is not None and \
+            np.hypot(*(goal - self.right)) < target.radius * 1.5
+
+        obstacle, obstacle_dist = self._nearest(engine.obstacles, self.head)
+        powerup, _ = self._nearest(engine.powerups, self.left)
+        left_fist = False
+        if obstacle is not None and obstacle_dist < self.BLOCK_DISTANCE:
+            goal = np.array([obstacle.x, obstacle.y])
+            left_fist = True
+        elif powerup is not None:
+            goal = np.array([powerup.x, powerup.y])
+        else:
+            goal = self.home + (-120, 300)
+        self.left = self._move(self.left, goal, hand_step)
+
+        # Menghindar: geser kepala menjauhi obstacle terdekat
+        head_goal = self.home
+        if obstacle is not None and obstacle_dist < self.DODGE_DISTANCE:
+            away = -1.0 if obstacle.x > self.head[0] else 1.0
+            head_goal = self.home + (away * self.DODGE_DISTANCE, 0)
+        self.head = self._move(self.head, head_goal, self.head_speed * dt)
+        return left_fist, right_fist
+
+    def _pose(self, left, right):
+        """33 normalized landmarks around the head and hand positions."""
+        points = self._template + self.head
+        left_shoulder = points[PoseLandmark.LEFT_SHOULDER]
+        right_shoulder = points[PoseLandmark.RIGHT_SHOULDER]
+        points[PoseLandmark.LEFT_ELBOW] = (left_shoulder + left) / 2 + (0, 30)
+        points[PoseLandmark.RIGHT_ELBOW] = (right_shoulder + right) / 2 + (0, 30)
+        points[self.LEFT_HAND_POINTS] = left
+        points[self.RIGHT_HAND_POINTS] = right
+
+        self._array[:, :2] = points * self._scale
+        return LandmarkList(self._array.copy())
+
+
+class RecordedPlayer:
+    """
+    Replays a recorded landmark stream.
+
+    The recording is an ``.npz`` file with ``pose``: (T, 33, 4) normalized
+    landmarks and optional ``left_fist`` / ``right_fist``: (T,) booleans.
+    Hand positions are the pose index fingers. The stream loops if the
+    session is longer than the recording.
+    """
+
+    def __init__(self, path, screen_width, screen_height):
+        data = np.load(path)
+        self.pose = np.asarray(data['pose'], dtype=np.float32)
+        count = len(self.pose)
+        self.left_fist = np.asarray(data['left_fist'], dtype=bool) \
+            if 'left_fist' in data else np.zeros(count, dtype=bool)
+        self.right_fist = np.asarray(data['right_fist'], dtype=bool) \
+            if 'right_fist' in data else np.zeros(count, dtype=bool)
+        self.width = screen_width
+        self.height = screen_height
+        self.index = 0
+
+    def step(self, engine, dt):
+        i = self.index % len(self.pose)
+        self.index += 1
+        pose = self.pose[i]
+        hands = {}
+        for key, landmark_id, fists in (
+                ('left_hand', PoseLandmark.LEFT_INDEX, self.left_fist),
+                ('right_hand', PoseLandmark.RIGHT_INDEX, self.right_fist)):
+            x, y, _, visibility = pose[landmark_id]
+            position = (int(x * self.width), int(y * self.height)) \
+                if visibility > 0.5 else None
+            hands[key] = hand_state(position, bool(fists[i]))
+        return LandmarkList(pose), hands
+
+
+def run_session(config):
+    """
+    Play one session to game over or until ``duration`` runs out.
+
+    Module-level so it can be sent to a worker process.
+
+    Args:
+        config: dict with seed, script, recording, duration, dt, screen_size
+                and optional pose_every (the engine sees a new pose sample
+                every N ticks, like a slower camera), continuous
+                (continuous collision, default True) and broadphase
+                (spatial hash broadphase, default True)
+
+    Returns:
+        dict: Final score stats, survived time and per-tick durations (ns)
+    """
+    # Tanpa display: objek game pakai gambar fallback
+    GameObject.load_images = False
+    seed = config['seed']
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+
+    width, height = config['screen_size']
+    sounds = SilentSoundManager()
+    engine = GameEngine(None, None, None, SpawnManager(width, height),
+                        sound_manager=sounds, screen_size=(width, height),
+                        continuous_collision=config.get('continuous', True),
+                        broadphase=config.get('broadphase', True))
+    if config.get('recording'):
+        player = RecordedPlayer(config['recording'], width, height)
+    else:
+        player = ScriptedPlayer(config['script'], rng, width, height)
+
+    dt = config['dt']
+    pose_every = max(1, config.get('pose_every', 1))
+    max_ticks = int(round(config['duration'] / dt))
+    tick_ns = np.empty(max_ticks, dtype=np.int64)
+    ticks = 0
+    score_manager = engine.score_manager
+    landmarks = hand_info = None
+    while ticks < max_ticks and not score_manager.game_over:
+        # Pemain terus bergerak; engine hanya melihat sampel tiap pose_every tick
+        sample = player.step(engine, dt)
+        if ticks % pose_every == 0:
+            landmarks, hand_info = sample
+        start = time.perf_counter_ns()
+        engine.update(dt, landmarks, hand_info)
+        tick_ns[ticks] = time.perf_counter_ns() - start
+        ticks += 1
+
+    return {
+        'seed': seed,
+        'score': score_manager.score,
+        'targets_hit': score_manager.targets_hit,
+        'max_punch_speed': score_manager.max_punch_speed,
+        'lives': score_manager.lives,
+        'game_over': score_manager.game_over,
+        'survived_s': round(ticks * dt, 3),
+        'sounds': sounds.played,
+        'tick_ns': tick_ns[:ticks],
+    }
+
+
+def run_sessions(configs, workers=None):
+    """
+    Run sessions on a process pool (inline when ``workers`` is 1).
+
+    Returns:
+        tuple: (list of session results in config order, wall seconds)
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    if workers == 1:
+        results = [run_session(config) for config in configs]
+    else:
+        chunksize = max(1, len(configs) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(run_session, configs, chunksize=chunksize))
+    return results, time.perf_counter() - start
+
+
+def _distribution(values):
+    values = np.asarray(values, dtype=np.float64)
+    p5, p25, p50, p75, p95 = np.percentile(values, (5, 25, 50, 75, 95))
+    return {
+        'mean': round(float(values.mean()), 2),
+        'min': round(float(values.min()), 2),
+        'p5': round(float(p5), 2),
+        'p25': round(float(p25), 2),
+        'p50': round(float(p50), 2),
+        'p75': round(float(p75), 2),
+        'p95': round(float(p95), 2),
+        'max': round(float(values.max()), 2),
+    }
+
+
+def summarize(results, wall_seconds):
+    """Aggregate session results into a report dict."""
+    ticks = np.concatenate([r['tick_ns'] for r in results]) / 1000.0
+    simulated = sum(r['survived_s'] for r in results)
+    p50, p95, p99 = np.percentile(ticks, (50, 95, 99)) if len(ticks) else (0, 0, 0)
+    return {
+        'sessions': len(results),
+        'wall_s': round(wall_seconds, 3),
+        'sessions_per_s': round(len(results) / wall_seconds, 2),
+        'simulated_s_per_s': round(simulated / wall_seconds, 1),
+        'game_over_rate': round(sum(r['game_over'] for r in results) / len(results), 3),
+        'score': _distribution([r['score'] for r in results]),
+        'targets_hit': _distribution([r['targets_hit'] for r in results]),
+        'max_punch_speed': _distribution([r['max_punch_speed'] for r in results]),
+        'survived_s': _distribution([r['survived_s'] for r in results]),
+        'tick_us': {
+            'count': int(len(ticks)),
+            'mean': round(float(ticks.mean()), 2) if len(ticks) else 0.0,
+            'p50': round(float(p50), 2),
+            'p95': round(float(p95), 2),
+            'p99': round(float(p99), 2),
+            'max': round(float(ticks.max()), 2) if len(ticks) else 0.0,
+        },
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Cam-Fu - simulasi GameEngine tanpa layar")
+    parser.add_argument('--sessions', type=int, default=100)
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Jumlah proses (default: jumlah CPU, 1 = tanpa pool)")
+    parser.add_argument('--duration', type=float, default=120.0,
+                        help="Batas lama satu sesi (detik simulasi)")
+    parser.add_argument('--tick-rate', type=float, default=60.0,
+                        help="Tick simulasi per detik (dt tetap)")
+    parser.add_argument('--script', choices=SCRIPTS, default='chaser')
+    parser.add_argument('--recording', default=None,
+                        help="File .npz berisi stream landmark (menggantikan --script)")
+    parser.add_argument('--seed', type=int, default=0,
+                        help="Seed sesi pertama; sesi ke-i memakai seed + i")
+    parser.add_argument('--pose-every', type=int, default=1,
+                        help="Engine menerima sampel pose tiap N tick (kamera lambat)")
+    parser.add_argument('--discrete-collision', action='store_true',
+                        help="Tes tabrakan hanya di sampel pose saat ini (tanpa sapuan)")
+    parser.add_argument('--no-broadphase', action='store_true',
+                        help="Tes tabrakan terhadap semua objek (tanpa spatial hash)")
+    parser.add_argument('--size', default='1280x720',
+                        help="Ukuran arena, mis. 1280x720")
+    parser.add_argument('--json', default=None, metavar='PATH',
+                        help="Simpan laporan sebagai JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    width, height = (int(v) for v in args.size.lower().split('x'))
+    configs = [{
+        'seed': args.seed + i,
+        'script': args.script,
+        'recording': args.recording,
+        'duration': args.duration,
+        'dt': 1.0 / args.tick_rate,
+        'screen_size': (width, height),
+        'pose_every': args.pose_every,
+        'continuous': not args.discrete_collision,
+        'broadphase': not args.no_broadphase,
+    } for i in range(args.sessions)]
+
+    results, wall = run_sessions(configs, args.workers)
+    report = summarize(results, wall)
+
+    print(f"Sesi: {report['sessions']} dalam {report['wall_s']} s "
+          f"({report['sessions_per_s']} sesi/s, "
+          f"{report['simulated_s_per_s']} detik simulasi/s)")
+    print(f"Game over: {report['game_over_rate'] * 100:.0f}% sesi")
+    for key in ('score', 'targets_hit', 'max_punch_speed', 'survived_s'):
+        d = report[key]
+        print(f"{key:<16} mean {d['mean']:>8}  p5 {d['p5']:>8}  p50 {d['p50']:>8}  "
+              f"p95 {d['p95']:>8}  max {d['max']:>8}")
+    t = report['tick_us']
+    print(f"Tick GameEngine.update: p50 {t['p50']} us, p95 {t['p95']} us, "
+          f"p99 {t['p99']} us, max {t['max']} us ({t['count']} tick)")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Laporan disimpan ke {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,266 @@
+"""
+Inference Scheduler Module
+Decides when Pose and Hands inference run, and predicts landmarks in between.
+"""
+
+import math
+
+import numpy as np
+
+from landmarks import LandmarkList, landmarks_to_array
+
+
+class VelocityPredictor:
+    """
+    Constant-velocity extrapolator over a whole landmark array.
+
+    Velocity is the exponentially smoothed finite difference between
+    measurements; predictions start from the last measurement so a freshly
+    inferred result and the frames that follow it line up without a jump.
+    Every coordinate is tracked independently but updated in one vectorized
+    step, so a 33-point pose costs the same Python overhead as a single point.
+    """
+
+    def __init__(self, smoothing=0.6, max_horizon=0.25, damping=2.0):
+        """
+        Args:
+            smoothing: Weight of the newest velocity sample (1.0 = no smoothing)
+            max_horizon: Never extrapolate further than this many seconds
+            damping: Velocity decay rate (1/s) applied to extrapolation
+        """
+        self.smoothing = smoothing
+        self.max_horizon = max_horizon
+        self.damping = damping
+        self.reset()
+
+    def reset(self):
+        self.position = None
+        self.velocity = None
+        self.time = None
+
+    def update(self, measurement, t):
+        """
+        Add a new measurement.
+
+        Args:
+            measurement: Array of coordinates (any shape, constant per track)
+            t: Measurement time in seconds
+        """
+        measurement = np.array(measurement, dtype=np.float32)
+        if self.position is None or self.position.shape != measurement.shape:
+            self.velocity = np.zeros_like(measurement)
+        else:
+            dt = t - self.time
+            if dt > 0:
+                sample = (measurement - self.position) / dt
+                self.velocity += self.smoothing * (sample - self.velocity)
+        self.position = measurement
+        self.time = t
+
+    def predict(self, t):
+        """
+        Extrapolate the last measurement to time ``t``.
+
+        Returns:
+            numpy.ndarray or None if nothing has been measured yet
+        """
+        if self.position is None:
+            return None
+        dt = min(max(0.0, t - self.time), self.max_horizon)
+        # Integral of v * exp(-k t): gerakan melambat saat prediksi makin jauh
+        if self.damping > 0:
+            travel = (1.0 - math.exp(-self.damping * dt)) / self.damping
+        else:
+            travel = dt
+        return self.position + self.velocity * travel
+
+
+class InferenceScheduler:
+    """
+    Independent cadence for Pose and Hands inference.
+
+    Two modes:
+        - fixed: run each model every N-th frame (``pose_interval`` /
+          ``hands_interval``)
+        - budget: with ``budget_ms`` set, each model's interval is derived
+          from its measured cost so that average inference time per rendered
+          frame stays within the budget (split evenly between the models)
+
+    On frames where a model does not run, results are predicted from the
+    recent history with a VelocityPredictor. Every result carries a
+    ``predicted`` flag; otherwise inferred and predicted results look the same.
+    """
+
+    STAGES = ('pose', 'hands')
+    HANDS = ('left_hand', 'right_hand')
+
+    def __init__(self, pose_interval=1, hands_interval=1, budget_ms=None,
+                 max_interval=4):
+        """
+        Args:
+            pose_interval: Run Pose every N-th frame (fixed mode)
+            hands_interval: Run Hands every N-th frame (fixed mode)
+            budget_ms: Average inference time allowed per frame (budget mode)
+            max_interval: Upper bound for adaptive intervals
+        """
+        self.intervals = {'pose': max(1, pose_interval),
+                          'hands': max(1, hands_interval)}
+        self.budget_ms = budget_ms
+        self.max_interval = max(1, max_interval)
+
+        self.frame_index = 0
+        self._next_due = {'pose': 0, 'hands': 0}
+        self.cost_ms = {'pose': None, 'hands': None}
+
+        self.pose_predictor = VelocityPredictor()
+        self.hand_predictors = {hand: VelocityPredictor() for hand in self.HANDS}
+        self._last_hand_info = None
+        self._pose_visibility = None
+        self._hands_wanted = False
+
+        # Counters
+        self.inferred = {'pose': 0, 'hands': 0}
+        self.predicted = {'pose': 0, 'hands': 0}
+
+    def plan(self, with_hands=True):
+        """
+        Decide which models run on the current frame.
+
+        Args:
+            with_hands: Whether the caller needs hand results at all
+
+        Returns:
+            tuple: (run_pose, run_hands)
+        """
+        self.frame_index += 1
+        if with_hands and not self._hands_wanted:
+            # Hands baru dibutuhkan lagi: jalankan segera, jangan prediksi data lama
+            self._next_due['hands'] = self.frame_index
+        self._hands_wanted = with_hands
+
+        run_pose = self._due('pose')
+        run_hands = with_hands and self._due('hands')
+        return run_pose, run_hands
+
+    def _due(self, stage):
+        if self.frame_index < self._next_due[stage]:
+            return False
+        self._next_due[stage] = self.frame_index + self._interval(stage)
+        return True
+
+    def _interval(self, stage):
+        if self.budget_ms is None or self.cost_ms[stage] is None:
+            return self.intervals[stage]
+        share = self.budget_ms / len(self.STAGES)
+        interval = math.ceil(self.cost_ms[stage] / max(share, 1e-3))
+        self.intervals[stage] = max(1, min(interval, self.max_interval))
+        return self.intervals[stage]
+
+    def record_cost(self, stage, seconds):
+        """Feed a measured inference time (EMA) for the budget mode."""
+        ms = seconds * 1000.0
+        if self.cost_ms[stage] is None:
+            self.cost_ms[stage] = ms
+        else:
+            self.cost_ms[stage] += 0.1 * (ms - self.cost_ms[stage])
+
+    # === POSE ===
+
+    def pose_result(self, landmarks, fresh, now):
+        """
+        Resolve the pose for this frame.
+
+        Args:
+            landmarks: Inferred landmarks (only meaningful when fresh)
+            fresh: Whether Pose actually ran for this frame
+            now: Frame time in seconds
+
+        Returns:
+            LandmarkList with a ``predicted`` flag, or None
+        """
+        if fresh:
+            self.inferred['pose'] += 1
+            array = landmarks_to_array(landmarks)
+            if array is None:
+                self.pose_predictor.reset()
+                return None
+            self.pose_predictor.update(array[:, :3], now)
+            self._pose_visibility = array[:, 3].copy()
+            result = LandmarkList(array)
+            result.predicted = False
+            return result
+
+        predicted = self.pose_predictor.predict(now)
+        if predicted is None:
+            return None
+        self.predicted['pose'] += 1
+        array = np.empty((len(predicted), 4), dtype=np.float32)
+        array[:, :3] = predicted
+        array[:, 3] = self._pose_visibility
+        result = LandmarkList(array)
+        result.predicted = True
+        return result
+
+    # === HANDS ===
+
+    def hands_result(self, hand_info, fresh, now, frame_width, frame_height):
+        """
+        Resolve the hand info for this frame.
+
+        Fist state and gesture are carried over from the last inference;
+        positions and landmarks are extrapolated.
+
+        Args:
+            hand_info: Inferred hand info dict (only meaningful when fresh)
+            fresh: Whether Hands actually ran for this frame
+            now: Frame time in seconds
+            frame_width: Width used for hand positions
+            frame_height: Height used for hand positions
+
+        Returns:
+            dict: Hand info with a 'predicted' flag per hand
+        """
+        if fresh:
+            self.inferred['hands'] += 1
+            for hand in self.HANDS:
+                info = hand_info[hand]
+                info['predicted'] = False
+                array = landmarks_to_array(info['landmarks'])
+                if array is None:
+                    self.hand_predictors[hand].reset()
+                else:
+                    self.hand_predictors[hand].update(array[:, :3], now)
+            self._last_hand_info = hand_info
+            return hand_info
+
+        if self._last_hand_info is None:
+            return hand_info
+
+        self.predicted['hands'] += 1
+        result = {}
+        for hand in self.HANDS:
+            last = self._last_hand_info[hand]
+            predicted = self.hand_predictors[hand].predict(now)
+            if predicted is None:
+                result[hand] = dict(last, predicted=True)
+                continue
+            wrist = predicted[0]
+            landmarks = LandmarkList(predicted)
+            landmarks.predicted = True
+            result[hand] = {
+                'position': (int(wrist[0] * frame_width), int(wrist[1] * frame_height)),
+                'is_fist': last['is_fist'],
+                'gesture': last.get('gesture', 'none'),
+                'landmarks': landmarks,
+                'predicted': True,
+            }
+        return result
+
+    def get_stats(self) -> dict:
+        """Return cadence and counters."""
+        return {
+            'pose_interval': self.intervals['pose'],
+            'hands_interval': self.intervals['hands'],
+            'inferred': dict(self.inferred),
+            'predicted': dict(self.predicted),
+        }
@@ -0,0 +1,421 @@
+"""
+Inference Server Module
+Runs MediaPipe Pose and Hands in a separate process.
+
+Frames travel through a ring of slots in ``multiprocessing.shared_memory``
+(pixel data is never pickled); only a small request tuple goes down the
+pipe and compact landmark arrays come back. Requests are asynchronous, so
+the worker runs the models while the caller renders. If the worker
+process dies, the client restarts it (with a backoff) and carries on.
+"""
+
+import multiprocessing as mp_proc
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from landmarks import LandmarkList, Handedness, HandsResult
+
+
+# Default slot size fits a 1080p RGB frame
+DEFAULT_SLOT_BYTES = 1920 * 1080 * 3
+DEFAULT_SLOTS = 3
+
+
+def _server_main(conn, shm_name, slot_bytes, pose_kwargs, hands_kwargs):
+    """
+    Worker process entry point.
+
+    Owns the MediaPipe graphs and answers requests until 'close' arrives or
+    the pipe breaks.
+    """
+    import mediapipe as mp
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        pose = mp.solutions.pose.Pose(**pose_kwargs)
+        hands = mp.solutions.hands.Hands(**hands_kwargs)
+    except Exception as e:
+        # Graph gagal dibuat: laporkan ke client, jangan crash berulang
+        conn.send(('error', 0, str(e)))
+        shm.close()
+        return
+    conn.send(('ready', 0))
+
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+
+            if message[0] == 'close':
+                break
+
+            _, seq, slot, height, width, run_pose, run_hands = message
+            offset = slot * slot_bytes
+            frame = np.ndarray((height, width, 3), dtype=np.uint8,
+                               buffer=shm.buf, offset=offset)
+
+            pose_array = None
+            if run_pose:
+                result = pose.process(frame)
+                if result.pose_landmarks:
+                    pose_array = np.array(
+                        [(lm.x, lm.y, lm.z, lm.visibility)
+                         for lm in result.pose_landmarks.landmark],
+                        dtype=np.float32)
+
+            hand_arrays = []
+            hand_labels = []
+            if run_hands:
+                result = hands.process(frame)
+                if result.multi_hand_landmarks:
+                    for hand_lms, handed in zip(result.multi_hand_landmarks,
+                                                result.multi_handedness):
+                        hand_arrays.append(np.array(
+                            [(lm.x, lm.y, lm.z) for lm in hand_lms.landmark],
+                            dtype=np.float32))
+                        hand_labels.append(handed.classification[0].label)
+
+            # Lepas view ke shared memory sebelum frame berikutnya
+            del frame
+
+            try:
+                conn.send(('result', seq, pose_array,
+                           np.array(hand_arrays, dtype=np.float32).reshape(-1, 21, 3),
+                           hand_labels))
+            except (BrokenPipeError, OSError):
+                break
+    finally:
+        pose.close()
+        hands.close()
+        shm.close()
+
+
+class ServerResult:
+    """Decoded reply of the inference process for one request."""
+
+    __slots__ = ('seq', 'landmarks', 'hands_result', 'latency',
+                 'ran_pose', 'ran_hands', 'context')
+
+    def __init__(self, seq, landmarks, hands_result, latency,
+                 ran_pose=True, ran_hands=True, context=None):
+        """
+        Args:
+            seq: Request sequence number
+            landmarks: Pose LandmarkList or None
+            hands_result: HandsResult (empty if hands were not run)
+            latency: Seconds from submission until the reply arrived
+            ran_pose: Whether Pose was run for this request
+            ran_hands: Whether Hands was run for this request
+            context: Value passed to submit() for this request
+        """
+        self.seq = seq
+        self.landmarks = landmarks
+        self.hands_result = hands_result
+        self.latency = latency
+        self.ran_pose = ran_pose
+        self.ran_hands = ran_hands
+        self.context = context
+
+
+class InferenceClient:
+    """
+    Client side of the inference process.
+
+    Writes RGB frames into a shared-memory ring and exchanges small messages
+    with the worker over a pipe. ``submit()`` and ``collect()`` are
+    asynchronous: up to one request per ring slot is in flight, so the
+    caller renders while the worker runs the models, and frames are skipped
+    while the ring is full.
+
+    A worker that crashes, fails to build its graphs or stops answering is
+    restarted with an exponential backoff, and given up on after
+    ``MAX_RESTARTS`` failures in a row. While it is down or starting, the
+    last result is returned.
+    """
+
+    # Import mediapipe + membangun graph di proses baru bisa lama
+    STARTUP_TIMEOUT = 30.0
+    # Jeda sebelum restart: 0.5, 1, 2, 4, ... detik (maks 8)
+    RESTART_BACKOFF = 0.5
+    MAX_BACKOFF = 8.0
+    MAX_RESTARTS = 5
+
+    def __init__(self, pose_kwargs, hands_kwargs, slots=DEFAULT_SLOTS,
+                 slot_bytes=DEFAULT_SLOT_BYTES, timeout=2.0):
+        """
+        Args:
+            pose_kwargs: Keyword arguments for mp.solutions.pose.Pose
+            hands_kwargs: Keyword arguments for mp.solutions.hands.Hands
+            slots: Number of frame slots in the shared-memory ring
+            slot_bytes: Size of one slot (largest frame accepted)
+            timeout: Seconds to wait for a reply before restarting the worker
+        """
+        self.pose_kwargs = pose_kwargs
+        self.hands_kwargs = hands_kwargs
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        self.timeout = timeout
+
+        self.shm = None
+        self.conn = None
+        self.process = None
+        self._seq = 0
+        self._ready = False
+        self._started_at = None
+        # seq -> (slot, submit_time, run_pose, run_hands, context)
+        self._in_flight = {}
+        self._latest = None
+        self._failures = 0
+        self._next_restart = 0.0
+        self.gave_up = False
+
+        # Counters
+        self.frames_submitted = 0
+        self.frames_skipped = 0
+        self.restarts = 0
+
+        self._start()
+
+    def _start(self):
+        """Allocate the ring (if needed) and launch the worker process."""
+        if self.shm is None:
+            self.shm = shared_memory.SharedMemory(
+                create=True, size=self.slots * self.slot_bytes)
+
+        parent_conn, child_conn = mp_proc.Pipe()
+        self.conn = parent_conn
+        self.process = mp_proc.Process(
+            target=_server_main,
+            args=(child_conn, self.shm.name, self.slot_bytes,
+                  self.pose_kwargs, self.hands_kwargs),
+            name="InferenceServer", daemon=True)
+        self.process.start()
+        child_conn.close()
+        self._ready = False
+        self._started_at = time.perf_counter()
+
+    def _stop_process(self, graceful=True):
+        """Stop the worker process (politely first, then forcefully)."""
+        self._in_flight.clear()
+        if self.process is None:
+            return
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send(('close',))
+            except (BrokenPipeError, OSError):
+                pass
+            self.process.join(timeout=2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join(timeout=2.0)
+        self.conn.close()
+        self.process = None
+
+    def _fail(self, reason):
+        """Stop a broken worker and schedule its restart (with backoff)."""
+        self._stop_process(graceful=False)
+        self._failures += 1
+        if self._failures > self.MAX_RESTARTS:
+            if not self.gave_up:
+                print(f"[Error] Inference server gagal {self._failures}x berturut-turut "
+                      f"({reason}), tidak dimulai ulang lagi")
+            self.gave_up = True
+            return
+        delay = min(self.RESTART_BACKOFF * 2 ** (self._failures - 1), self.MAX_BACKOFF)
+        print(f"[Warning] Inference server berhenti ({reason}), "
+              f"mulai ulang dalam {delay:.1f} s...")
+        self._next_restart = time.perf_counter() + delay
+
+    def _check_worker(self):
+        """Detect a dead or hung worker and restart it once the backoff expired."""
+        now = time.perf_counter()
+        if self.process is not None:
+            if not self.process.is_alive():
+                self._fail("proses mati")
+            elif not self._ready and now - self._started_at > self.STARTUP_TIMEOUT:
+                self._fail("tidak siap")
+            elif self._ready and self._in_flight:
+                oldest = next(iter(self._in_flight.values()))
+                if now - oldest[1] > self.timeout:
+                    self._fail("tidak merespons")
+
+        if self.process is None and not self.gave_up and now >= self._next_restart:
+            self.restarts += 1
+            self._start()
+
+    def _resize_ring(self, frame_bytes):
+        """Grow the ring for frames larger than a slot (restarts the worker)."""
+        self._stop_process()
+        self.shm.close()
+        self.shm.unlink()
+        self.shm = None
+        self.slot_bytes = frame_bytes
+        self._start()
+
+    def submit(self, frame_rgb, run_pose=True, run_hands=True, context=None):
+        """
+        Send one RGB frame to the worker process without waiting.
+
+        Args:
+            frame_rgb: (H, W, 3) uint8 RGB image
+            run_pose: Run the Pose model
+            run_hands: Run the Hands model
+            context: Any value; handed back on the ServerResult
+
+        Returns:
+            int: Request sequence number, or None if the frame was skipped
+                 (ring full, or the worker is down)
+        """
+        self._poll()
+        self._check_worker()
+        if self.process is None or len(self._in_flight) >= self.slots:
+            self.frames_skipped += 1
+            return None
+
+        height, width = frame_rgb.shape[:2]
+        frame_bytes = height * width * 3
+        if frame_bytes > self.slot_bytes:
+            self._resize_ring(frame_bytes)
+
+        busy = {entry[0] for entry in self._in_flight.values()}
+        slot = next(i for i in range(self.slots) if i not in busy)
+        offset = slot * self.slot_bytes
+        dst = np.ndarray((height, width, 3), dtype=np.uint8,
+                         buffer=self.shm.buf, offset=offset)
+        dst[...] = frame_rgb
+        del dst
+
+        self._seq += 1
+        seq = self._seq
+        try:
+            self.conn.send(('frame', seq, slot, height, width, run_pose, run_hands))
+        except (BrokenPipeError, OSError):
+            self._fail("pipe putus")
+            self.frames_skipped += 1
+            return None
+        self._in_flight[seq] = (slot, time.perf_counter(), run_pose, run_hands, context)
+        self.frames_submitted += 1
+        return seq
+
+    def collect(self, wait_seq=None):
+        """
+        Read the replies that arrived and return the newest result.
+
+        Args:
+            wait_seq: Block until the reply to this request (or a newer one)
+                      arrived. Waits at most ``timeout`` seconds, or
+                      ``STARTUP_TIMEOUT`` while the first worker starts.
+                      None never blocks.
+
+        Returns:
+            ServerResult or None if no request has been answered yet
+        """
+        timeout = self.timeout
+        if not self._ready and self.restarts == 0:
+            timeout = self.STARTUP_TIMEOUT
+        deadline = time.perf_counter() + timeout
+        while True:
+            self._poll()
+            if wait_seq is None or wait_seq not in self._in_flight:
+                return self._latest
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                if self._ready or self.restarts == 0:
+                    self._fail("tidak merespons")
+                # Worker baru masih start: pakai hasil lama
+                return self._latest
+            try:
+                self.conn.poll(remaining)
+            except (EOFError, OSError):
+                self._fail("pipe putus")
+                return self._latest
+
+    def _poll(self):
+        """Handle every reply that is already waiting on the pipe."""
+        try:
+            while self.process is not None and self.conn.poll(0):
+                reply = self.conn.recv()
+                if reply[0] == 'error':
+                    self._fail(f"gagal: {reply[2]}")
+                    return
+                self._ready = True
+                if reply[0] == 'result':
+                    self._failures = 0
+                    self._store(reply)
+        except (EOFError, OSError):
+            self._fail("pipe putus")
+
+    def _store(self, reply):
+        """Decode a result reply and keep it if it is the newest."""
+        _, seq, pose_array, hand_arrays, hand_labels = reply
+        entry = self._in_flight.pop(seq, None)
+        if entry is None:
+            return
+        _, submit_time, run_pose, run_hands, context = entry
+        pose_landmarks = LandmarkList(pose_array) if pose_array is not None else None
+        hands_result = HandsResult(
+            [LandmarkList(arr) for arr in hand_arrays],
+            [Handedness(label) for label in hand_labels])
+        if self._latest is None or seq > self._latest.seq:
+            self._latest = ServerResult(
+                seq, pose_landmarks, hands_result,
+                time.perf_counter() - submit_time,
+                ran_pose=run_pose, ran_hands=run_hands, context=context)
+
+    def process_frame(self, frame_rgb, run_pose=True, run_hands=True):
+        """
+        Run inference on one RGB frame and wait for its result.
+
+        Args:
+            frame_rgb: (H, W, 3) uint8 RGB image
+            run_pose: Run the Pose model
+            run_hands: Run the Hands model
+
+        Returns:
+            tuple: (pose_landmarks, hands_result)
+                - pose_landmarks: LandmarkList or None
+                - hands_result: HandsResult (empty if hands were not run or
+                  the worker did not answer)
+        """
+        seq = self.submit(frame_rgb, run_pose=run_pose, run_hands=run_hands)
+        result = self.collect(wait_seq=seq) if seq is not None else None
+        if result is None or result.seq != seq:
+            return None, HandsResult()
+        return result.landmarks, result.hands_result
+
+    def wait_ready(self):
+        """
+        Block until the worker has built its graphs.
+
+        Raises:
+            RuntimeError: If the worker failed to start
+        """
+        if self._ready:
+            return
+        if not self.conn.poll(self.STARTUP_TIMEOUT):
+            raise RuntimeError("Inference server tidak merespons")
+        reply = self.conn.recv()
+        if reply[0] == 'error':
+            raise RuntimeError(reply[2])
+        self._ready = True
+
+    def get_stats(self) -> dict:
+        """Return client counters."""
+        return {
+            'submitted': self.frames_submitted,
+            'skipped': self.frames_skipped,
+            'in_flight': len(self._in_flight),
+            'restarts': self.restarts,
+        }
+
+    def close(self):
+        """Shut down the worker and free the shared memory."""
+        self._stop_process()
+        if self.shm is not None:
+            self.shm.close()
+            self.shm.unlink()
+            self.shm = None
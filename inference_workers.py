@@ -0,0 +1,279 @@
+"""
+Inference Workers Module
+Runs MediaPipe Pose and Hands on the same frame in parallel worker threads.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+
+class InferenceResult:
+    """Joined pose + hands result for one frame."""
+
+    __slots__ = ('seq', 'timestamp', 'landmarks', 'hand_info', 'latency',
+                 'ran_pose', 'ran_hands')
+
+    def __init__(self, seq, timestamp, landmarks, hand_info, latency,
+                 ran_pose=True, ran_hands=True):
+        """
+        Args:
+            seq: Sequence number of the frame the result belongs to
+            timestamp: Capture time of that frame
+            landmarks: Pose landmarks or None
+            hand_info: Hand info dict (see PoseDetector.get_hand_info)
+            latency: Seconds from submission until both models finished
+            ran_pose: Whether Pose was run for this frame
+            ran_hands: Whether Hands was run for this frame
+        """
+        self.seq = seq
+        self.timestamp = timestamp
+        self.landmarks = landmarks
+        self.hand_info = hand_info
+        self.latency = latency
+        self.ran_pose = ran_pose
+        self.ran_hands = ran_hands
+
+
+class ConcurrentInference:
+    """
+    Submits every frame to a Pose worker and a Hands worker at the same time.
+
+    Each model gets its own single-thread executor, so a MediaPipe graph is
+    only ever driven from one thread and the two graphs overlap instead of
+    running back to back. At most ``max_in_flight`` frames are queued; newer
+    frames are skipped while the workers are saturated. Collecting delivers
+    the newest finished frame and drops older ones by sequence number.
+
+    The workers only run the graphs; hand info (and with it the gesture
+    hysteresis) is built on the thread that collects.
+
+    With ``blocking`` (replays), frames are never skipped: submit waits for
+    a free slot and results are delivered in order, always
+    ``max_in_flight - 1`` frames behind, so a replay gives the same results
+    on every run.
+    """
+
+    def __init__(self, pose_detector, max_in_flight=2, blocking=False):
+        """
+        Args:
+            pose_detector: PoseDetector whose graphs the workers drive
+            max_in_flight: Maximum number of frames submitted but not collected
+            blocking: Wait for a free slot instead of skipping frames
+        """
+        self.detector = pose_detector
+        self.max_in_flight = max(1, max_in_flight)
+        self.blocking = blocking
+
+        self._pose_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="PoseWorker")
+        self._hands_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="HandsWorker")
+
+        # (seq, timestamp, submit_time, (width, height), pose_f, hands_f)
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._latest = None
+        self._next_seq = 0
+
+        # Counters
+        self.frames_submitted = 0
+        self.frames_skipped = 0
+        self.stale_results = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, frame_ctx, frame_width, frame_height, with_hands=True,
+               pose_landmarks=None, with_pose=True):
+        """
+        Queue a frame for pose and/or hand inference.
+
+        Args:
+            frame_ctx: FrameContext of the frame
+            frame_width: Width used for hand positions
+            frame_height: Height used for hand positions
+            with_hands: Also run the Hands model
+            pose_landmarks: Latest known pose, used to place hand crops
+            with_pose: Run the Pose model
+
+        Returns:
+            int: Sequence number of the queued frame, or None if it was
+                 skipped because too many frames are in flight
+        """
+        if self.blocking:
+            # Replay: tunggu slot kosong, jangan lewati frame
+            self._drain(self.max_in_flight - 1, timeout=None)
+        with self._lock:
+            if len(self._pending) >= self.max_in_flight:
+                self.frames_skipped += 1
+                return None
+
+            # Konversi RGB + resize input model sekali di thread utama,
+            # dipakai kedua worker
+            self.detector._model_input(frame_ctx)
+            seq = frame_ctx.seq or self._next_seq + 1
+            self._next_seq = seq
+
+            pose_future = None
+            if with_pose:
+                pose_future = self._pose_executor.submit(
+                    self.detector._run_pose, frame_ctx)
+            hands_future = None
+            if with_hands:
+                hands_future = self._hands_executor.submit(
+                    self.detector._run_hands, frame_ctx, pose_landmarks)
+
+            self._pending.append((seq, frame_ctx.timestamp, time.perf_counter(),
+                                  (frame_width, frame_height),
+                                  pose_future, hands_future))
+            self.frames_submitted += 1
+            return seq
+
+    def collect(self, wait_seq=None, timeout=1.0):
+        """
+        Harvest finished results and return the newest one.
+
+        Args:
+            wait_seq: Block until the result for this frame sequence (or a
+                      newer one) is available. None never blocks. Ignored
+                      with ``blocking``, which always waits until at most
+                      ``max_in_flight - 1`` frames are left in flight.
+            timeout: Maximum seconds to block
+
+        Returns:
+            InferenceResult or None if nothing has finished yet
+        """
+        if self.blocking:
+            return self._drain(self.max_in_flight - 1, timeout)
+
+        deadline = time.perf_counter() + timeout
+        while True:
+            with self._lock:
+                self._harvest()
+                latest = self._latest
+                waiting = (wait_seq is not None and self._pending and
+                           (latest is None or latest.seq < wait_seq))
+                oldest = self._pending[0] if waiting else None
+
+            if not waiting:
+                return latest
+
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0 or not self._wait(oldest, remaining):
+                return latest
+
+    def drain(self, timeout=None):
+        """
+        Deliver every queued frame, e.g. before the graphs are swapped.
+
+        Args:
+            timeout: Maximum seconds to block (None = until done)
+
+        Returns:
+            InferenceResult or None: The newest result
+        """
+        return self._drain(0, timeout)
+
+    def _drain(self, keep, timeout):
+        """
+        Deliver finished frames in order until at most ``keep`` are in flight.
+
+        Args:
+            keep: Frames that may stay in flight
+            timeout: Maximum seconds to block (None = until done)
+
+        Returns:
+            InferenceResult or None
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            with self._lock:
+                while len(self._pending) > keep and self._is_done(self._pending[0]):
+                    self._deliver(self._pending.popleft())
+                if len(self._pending) <= keep:
+                    return self._latest
+                oldest = self._pending[0]
+
+            remaining = None
+            if deadline is not None:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    return self._latest
+            if not self._wait(oldest, remaining):
+                return self._latest
+
+    @staticmethod
+    def _wait(entry, timeout):
+        """Block until both futures of ``entry`` are done; False on timeout."""
+        pose_future, hands_future = entry[4:]
+        try:
+            if pose_future is not None:
+                pose_future.exception(timeout=timeout)
+            if hands_future is not None:
+                hands_future.exception(timeout=timeout)
+        except FutureTimeout:
+            return False
+        return True
+
+    @staticmethod
+    def _is_done(entry):
+        pose_future, hands_future = entry[4:]
+        return ((pose_future is None or pose_future.done()) and
+                (hands_future is None or hands_future.done()))
+
+    def _harvest(self):
+        """Deliver the newest finished frame, drop older finished ones (lock held)."""
+        done = [entry for entry in self._pending if self._is_done(entry)]
+        if not done:
+            return
+        for entry in done:
+            self._pending.remove(entry)
+        # Semua hasil selesai kecuali yang terbaru sudah basi
+        self.stale_results += len(done) - 1
+        self._deliver(max(done, key=lambda entry: entry[0]))
+
+    def _deliver(self, entry):
+        """Join one finished entry into an InferenceResult (lock held)."""
+        seq, timestamp, submit_time, frame_size, pose_future, hands_future = entry
+
+        if self._latest is not None and seq <= self._latest.seq:
+            # Frame lebih baru sudah dipakai (hands frame lama selesai
+            # belakangan): buang
+            self.stale_results += 1
+            return
+
+        try:
+            landmarks = pose_future.result() if pose_future is not None else None
+            hands_results = hands_future.result() if hands_future is not None else None
+        except Exception as e:
+            print(f"[Error] Inference worker gagal: {e}")
+            return
+
+        # Klasifikasi gesture (state hysteresis) hanya di thread pemanggil
+        if hands_results is not None:
+            hand_info = self.detector._build_hand_info(hands_results, *frame_size)
+        else:
+            hand_info = self.detector.empty_hand_info()
+
+        self._latest = InferenceResult(
+            seq, timestamp, landmarks, hand_info,
+            time.perf_counter() - submit_time,
+            ran_pose=pose_future is not None, ran_hands=hands_future is not None)
+
+    def get_stats(self) -> dict:
+        """Return worker counters."""
+        with self._lock:
+            return {
+                'submitted': self.frames_submitted,
+                'skipped': self.frames_skipped,
+                'stale': self.stale_results,
+                'in_flight': len(self._pending),
+            }
+
+    def close(self):
+        """Wait for queued work and stop the worker threads."""
+        self._pose_executor.shutdown(wait=True)
+        self._hands_executor.shutdown(wait=True)
@@ -0,0 +1,154 @@
+"""
+Landmarks Module
+Array-backed stand-ins for MediaPipe landmark results.
+
+They expose the same attributes the game reads from MediaPipe protobufs
+(``landmarks.landmark[i].x``, ``results.multi_hand_landmarks``, ...), so
+results that were computed elsewhere (another process, a crop, a
+prediction) can flow through the existing code unchanged.
+"""
+
+import enum
+
+import numpy as np
+
+
+class PoseLandmark(enum.IntEnum):
+    """Pose landmark indices (same values as mp.solutions.pose.PoseLandmark)."""
+
+    NOSE = 0
+    LEFT_EYE_INNER = 1
+    LEFT_EYE = 2
+    LEFT_EYE_OUTER = 3
+    RIGHT_EYE_INNER = 4
+    RIGHT_EYE = 5
+    RIGHT_EYE_OUTER = 6
+    LEFT_EAR = 7
+    RIGHT_EAR = 8
+    MOUTH_LEFT = 9
+    MOUTH_RIGHT = 10
+    LEFT_SHOULDER = 11
+    RIGHT_SHOULDER = 12
+    LEFT_ELBOW = 13
+    RIGHT_ELBOW = 14
+    LEFT_WRIST = 15
+    RIGHT_WRIST = 16
+    LEFT_PINKY = 17
+    RIGHT_PINKY = 18
+    LEFT_INDEX = 19
+    RIGHT_INDEX = 20
+    LEFT_THUMB = 21
+    RIGHT_THUMB = 22
+    LEFT_HIP = 23
+    RIGHT_HIP = 24
+    LEFT_KNEE = 25
+    RIGHT_KNEE = 26
+    LEFT_ANKLE = 27
+    RIGHT_ANKLE = 28
+    LEFT_HEEL = 29
+    RIGHT_HEEL = 30
+    LEFT_FOOT_INDEX = 31
+    RIGHT_FOOT_INDEX = 32
+
+
+class Landmark:
+    """A single normalized landmark."""
+
+    __slots__ = ('x', 'y', 'z', 'visibility')
+
+    def __init__(self, x, y, z=0.0, visibility=1.0):
+        self.x = x
+        self.y = y
+        self.z = z
+        self.visibility = visibility
+
+
+class LandmarkList:
+    """
+    Landmark list backed by an (N, 4) float32 array of x, y, z, visibility.
+
+    Mirrors NormalizedLandmarkList: ``.landmark`` is a list of objects with
+    x/y/z/visibility attributes, built lazily from the array on first access.
+    ``predicted`` is True when the landmarks were extrapolated rather than
+    inferred by a model.
+    """
+
+    predicted = False
+
+    def __init__(self, array):
+        """
+        Args:
+            array: (N, 3) or (N, 4) array; a missing visibility column is 1.0
+        """
+        array = np.asarray(array, dtype=np.float32)
+        if array.shape[1] == 3:
+            array = np.concatenate(
+                [array, np.ones((len(array), 1), dtype=np.float32)], axis=1)
+        self.array = array
+        self._landmark = None
+
+    @classmethod
+    def from_proto(cls, proto):
+        """Copy a MediaPipe landmark list into an array-backed one."""
+        return cls(landmarks_to_array(proto))
+
+    @property
+    def landmark(self):
+        if self._landmark is None:
+            self._landmark = [Landmark(float(x), float(y), float(z), float(v))
+                              for x, y, z, v in self.array]
+        return self._landmark
+
+    def __len__(self):
+        return len(self.array)
+
+
+class Classification:
+    """Handedness label, as in MediaPipe's ClassificationList entries."""
+
+    __slots__ = ('label', 'score')
+
+    def __init__(self, label, score=1.0):
+        self.label = label
+        self.score = score
+
+
+class Handedness:
+    """Wrapper exposing ``.classification[0].label`` like MediaPipe does."""
+
+    __slots__ = ('classification',)
+
+    def __init__(self, label, score=1.0):
+        self.classification = [Classification(label, score)]
+
+
+class HandsResult:
+    """Minimal stand-in for the object returned by ``Hands.process()``."""
+
+    __slots__ = ('multi_hand_landmarks', 'multi_handedness')
+
+    def __init__(self, hand_landmarks=None, handedness=None):
+        """
+        Args:
+            hand_landmarks: List of LandmarkList (None when no hands)
+            handedness: List of Handedness, parallel to hand_landmarks
+        """
+        self.multi_hand_landmarks = hand_landmarks or None
+        self.multi_handedness = handedness or None
+
+
+def landmarks_to_array(landmarks):
+    """
+    Convert any landmark list (protobuf or LandmarkList) into an (N, 4) array.
+
+    Returns:
+        numpy.ndarray or None if ``landmarks`` is None
+    """
+    if landmarks is None:
+        return None
+    if isinstance(landmarks, LandmarkList):
+        return landmarks.array
+    return np.array(
+        [(lm.x, lm.y, lm.z, getattr(lm, 'visibility', 1.0))
+         for lm in landmarks.landmark],
+        dtype=np.float32)
@@ -1,47 +1,41 @@
 import pygame
 import sys
 import os
-import cv2
-import mediapipe as mp
+import argparse
+import random
 import time
+from contextlib import nullcontext
 
 from game_engine import GameEngine
-from pose_detector import PoseDetector
+from pose_detector import PoseDetector, preload_mediapipe
 from renderer import GameRenderer
 from spawn_manager import SpawnManager
 from menu_manager import MenuManager
 from sound_manager import SoundManager
-
-# Game States
-GAME_MENU = 0
-GAME_COUNTDOWN = 1
-GAME_PLAY = 2
-GAME_OVER = 3
-GAME_CREDITS = 4
-GAME_GUIDE = 5
+from camera_capture import CameraCapture
+from frame_context import FrameContext
+from inference_scheduler import InferenceScheduler
+from pose_frame import PoseFrame
+from coordinate_transform import normalized_to_screen
+from motion_gate import MotionGate
+from hand_gate import HandGate
+from game_states import (GAME_MENU, GAME_COUNTDOWN, GAME_PLAY, GAME_OVER,
+                         GAME_CREDITS, GAME_GUIDE, CAPTURE, POSE, HANDS,
+                         CAMERA_BG, SIMULATION, HUD, stages_for,
+                         StateFrameStats)
+from pipeline_runtime import PipelineRuntime
+from profiler import profiler
+from frame_source import open_source, CameraSource
+from camera_discovery import (discover_cameras, probe_last_camera,
+                              save_last_camera, backend_id)
 
 pygame.init()
 pygame.font.init()
 
 
 def get_available_cameras():
-    """Deteksi kamera yang tersedia di sistem."""
-    available_cameras = []
-
-    # Coba setiap kamera dari 0 hingga 10 (umumnya cukup untuk mengecek)
-    for i in range(10):
-        try:
-            cap = cv2.VideoCapture(i)
-            if cap.isOpened():
-                # Test read capability
-                ret, frame = cap.read()
-                if ret:
-                    available_cameras.append(i)
-            cap.release()
-        except Exception as e:
-            continue
-
-    return available_cameras
+    """Deteksi kamera yang tersedia di sistem (semua indeks dicek paralel)."""
+    return discover_cameras()
 
 
 def is_same_position(pos1, pos2, threshold=80):
@@ -63,8 +57,9 @@ def select_camera_terminal(available_cameras):
     print(f"\nKamera yang tersedia ({len(available_cameras)} kamera):")
     print("-" * 40)
 
-    for i, cam_idx in enumerate(available_cameras, 1):
-        print(f"{i}. Kamera {cam_idx}")
+    for i, cam in enumerate(available_cameras, 1):
+        print(f"{i}. Kamera {cam['index']} ({cam['width']}x{cam['height']}, "
+              f"{cam['backend'] or '?'})")
 
     print("\nKetik nomor kamera yang ingin digunakan (1-{}):".format(len(available_cameras)))
     print("Atau ketik 'q' untuk keluar")
@@ -82,7 +77,7 @@ def select_camera_terminal(available_cameras):
                 choice_idx = int(choice) - 1
                 if 0 <= choice_idx < len(available_cameras):
                     selected_camera = available_cameras[choice_idx]
-                    print(f"\n✓ Kamera {selected_camera} telah dipilih!")
+                    print(f"\n✓ Kamera {selected_camera['index']} telah dipilih!")
                     return selected_camera
                 else:
                     print(
@@ -97,17 +92,122 @@ def select_camera_terminal(available_cameras):
             print(f"❌ Error: {e}. Coba lagi.")
 
 
-def main():
-    SCREEN_W, SCREEN_H = 1280, 720
-    FPS = 60
-    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.RESIZABLE)
-    pygame.display.set_caption("Cam-Fu - Pose Fighting Game")
-    clock = pygame.time.Clock()
+def parse_size(text):
+    """Parse 'WIDTHxHEIGHT' into a (width, height) tuple."""
+    try:
+        width, height = (int(v) for v in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Ukuran tidak valid: {text} (contoh: 640x360)")
+    return width, height
+
+
+def parse_args(argv=None):
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(
+        description="Cam-Fu - Pose Fighting Game")
+    parser.add_argument(
+        '--source', default=None,
+        help="Sumber frame: camera:<idx>, video:<path>, images:<dir>, "
+             "raw:<path> atau synthetic[:<frames>]. Default: pilih kamera.")
+    parser.add_argument(
+        '--camera', type=int, default=None,
+        help="Langsung pakai indeks kamera ini tanpa pencarian kamera")
+    parser.add_argument(
+        '--unthrottled', action='store_true',
+        help="Putar sumber file/synthetic secepat mungkin dengan dt tetap")
+    parser.add_argument(
+        '--loop', action='store_true',
+        help="Ulang sumber file/synthetic dari awal saat habis")
+    parser.add_argument(
+        '--headless', action='store_true',
+        help="Tanpa jendela dan audio (SDL dummy driver)")
+    parser.add_argument(
+        '--inference', choices=('inline', 'threads', 'process'), default='inline',
+        help="inline: pose lalu hands berurutan; threads: pose & hands paralel; "
+             "process: MediaPipe di proses terpisah")
+    parser.add_argument(
+        '--max-in-flight', type=int, default=1,
+        help="Jumlah frame antrian inference mode threads (>1 = pipelined)")
+    parser.add_argument(
+        '--hand-roi', action='store_true',
+        help="Deteksi tangan hanya di crop sekitar tangan dari pose")
+    parser.add_argument(
+        '--pose-every', type=int, default=1,
+        help="Jalankan Pose tiap N frame, frame lain diprediksi")
+    parser.add_argument(
+        '--hands-every', type=int, default=1,
+        help="Jalankan Hands tiap N frame, frame lain diprediksi")
+    parser.add_argument(
+        '--inference-budget', type=float, default=None,
+        help="Budget waktu inference per frame (ms); interval pose/hands "
+             "diatur otomatis (mengabaikan --pose-every/--hands-every)")
+    parser.add_argument(
+        '--latency-target', type=float, default=None,
+        help="Target latensi inference per frame (ms); kompleksitas model "
+             "pose/hands diturunkan/dinaikkan otomatis")
+    parser.add_argument(
+        '--inference-size', type=parse_size, default=None,
+        help="Resolusi input model, mis. 640x360 (default: resolusi kamera)")
+    parser.add_argument(
+        '--no-letterbox', action='store_true',
+        help="Stretch ke --inference-size tanpa menjaga aspect ratio")
+    parser.add_argument(
+        '--motion-gate', action='store_true',
+        help="Pakai ulang landmark terakhir selama gambar kamera tidak berubah")
+    parser.add_argument(
+        '--max-reuse-age', type=float, default=1.0,
+        help="Batas umur (detik) landmark yang dipakai ulang oleh --motion-gate")
+    parser.add_argument(
+        '--hand-gate', action='store_true',
+        help="Jalankan Hands hanya saat tangan dekat target/power-up/tombol")
+    parser.add_argument(
+        '--discrete-collision', action='store_true',
+        help="Tes tabrakan hanya di sampel pose saat ini (tanpa sapuan "
+             "tangan/lengan antar sampel)")
+    parser.add_argument(
+        '--pipelined', action='store_true',
+        help="Inference dan simulasi di thread sendiri; render di frame rate "
+             "layar dengan posisi objek diinterpolasi")
+    parser.add_argument(
+        '--sim-rate', type=float, default=60.0,
+        help="Tick simulasi per detik untuk --pipelined")
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="Ukur waktu tiap stage sejak awal (overlay: tombol P)")
+    parser.add_argument(
+        '--profile-export', default=None, metavar='PATH',
+        help="Simpan p50/p95/p99 per stage saat keluar (.csv atau .json)")
+    parser.add_argument(
+        '--seed', type=int, default=None,
+        help="Seed random untuk spawn objek (hasil run bisa diulang)")
+    return parser.parse_args(argv)
+
+
+def select_frame_source(args):
+    """Open the frame source from --source, or pick a camera interactively."""
+    if args.source:
+        try:
+            source = open_source(args.source, realtime=not args.unthrottled,
+                                 loop=args.loop)
+        except (ValueError, OSError) as e:
+            print(f"Error: {e}")
+            sys.exit()
+        print(f"\n✓ Menggunakan sumber frame: {args.source}")
+        return source
+
+    if args.camera is not None:
+        print(f"\n✓ Menggunakan kamera {args.camera} (--camera)")
+        return CameraSource(args.camera)
+
+    # Coba kamera terakhir yang berhasil dulu, scan penuh hanya jika gagal
+    last_camera = probe_last_camera()
+    if last_camera:
+        print(f"\n✓ Menggunakan kamera terakhir {last_camera['index']} "
+              f"({last_camera['width']}x{last_camera['height']}, "
+              f"{last_camera['backend'] or '?'})")
+        save_last_camera(last_camera)
+        return open_camera(last_camera)
 
-    # Deteksi dan pilih kamera terlebih dahulu via terminal
-    print("="*60)
-    print("        CAM-FU - POSE FIGHTING GAME")
-    print("="*60)
     print("\nMencari kamera yang tersedia...")
 
     available_cameras = get_available_cameras()
@@ -118,13 +218,14 @@ def main():
         sys.exit()
 
     print(
-        f"\n✓ Berhasil menemukan {len(available_cameras)} kamera: {available_cameras}")
+        f"\n✓ Berhasil menemukan {len(available_cameras)} kamera: "
+        f"{[cam['index'] for cam in available_cameras]}")
 
     # Pilih kamera via terminal
     if len(available_cameras) == 1:
         selected_camera = available_cameras[0]
         print(
-            f"\n✓ Menggunakan kamera {selected_camera} (hanya satu kamera tersedia)")
+            f"\n✓ Menggunakan kamera {selected_camera['index']} (hanya satu kamera tersedia)")
     else:
         selected_camera = select_camera_terminal(available_cameras)
 
@@ -132,11 +233,65 @@ def main():
             print("Gagal memilih kamera. Keluar dari aplikasi.")
             sys.exit()
 
-    # Initialize camera with selected device
-    cap = cv2.VideoCapture(selected_camera)
-    if not cap.isOpened():
-        print(f"Error: Tidak dapat membuka kamera {selected_camera}.")
+    save_last_camera(selected_camera)
+    return open_camera(selected_camera)
+
+
+def open_camera(camera_info):
+    """Open a camera from a probe result, reusing its backend and resolution."""
+    return CameraSource(camera_info['index'],
+                        backend=backend_id(camera_info.get('backend')),
+                        width=camera_info.get('width'),
+                        height=camera_info.get('height'))
+
+
+def main(argv=None):
+    startup_start = time.perf_counter()
+    args = parse_args(argv)
+
+    # Import MediaPipe (~1 s) berjalan paralel dengan pencarian/pembukaan
+    # kamera (I/O driver); sumber file/synthetic tidak punya waktu tunggu itu
+    if not args.source or args.source.startswith('camera'):
+        preload_mediapipe()
+
+    if args.headless:
+        # Ganti driver SDL sebelum jendela dan mixer dibuat
+        os.environ['SDL_VIDEODRIVER'] = 'dummy'
+        os.environ['SDL_AUDIODRIVER'] = 'dummy'
+        pygame.display.quit()
+        pygame.mixer.quit()
+        pygame.display.init()
+
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    profiler.enable(args.profile or args.profile_export is not None)
+
+    SCREEN_W, SCREEN_H = 1280, 720
+    FPS = 60
+    screen = pygame.display.set_mode((SCREEN_W, SCREEN_H), pygame.RESIZABLE)
+    pygame.display.set_caption("Cam-Fu - Pose Fighting Game")
+    clock = pygame.time.Clock()
+
+    # Deteksi dan pilih sumber frame terlebih dahulu via terminal
+    print("="*60)
+    print("        CAM-FU - POSE FIGHTING GAME")
+    print("="*60)
+
+    source = select_frame_source(args)
+
+    # Initialize capture (kamera dibaca di thread terpisah)
+    capture = CameraCapture(source)
+    if not capture.isOpened():
+        print(f"Error: Tidak dapat membuka {args.source or f'kamera {source.index}'}.")
         sys.exit()
+    capture.start()
+
+    # Sumber file/synthetic tanpa pacing memakai dt tetap agar hasil deterministik
+    fixed_dt = None
+    if not source.is_live and args.unthrottled:
+        fixed_dt = 1.0 / source.fps
+    sim_time = 0.0
 
     # Asset Background Sendiri
     try:
@@ -144,9 +299,31 @@ def main():
     except FileNotFoundError:
         print("Warning: assets/images/play_bg.jpg tidak ditemukan.")
         game_bg = pygame.Surface((1280, 720))
+    # Background diskalakan sekali, ulang hanya saat ukuran jendela berubah
+    game_bg_scaled = pygame.transform.scale(game_bg, (SCREEN_W, SCREEN_H))
 
     # Core modules
-    pose_detector = PoseDetector()
+    scheduler = None
+    if args.pose_every > 1 or args.hands_every > 1 or args.inference_budget:
+        scheduler = InferenceScheduler(pose_interval=args.pose_every,
+                                       hands_interval=args.hands_every,
+                                       budget_ms=args.inference_budget)
+    motion_gate = None
+    if args.motion_gate:
+        motion_gate = MotionGate(max_reuse_age=args.max_reuse_age)
+    hand_gate = HandGate() if args.hand_gate else None
+    pose_detector = PoseDetector(inference_mode=args.inference,
+                                 max_in_flight=args.max_in_flight,
+                                 hand_roi=args.hand_roi,
+                                 scheduler=scheduler,
+                                 latency_target_ms=args.latency_target,
+                                 inference_size=args.inference_size,
+                                 letterbox=not args.no_letterbox,
+                                 motion_gate=motion_gate,
+                                 hand_gate=hand_gate,
+                                 replay=not source.is_live)
+    # Landmark (normalized kamera) -> layar, dihitung ulang hanya saat resize
+    screen_transform = normalized_to_screen(SCREEN_W, SCREEN_H)
     game_renderer = GameRenderer(screen, assets_dir='assets/images')
     spawn_manager = SpawnManager(SCREEN_W, SCREEN_H)
 
@@ -154,7 +331,8 @@ def main():
         screen=screen,
         pose_detector=pose_detector,
         game_renderer=game_renderer,
-        spawn_manager=spawn_manager
+        spawn_manager=spawn_manager,
+        continuous_collision=not args.discrete_collision
     )
 
     menu = MenuManager(screen, 'assets/images')
@@ -168,6 +346,16 @@ def main():
     # Input states
     current_state = GAME_MENU
 
+    # Mode pipelined: inference & simulasi di thread, render di thread utama
+    pipeline = None
+    world_lock = nullcontext()
+    if args.pipelined:
+        pipeline = PipelineRuntime(capture, pose_detector, game_engine,
+                                   replay=not source.is_live,
+                                   tick_rate=args.sim_rate)
+        world_lock = pipeline.world_lock
+        pipeline.start()
+
     # Countdown variables
     countdown_timer = 3.0
     countdown_images = {}
@@ -194,10 +382,36 @@ def main():
     game_over_timer = 0.0  # Timer untuk animasi intro game over
 
     running = True
+    first_frame = True
+    hand_info = pose_detector.empty_hand_info()
+    # Frame kamera terakhir: (seq, FrameContext, hasil inference atau None)
+    last_capture = (0, None, None)
+
+    # Waktu kerja per frame (tanpa tunggu clock.tick) per state
+    frame_stats = StateFrameStats()
+    show_profiler = False
+    profiler_stats = {}
+    profiler_refresh = 0.0
+    PROFILER_REFRESH = 0.5  # Detik antar update overlay
+    frame_start = None
+    frame_state = current_state
 
     while running:
-        dt = clock.tick(FPS) / 1000.0
-        current_time = pygame.time.get_ticks() / 1000.0  # Current time in seconds
+        if frame_start is not None:
+            frame_time = time.perf_counter() - frame_start
+            frame_stats.record(frame_state, frame_time)
+            profiler.record('frame', int(frame_time * 1e9))
+
+        if fixed_dt is None:
+            dt = clock.tick(FPS) / 1000.0
+            current_time = pygame.time.get_ticks() / 1000.0  # Current time in seconds
+        else:
+            clock.tick()  # Hanya untuk pengukuran FPS
+            dt = fixed_dt
+            sim_time += dt
+            current_time = sim_time
+        frame_start = time.perf_counter()
+        frame_state = current_state
 
         # Event Handling
         for e in pygame.event.get():
@@ -211,11 +425,20 @@ def main():
                 if hasattr(game_renderer, 'update_screen_size'):
                     game_renderer.update_screen_size(SCREEN_W, SCREEN_H)
                 spawn_manager.update_screen_size(SCREEN_W, SCREEN_H)
+                screen_transform = normalized_to_screen(SCREEN_W, SCREEN_H)
+                game_bg_scaled = pygame.transform.scale(
+                    game_bg, (SCREEN_W, SCREEN_H))
 
             elif e.type == pygame.KEYDOWN:
                 if e.key == pygame.K_q:
                     running = False
 
+                # Overlay profiler (mulai mengukur jika belum aktif)
+                elif e.key == pygame.K_p:
+                    show_profiler = not show_profiler
+                    if show_profiler:
+                        profiler.enable()
+
                 # Kontrol Volume
                 elif e.key == pygame.K_m:
                     sound_manager.toggle_music()
@@ -239,41 +462,75 @@ def main():
                 elif current_state == GAME_OVER and game_over_timer > 2.5 and e.key == pygame.K_r:
                     current_state = GAME_COUNTDOWN
                     countdown_timer = 3.0
-                    game_engine.reset_game()
+                    with world_lock:
+                        game_engine.reset_game()
                     sound_manager.stop_music()
                     sound_manager.play_sound('countdown')
 
-        # Read Camera
-        ret, frame = cap.read()
-        if not ret:
-            break
+        # Stage pipeline yang dibutuhkan state ini
+        stages = stages_for(current_state)
 
-        frame = cv2.flip(frame, 1)
-        cam_h, cam_w = frame.shape[:2]
-        _, landmarks = pose_detector.detect_pose(frame)
+        if hand_gate is not None and POSE in stages and HANDS in stages:
+            if current_state == GAME_PLAY:
+                with world_lock:
+                    hand_gate.set_regions(circles=game_engine.hand_regions())
+            else:
+                hand_gate.set_regions(
+                    rects=[btn['rect'] for btn in menu.buttons.values()])
+
+        frame_ctx = None
+        pose_frame = None
+        hand_info = pose_detector.empty_hand_info()
+        if pipeline is not None:
+            # Ambil hasil terbaru tanpa menunggu inference
+            pipeline.configure(stages, SCREEN_W, SCREEN_H)
+            if pipeline.ended:
+                break
+            output = pipeline.latest()
+            if output is not None and CAPTURE in stages:
+                frame_ctx = output.frame_ctx
+                if POSE in stages:
+                    pose_frame = output.pose_frame
+                    hand_info = output.hand_info
+        else:
+            # Read Camera (frame terbaru dari capture thread). Sumber replay
+            # selalu dibaca agar timeline dan akhir file tetap deterministik.
+            # read() tidak menunggu kamera: tanpa frame baru kembali frame
+            # yang sama (seq sama) dan hasil inference-nya dipakai ulang.
+            if CAPTURE in stages or not source.is_live:
+                with profiler.stage('capture'):
+                    captured = capture.read()
+                if captured is None:
+                    if capture.ended:
+                        break
+                else:
+                    if captured.seq != last_capture[0]:
+                        # Satu konteks per frame: flip & konversi RGB dipakai bersama
+                        last_capture = (captured.seq, FrameContext.from_capture(captured), None)
+                    frame_ctx = last_capture[1]
+
+            # Pose + hands hanya di state yang memakainya
+            if POSE in stages and frame_ctx is not None:
+                inferred = last_capture[2]
+                if inferred is None or inferred[0] != (HANDS in stages):
+                    landmarks, hand_info = pose_detector.process_frame(
+                        frame_ctx, SCREEN_W, SCREEN_H, with_hands=HANDS in stages)
+
+                    # Decode landmark sekali per frame untuk engine, renderer & kursor
+                    pose_frame = PoseFrame.from_landmarks(
+                        landmarks, SCREEN_W, SCREEN_H, screen_transform)
+                    last_capture = last_capture[:2] + ((HANDS in stages, hand_info, pose_frame),)
+                else:
+                    _, hand_info, pose_frame = inferred
 
         # Hand Tracking / Cursor System
         active_hand_pos = None
         right_idx_pos = None
         left_idx_pos = None
 
-        if landmarks:
-            scale_x = SCREEN_W / 1280
-            scale_y = SCREEN_H / 720
-
-            raw_right = pose_detector.get_landmark_position(
-                landmarks, mp.solutions.pose.PoseLandmark.RIGHT_INDEX.value, cam_w, cam_h)
-            raw_left = pose_detector.get_landmark_position(
-                landmarks, mp.solutions.pose.PoseLandmark.LEFT_INDEX.value, cam_w, cam_h)
-
-            if raw_right:
-                right_idx_pos = pose_detector.to_screen_coordinates(
-                    raw_right[0] * scale_x, raw_right[1] * scale_y,
-                    cam_w, cam_h, SCREEN_W, SCREEN_H)
-            if raw_left:
-                left_idx_pos = pose_detector.to_screen_coordinates(
-                    raw_left[0] * scale_x, raw_left[1] * scale_y,
-                    cam_w, cam_h, SCREEN_W, SCREEN_H)
+        if pose_frame is not None:
+            right_idx_pos = pose_frame.right_index
+            left_idx_pos = pose_frame.left_index
 
             # Check hover (for cursor display only)
             hover_right = menu.check_button_hover(
@@ -291,16 +548,11 @@ def main():
                 active_hand_pos = left_idx_pos
 
         # Background Rendering
-        if current_state in (GAME_PLAY, GAME_COUNTDOWN):
-            bg_scaled = pygame.transform.scale(game_bg, (SCREEN_W, SCREEN_H))
-            screen.blit(bg_scaled, (0, 0))
-        elif current_state != GAME_OVER:
+        if CAMERA_BG in stages and frame_ctx is not None:
             # Menu/Guide/Credits pakai kamera
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            frame_py = pygame.image.frombuffer(
-                frame_rgb.tobytes(), frame.shape[1::-1], "RGB")
-            frame_py = pygame.transform.scale(frame_py, (SCREEN_W, SCREEN_H))
-            screen.blit(frame_py, (0, 0))
+            game_renderer.draw_camera_background(frame_ctx)
+        elif current_state in (GAME_PLAY, GAME_COUNTDOWN):
+            screen.blit(game_bg_scaled, (0, 0))
 
         # Game State Machine
         if current_state == GAME_MENU:
@@ -311,11 +563,6 @@ def main():
 
             menu.draw_menu()
 
-            # Get hand info for fist detection
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            hand_info = pose_detector.get_hand_info(
-                frame_rgb, SCREEN_W, SCREEN_H)
-
             # Check for fist click on buttons (with cooldown)
             fist_button = menu.check_button_fist_click(hand_info)
             if fist_button and (current_time - last_fist_time) > FIST_COOLDOWN:
@@ -324,7 +571,8 @@ def main():
                 if fist_button == "start":
                     current_state = GAME_COUNTDOWN
                     countdown_timer = 3.0
-                    game_engine.reset_game()
+                    with world_lock:
+                        game_engine.reset_game()
                     sound_manager.stop_music()
                     sound_manager.play_sound('countdown')
                 elif fist_button == "credits":
@@ -350,7 +598,7 @@ def main():
                 current_state = GAME_PLAY
                 sound_manager.play_music('gameplay')
                 # RESET Timer
-                start_time = time.time()
+                start_time = current_time
                 game_over_timer = 0.0
                 continue
 
@@ -367,28 +615,29 @@ def main():
 
         elif current_state == GAME_PLAY:
             # Hitung waktu main
-            play_duration = time.time() - start_time
-
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            hand_info = pose_detector.get_hand_info(
-                frame_rgb, SCREEN_W, SCREEN_H)
+            play_duration = current_time - start_time
 
-            game_engine.update(dt, landmarks, hand_info)
+            if SIMULATION in stages and pipeline is None:
+                game_engine.update(dt, pose_frame, hand_info)
 
             # Background already drawn above in "Background Rendering" section
 
-            game_renderer.draw_game_objects(
-                game_engine.targets,
-                game_engine.obstacles,
-                game_engine.powerups)
+            with world_lock:
+                positions = pipeline.simulation.interpolated_positions() \
+                    if pipeline is not None else None
+                game_renderer.draw_game_objects(
+                    game_engine.targets,
+                    game_engine.obstacles,
+                    game_engine.powerups,
+                    positions)
 
-            if landmarks:
-                game_renderer.draw_stickman(landmarks, pose_detector)
+            game_renderer.draw_stickman(pose_frame)
 
             # 4. Draw hand landmarks and fist indicators (with arm blocking visual)
-            game_renderer.draw_hand_indicators(
-                hand_info, landmarks, pose_detector)
-            game_renderer.draw_ui(game_engine.score_manager, clock, hand_info)
+            game_renderer.draw_hand_indicators(hand_info, pose_frame)
+            if HUD in stages:
+                game_renderer.draw_ui(game_engine.score_manager, clock, hand_info,
+                                      model_tier=pose_detector.model_tier)
 
             if game_engine.score_manager.game_over:
                 current_state = GAME_OVER
@@ -398,11 +647,6 @@ def main():
         elif current_state == GAME_CREDITS:
             menu.draw_credits_screen()
 
-            # Get hand info for fist detection
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            hand_info = pose_detector.get_hand_info(
-                frame_rgb, SCREEN_W, SCREEN_H)
-
             # Check for fist click on back button (with cooldown)
             fist_button = menu.check_button_fist_click(hand_info)
             if fist_button == "back" and (current_time - last_fist_time) > FIST_COOLDOWN:
@@ -413,11 +657,6 @@ def main():
         elif current_state == GAME_GUIDE:
             menu.draw_guide_screen()
 
-            # Get hand info for fist detection
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            hand_info = pose_detector.get_hand_info(
-                frame_rgb, SCREEN_W, SCREEN_H)
-
             # Check for fist click on back button (with cooldown)
             fist_button = menu.check_button_fist_click(hand_info)
             if fist_button == "back" and (current_time - last_fist_time) > FIST_COOLDOWN:
@@ -446,7 +685,7 @@ def main():
                 )
 
         # Cursor Rendering (Hidden During Gameplay)
-        if current_state != GAME_PLAY:
+        if current_state != GAME_PLAY and HUD in stages:
             if right_idx_pos:
                 pygame.draw.circle(screen, (150, 150, 150),
                                    right_idx_pos, 10, 2)
@@ -458,9 +697,85 @@ def main():
                 pygame.draw.circle(screen, (0, 255, 255),
                                    active_hand_pos, 20, 3)
 
-        pygame.display.flip()
-
-    cap.release()
+        if show_profiler:
+            # Persentil dihitung ulang berkala, bukan tiap frame
+            now = time.perf_counter()
+            if now - profiler_refresh >= PROFILER_REFRESH:
+                profiler_stats = profiler.summary()
+                profiler_refresh = now
+            if profiler_stats:
+                game_renderer.draw_profiler_overlay(profiler_stats)
+
+        with profiler.stage('display_flip'):
+            pygame.display.flip()
+
+        if first_frame:
+            first_frame = False
+            print(f"Startup: frame pertama {time.perf_counter() - startup_start:.2f} s "
+                  f"setelah main() dimulai", flush=True)
+
+    # Urutan berhenti tetap: stage pipeline dulu, baru kamera
+    if pipeline is not None:
+        pipeline.stop()
+    capture.release()
+    stats = capture.get_stats()
+    print(f"Camera: {stats['captured']} frame ditangkap, "
+          f"{stats['dropped']} frame dilewati, {stats['capture_fps']} FPS kamera")
+
+    if pose_detector.workers is not None:
+        w_stats = pose_detector.workers.get_stats()
+        print(f"Inference workers: {w_stats['submitted']} frame diproses, "
+              f"{w_stats['skipped']} dilewati (antrian penuh), "
+              f"{w_stats['stale']} hasil basi dibuang")
+    if pose_detector.client is not None:
+        c_stats = pose_detector.client.get_stats()
+        print(f"Inference server: {c_stats['submitted']} frame diproses, "
+              f"{c_stats['skipped']} dilewati (ring penuh), "
+              f"{c_stats['restarts']} restart")
+
+    if pipeline is not None:
+        p_stats = pipeline.get_stats()
+        print(f"Pipeline: {p_stats['inference_frames']} frame inference, "
+              f"{p_stats['inference_overwritten']} hasil tidak sempat dirender, "
+              f"{p_stats['simulation_ticks']} tick simulasi "
+              f"({p_stats['late_ticks']} terlambat)")
+
+    if scheduler is not None:
+        s_stats = scheduler.get_stats()
+        print(f"Inference scheduler: pose tiap {s_stats['pose_interval']} frame "
+              f"({s_stats['inferred']['pose']} inferensi, "
+              f"{s_stats['predicted']['pose']} prediksi), hands tiap "
+              f"{s_stats['hands_interval']} frame "
+              f"({s_stats['inferred']['hands']} inferensi, "
+              f"{s_stats['predicted']['hands']} prediksi)")
+
+    if motion_gate is not None:
+        g_stats = motion_gate.get_stats()
+        print(f"Motion gate: {g_stats['skipped']} dari {g_stats['checked']} frame "
+              f"tanpa inference ({g_stats['skip_rate'] * 100:.0f}%), "
+              f"{g_stats['forced']} refresh karena umur")
+
+    if hand_gate is not None:
+        h_stats = hand_gate.get_stats()
+        print(f"Hand gate: hands dilewati di {h_stats['gated']} dari "
+              f"{h_stats['checked']} frame")
+
+    for name, st in frame_stats.get_stats().items():
+        print(f"Frame {name}: rata-rata {st['avg_ms']} ms, p95 {st['p95_ms']} ms "
+              f"({st['frames']} frame; stage: {', '.join(st['stages']) or '-'})")
+
+    if args.profile_export and profiler.export(args.profile_export):
+        print(f"Profil stage disimpan ke {args.profile_export}")
+
+    if pose_detector.autotuner is not None:
+        print(f"Model autotuner: {pose_detector.autotuner.switches} pergantian, "
+              f"tier akhir {pose_detector.model_tier}")
+
+    view_stats = game_renderer.camera_view.get_stats()
+    if view_stats['frames']:
+        # Perbandingan dengan jalur lama: python camera_view.py
+        print(f"Background kamera: rata-rata {view_stats['avg_present_ms']} ms/frame "
+              f"({view_stats['frames']} frame)")
     sound_manager.cleanup()
     game_engine.cleanup()
     sys.exit()
@@ -1,6 +1,8 @@
 import pygame
 import os
 
+from profiler import profiler
+
 
 class MenuManager:
     """Manages main menu, credits, and guide screens with buttons & backgrounds."""
@@ -117,14 +119,17 @@ class MenuManager:
 
     # PUBLIC DRAW FUNCTIONS (called from main.py)
 
+    @profiler.timed('draw.menu')
     def draw_menu(self):
         self._draw_background(self.bg_menu)
         self._draw_buttons(('start', 'guide', 'credits'))
 
+    @profiler.timed('draw.credits')
     def draw_credits_screen(self):
         self._draw_background(self.bg_credits)
         self._draw_buttons(('back',))
 
+    @profiler.timed('draw.guide')
     def draw_guide_screen(self):
         self._draw_background(self.bg_guide)
         self._draw_buttons(('back',))
@@ -0,0 +1,206 @@
+"""
+Model Autotuner Module
+Picks the MediaPipe model complexity that fits a per-frame latency target.
+"""
+
+import threading
+import time
+
+
+class ModelTier:
+    """One combination of Pose and Hands model complexity."""
+
+    __slots__ = ('name', 'pose_complexity', 'hands_complexity')
+
+    def __init__(self, name, pose_complexity, hands_complexity):
+        """
+        Args:
+            name: Short label shown in the UI
+            pose_complexity: mp Pose model_complexity (0, 1 or 2)
+            hands_complexity: mp Hands model_complexity (0 = lite, 1 = full)
+        """
+        self.name = name
+        self.pose_complexity = pose_complexity
+        self.hands_complexity = hands_complexity
+
+    def label(self) -> str:
+        hands = 'full' if self.hands_complexity else 'lite'
+        return f"{self.name} (pose {self.pose_complexity}, hands {hands})"
+
+
+# Dari paling ringan ke paling berat
+TIERS = (
+    ModelTier('lite', 0, 0),
+    ModelTier('balanced', 1, 0),
+    ModelTier('full', 1, 1),
+    ModelTier('heavy', 2, 1),
+)
+
+
+def tier_for(pose_complexity, hands_complexity=1):
+    """Index of the tier matching the given complexities (closest match)."""
+    for i, tier in enumerate(TIERS):
+        if (tier.pose_complexity, tier.hands_complexity) == (pose_complexity, hands_complexity):
+            return i
+    return min(range(len(TIERS)),
+               key=lambda i: abs(TIERS[i].pose_complexity - pose_complexity))
+
+
+class ModelAutotuner:
+    """
+    Latency-driven tier selection with hysteresis.
+
+    Per-stage inference times are smoothed (EMA) and summed. The tier steps
+    down once the sum has stayed above the target for ``hold_seconds``, and
+    steps up only after it has stayed below ``headroom * target`` for a
+    longer period. Each failed upgrade doubles the wait before the next one,
+    so a machine sitting right at the edge does not oscillate.
+
+    New graphs are built on a background thread by ``build_fn``; the owner
+    calls ``poll()`` on its own thread and swaps them in when ready.
+    """
+
+    def __init__(self, target_ms, build_fn, start_tier=2, headroom=0.6,
+                 hold_seconds=2.0, upgrade_hold_seconds=6.0, smoothing=0.1):
+        """
+        Args:
+            target_ms: Per-frame inference latency target (pose + hands)
+            build_fn: Callable(tier) -> built graphs, run off the main thread
+            start_tier: Index into TIERS of the graphs currently in use
+            headroom: Upgrade only below this fraction of the target
+            hold_seconds: How long the latency must exceed the target
+            upgrade_hold_seconds: How long it must stay below the headroom
+            smoothing: EMA weight of a new latency sample
+        """
+        self.target_ms = target_ms
+        self.build_fn = build_fn
+        self.tier_index = start_tier
+        self.headroom = headroom
+        self.hold_seconds = hold_seconds
+        self.upgrade_hold_seconds = upgrade_hold_seconds
+        self.smoothing = smoothing
+
+        self._latency_ms = {}
+        self._over_since = None
+        self._under_since = None
+        self._last_upgrade_from = None
+        self._unavailable = set()
+
+        self._lock = threading.Lock()
+        self._builder = None
+        self._built = None
+
+        self.switches = 0
+
+    @property
+    def tier(self) -> ModelTier:
+        return TIERS[self.tier_index]
+
+    @property
+    def latency_ms(self) -> float:
+        return sum(self._latency_ms.values())
+
+    def observe(self, stage, seconds, now=None):
+        """
+        Feed one measured inference time and maybe start a tier switch.
+
+        Args:
+            stage: 'pose' or 'hands'
+            seconds: Measured inference time
+            now: Current time (default: time.perf_counter())
+        """
+        if self._builder is not None:
+            return
+        now = time.perf_counter() if now is None else now
+        ms = seconds * 1000.0
+        previous = self._latency_ms.get(stage)
+        self._latency_ms[stage] = ms if previous is None else \
+            previous + self.smoothing * (ms - previous)
+
+        total = self.latency_ms
+        if total > self.target_ms:
+            self._under_since = None
+            if self._over_since is None:
+                self._over_since = now
+            elif now - self._over_since >= self.hold_seconds:
+                lower = self._next_available(-1)
+                if lower is None:
+                    return
+                if self._last_upgrade_from == lower:
+                    # Upgrade terakhir gagal: tunggu lebih lama sebelum mencoba lagi
+                    self.upgrade_hold_seconds *= 2
+                self._switch(lower)
+        elif total < self.target_ms * self.headroom:
+            self._over_since = None
+            if self._under_since is None:
+                self._under_since = now
+            elif now - self._under_since >= self.upgrade_hold_seconds:
+                higher = self._next_available(+1)
+                if higher is None:
+                    return
+                self._last_upgrade_from = self.tier_index
+                self._switch(higher)
+        else:
+            self._over_since = None
+            self._under_since = None
+
+    def _next_available(self, step):
+        """Nearest tier in direction ``step`` that has not failed to build."""
+        index = self.tier_index + step
+        while 0 <= index < len(TIERS):
+            if index not in self._unavailable:
+                return index
+            index += step
+        return None
+
+    def _switch(self, tier_index):
+        """Start building the graphs for another tier in the background."""
+        tier = TIERS[tier_index]
+        print(f"[Autotune] Latensi {self.latency_ms:.1f} ms "
+              f"(target {self.target_ms:.0f} ms) -> {tier.label()}")
+
+        def build():
+            try:
+                built = self.build_fn(tier)
+            except Exception as e:
+                print(f"[Error] Gagal membangun model {tier.name}: {e}")
+                built = None
+            with self._lock:
+                self._built = (tier_index, built)
+
+        self._builder = threading.Thread(target=build, name="ModelBuilder",
+                                         daemon=True)
+        self._builder.start()
+
+    def poll(self):
+        """
+        Return finished graphs, if a background build has completed.
+
+        Returns:
+            tuple: (tier, built) or None. ``built`` is None if the build failed.
+        """
+        with self._lock:
+            if self._built is None:
+                return None
+            tier_index, built = self._built
+            self._built = None
+        self._builder = None
+
+        if built is not None:
+            self.tier_index = tier_index
+            self.switches += 1
+        else:
+            # Model tier ini tidak tersedia (mis. file model tidak bisa diunduh)
+            self._unavailable.add(tier_index)
+        # Model baru = latensi baru: mulai ukur dari nol
+        self._latency_ms.clear()
+        self._over_since = None
+        self._under_since = None
+        return TIERS[tier_index], built
+
+    def close(self):
+        """Wait for a running build and hand back graphs nobody will use."""
+        if self._builder is not None:
+            self._builder.join()
+        result = self.poll()
+        return result[1] if result else None
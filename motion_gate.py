@@ -0,0 +1,102 @@
+"""
+Motion Gate Module
+Skips pose/hand inference while the camera image is not changing.
+"""
+
+import time
+
+import numpy as np
+
+
+class MotionGate:
+    """
+    Cheap frame-difference motion detector.
+
+    Each frame is downsampled to a tiny grayscale thumbnail and compared with
+    the thumbnail of the last frame that was actually inferred. If only a
+    small fraction of pixels changed noticeably, the previous landmarks can
+    be reused. Inference is forced again once the reused result is older
+    than ``max_reuse_age`` seconds, so slow drift is never missed for long.
+    """
+
+    def __init__(self, size=(64, 36), pixel_threshold=12,
+                 changed_fraction=0.01, max_reuse_age=1.0):
+        """
+        Args:
+            size: (width, height) of the comparison thumbnail
+            pixel_threshold: Gray-level difference that counts as a change
+            changed_fraction: Fraction of changed pixels that counts as motion
+            max_reuse_age: Maximum seconds a result may be reused
+        """
+        self.size = tuple(size)
+        self.pixel_threshold = pixel_threshold
+        self.changed_fraction = changed_fraction
+        self.max_reuse_age = max_reuse_age
+
+        self._reference = None
+        self._reference_time = None
+        self._diff = np.empty((self.size[1], self.size[0]), dtype=np.uint8)
+
+        # Counters
+        self.frames_checked = 0
+        self.frames_skipped = 0
+        self.forced_refreshes = 0
+
+    def _thumbnail(self, frame_ctx):
+        import cv2
+        small = frame_ctx.resized(self.size, color='bgr')
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+
+    def should_infer(self, frame_ctx, now=None):
+        """
+        Decide whether this frame needs fresh inference.
+
+        When it does, the frame becomes the new reference.
+
+        Args:
+            frame_ctx: FrameContext of the current frame
+            now: Current time (default: frame timestamp or perf_counter)
+
+        Returns:
+            bool: True if inference should run
+        """
+        import cv2
+        if now is None:
+            now = frame_ctx.timestamp if frame_ctx.timestamp is not None \
+                else time.perf_counter()
+        self.frames_checked += 1
+        thumbnail = self._thumbnail(frame_ctx)
+
+        if self._reference is None:
+            return self._accept(thumbnail, now)
+
+        if now - self._reference_time >= self.max_reuse_age:
+            self.forced_refreshes += 1
+            return self._accept(thumbnail, now)
+
+        cv2.absdiff(thumbnail, self._reference, dst=self._diff)
+        changed = np.count_nonzero(self._diff > self.pixel_threshold)
+        if changed > self.changed_fraction * self._diff.size:
+            return self._accept(thumbnail, now)
+
+        self.frames_skipped += 1
+        return False
+
+    def _accept(self, thumbnail, now):
+        self._reference = thumbnail
+        self._reference_time = now
+        return True
+
+    def reset(self):
+        """Forget the reference so the next frame is always inferred."""
+        self._reference = None
+
+    def get_stats(self) -> dict:
+        """Return gate counters."""
+        skip_rate = self.frames_skipped / self.frames_checked if self.frames_checked else 0.0
+        return {
+            'checked': self.frames_checked,
+            'skipped': self.frames_skipped,
+            'forced': self.forced_refreshes,
+            'skip_rate': round(skip_rate, 3),
+        }
@@ -0,0 +1,378 @@
+"""
+Pipeline Runtime Module
+Runs capture/inference and game simulation as separate stages connected by
+latest-value slots, so rendering is no longer paced by the slowest stage.
+"""
+
+import threading
+import time
+
+from frame_context import FrameContext
+from pose_frame import PoseFrame
+from coordinate_transform import normalized_to_screen
+from game_states import CAPTURE, POSE, HANDS, SIMULATION
+from profiler import profiler
+
+
+class LatestValueSlot:
+    """
+    Single-value channel between two pipeline stages.
+
+    ``put()`` never blocks: a value the consumer has not picked up yet is
+    overwritten (and counted), so a slow consumer always sees the newest
+    value instead of a growing backlog.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._value = None
+        self._seq = 0
+        self._taken_seq = 0
+        self._closed = False
+
+        # Counters
+        self.published = 0
+        self.overwritten = 0
+
+    def put(self, value):
+        """Publish a value, replacing any value not yet consumed."""
+        with self._cond:
+            if self._seq > self._taken_seq:
+                self.overwritten += 1
+            self._value = value
+            self._seq += 1
+            self.published += 1
+            self._cond.notify_all()
+
+    def get(self, after_seq=0, timeout=None):
+        """
+        Wait for a value newer than ``after_seq``.
+
+        Args:
+            after_seq: Sequence number of the last value the caller has seen
+            timeout: Maximum seconds to wait (None = until closed)
+
+        Returns:
+            tuple: (seq, value), or (after_seq, None) on timeout / close
+        """
+        with self._cond:
+            self._cond.wait_for(
+                lambda: self._closed or self._seq > after_seq, timeout=timeout)
+            if self._seq <= after_seq:
+                return after_seq, None
+            self._taken_seq = self._seq
+            return self._seq, self._value
+
+    def peek(self):
+        """Newest value without waiting (None if nothing was published)."""
+        with self._cond:
+            self._taken_seq = self._seq
+            return self._value
+
+    def close(self):
+        """Wake up every waiting consumer; later gets return immediately."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class InferenceOutput:
+    """Everything the inference stage produced for one camera frame."""
+
+    __slots__ = ('frame_ctx', 'landmarks', 'pose_frame', 'hand_info', 'seq')
+
+    def __init__(self, frame_ctx, landmarks, pose_frame, hand_info, seq):
+        self.frame_ctx = frame_ctx
+        self.landmarks = landmarks
+        self.pose_frame = pose_frame
+        self.hand_info = hand_info
+        self.seq = seq
+
+
+class PipelineStage(threading.Thread):
+    """
+    Base class of a pipeline thread.
+
+    Subclasses implement ``step()``, which is called until ``stop()``. An
+    exception ends the stage and is kept in ``error`` for the owner.
+    """
+
+    def __init__(self, name):
+        super().__init__(name=name, daemon=True)
+        self._stop_event = threading.Event()
+        self.error = None
+        self.steps = 0
+
+    def run(self):
+        try:
+            while not self._stop_event.is_set():
+                if self.step():
+                    self.steps += 1
+        except Exception as e:
+            self.error = e
+            print(f"[Error] Stage {self.name} berhenti: {e}")
+
+    def step(self):
+        """One unit of work; return True if something was produced."""
+        raise NotImplementedError
+
+    def stop(self):
+        self._stop_event.set()
+
+    def idle(self, seconds):
+        """Sleep, but wake up immediately on stop()."""
+        self._stop_event.wait(seconds)
+
+
+class InferenceStage(PipelineStage):
+    """
+    Capture + pose/hands inference at camera rate.
+
+    Reads the newest camera frame, runs the stages the current game state
+    asks for and publishes an InferenceOutput (with the PoseFrame already
+    decoded for the current screen size).
+    """
+
+    IDLE_SECONDS = 0.01
+    FRAME_WAIT = 0.1  # Seconds to wait for a new camera frame per step
+
+    def __init__(self, capture, pose_detector, replay=False):
+        """
+        Args:
+            capture: Started CameraCapture
+            pose_detector: PoseDetector (only driven from this thread)
+            replay: Source is a file/synthetic replay; frames are read in
+                    every state so the replay timeline stays intact
+        """
+        super().__init__("InferenceStage")
+        self.capture = capture
+        self.pose_detector = pose_detector
+        self.replay = replay
+        self.output = LatestValueSlot()
+        self.ended = False
+        self._last_seq = 0
+
+        self._lock = threading.Lock()
+        self._stages = frozenset()
+        self._screen_size = (1, 1)
+        self._screen_transform = normalized_to_screen(1, 1)
+
+    def configure(self, stages, screen_width, screen_height):
+        """Set the stages of the current game state and the screen size."""
+        with self._lock:
+            self._stages = stages
+            if self._screen_size != (screen_width, screen_height):
+                self._screen_size = (screen_width, screen_height)
+                self._screen_transform = normalized_to_screen(
+                    screen_width, screen_height)
+
+    def step(self):
+        with self._lock:
+            stages = self._stages
+            screen_w, screen_h = self._screen_size
+            transform = self._screen_transform
+
+        if CAPTURE not in stages and not self.replay:
+            self.idle(self.IDLE_SECONDS)
+            return False
+
+        with profiler.stage('capture'):
+            captured = self.capture.read(timeout=self.FRAME_WAIT)
+        if captured is None and self.capture.ended:
+            # Sumber habis: beri tahu render loop lalu berhenti
+            self.ended = True
+            self.output.close()
+            self.stop()
+            return False
+        if captured is None or captured.seq == self._last_seq:
+            # Belum ada frame (baru) dari kamera
+            return False
+        self._last_seq = captured.seq
+
+        frame_ctx = FrameContext.from_capture(captured)
+        landmarks = None
+        pose_frame = None
+        hand_info = self.pose_detector.empty_hand_info()
+        if POSE in stages:
+            landmarks, hand_info = self.pose_detector.process_frame(
+                frame_ctx, screen_w, screen_h, with_hands=HANDS in stages)
+            pose_frame = PoseFrame.from_landmarks(
+                landmarks, screen_w, screen_h, transform)
+
+        self.output.put(InferenceOutput(frame_ctx, landmarks, pose_frame,
+                                        hand_info, captured.seq))
+        return True
+
+
+class SimulationStage(PipelineStage):
+    """
+    Fixed-timestep GameEngine.update on its own thread.
+
+    Each tick consumes the newest inference output. Object positions before
+    and after the tick are kept so the renderer can interpolate between the
+    last two ticks at any display rate.
+    """
+
+    MAX_CATCH_UP_TICKS = 5
+
+    def __init__(self, game_engine, inference_slot, tick_rate=60.0):
+        """
+        Args:
+            game_engine: GameEngine to advance
+            inference_slot: LatestValueSlot with InferenceOutput values
+            tick_rate: Simulation ticks per second
+        """
+        super().__init__("SimulationStage")
+        self.game_engine = game_engine
+        self.inference_slot = inference_slot
+        self.tick_dt = 1.0 / tick_rate
+
+        # Dipegang saat update dan saat render membaca objek game
+        self.world_lock = threading.RLock()
+        self._active = threading.Event()
+        self._next_tick = None
+        self._previous = {}
+        self._tick_time = None
+
+        # Counters
+        self.late_ticks = 0
+
+    def set_active(self, active):
+        """Run (True) or pause (False) the simulation."""
+        if active and not self._active.is_set():
+            with self.world_lock:
+                self._previous = {}
+                self._tick_time = None
+                self._next_tick = None
+            self._active.set()
+        elif not active:
+            self._active.clear()
+
+    def step(self):
+        if not self._active.wait(timeout=0.05):
+            return False
+
+        now = time.perf_counter()
+        if self._next_tick is None:
+            self._next_tick = now
+        if now < self._next_tick:
+            self.idle(self._next_tick - now)
+            return False
+        if now - self._next_tick > self.MAX_CATCH_UP_TICKS * self.tick_dt:
+            # Terlalu tertinggal: lewati tick daripada mengejar terus
+            self.late_ticks += 1
+            self._next_tick = now
+        self._next_tick += self.tick_dt
+
+        output = self.inference_slot.peek()
+        pose_frame = output.pose_frame if output is not None else None
+        hand_info = output.hand_info if output is not None else \
+            self.game_engine.pose_detector.empty_hand_info()
+
+        engine = self.game_engine
+        with self.world_lock:
+            if not self._active.is_set():
+                return False
+            previous = {obj: (obj.x, obj.y)
+                        for group in (engine.targets, engine.obstacles, engine.powerups)
+                        for obj in group}
+            engine.update(self.tick_dt, pose_frame, hand_info)
+            self._previous = previous
+            self._tick_time = time.perf_counter()
+        return True
+
+    def interpolated_positions(self, now=None):
+        """
+        Render positions between the last two ticks (call with world_lock).
+
+        Returns:
+            dict: {game object: (x, y)}; objects spawned in the last tick
+                  are drawn at their current position
+        """
+        if self._tick_time is None:
+            return {}
+        now = time.perf_counter() if now is None else now
+        alpha = min(1.0, max(0.0, (now - self._tick_time) / self.tick_dt))
+        positions = {}
+        for obj, (x0, y0) in self._previous.items():
+            positions[obj] = (x0 + (obj.x - x0) * alpha,
+                              y0 + (obj.y - y0) * alpha)
+        return positions
+
+
+class PipelineRuntime:
+    """
+    Owner of the inference and simulation stages.
+
+    The render loop stays on the main thread (pygame needs it for the window
+    and events); it tells the runtime which stages the current game state
+    needs and reads the newest results without ever waiting on inference.
+    Shutdown stops the stages in a fixed order: simulation first (it reads
+    inference), then inference, each joined before the next.
+    """
+
+    JOIN_TIMEOUT = 5.0
+
+    def __init__(self, capture, pose_detector, game_engine, replay=False,
+                 tick_rate=60.0):
+        """
+        Args:
+            capture: Started CameraCapture
+            pose_detector: PoseDetector driven by the inference stage
+            game_engine: GameEngine driven by the simulation stage
+            replay: Source is a replay (see InferenceStage)
+            tick_rate: Simulation ticks per second
+        """
+        self.inference = InferenceStage(capture, pose_detector, replay=replay)
+        self.simulation = SimulationStage(game_engine, self.inference.output,
+                                          tick_rate=tick_rate)
+        self._stages = (self.simulation, self.inference)
+        self._started = False
+
+    @property
+    def world_lock(self):
+        return self.simulation.world_lock
+
+    @property
+    def ended(self) -> bool:
+        """True when the frame source ran out or a stage failed."""
+        return self.inference.ended or any(s.error is not None for s in self._stages)
+
+    def start(self):
+        for stage in reversed(self._stages):
+            stage.start()
+        self._started = True
+
+    def configure(self, stages, screen_width, screen_height):
+        """Apply the pipeline stages of the current game state."""
+        self.inference.configure(stages, screen_width, screen_height)
+        self.simulation.set_active(SIMULATION in stages)
+
+    def latest(self):
+        """Newest InferenceOutput (None before the first frame)."""
+        return self.inference.output.peek()
+
+    def stop(self):
+        """Stop and join every stage in order (idempotent)."""
+        if not self._started:
+            return
+        self._started = False
+        self.simulation.set_active(False)
+        for stage in self._stages:
+            stage.stop()
+            if stage is self.inference:
+                stage.output.close()
+            stage.join(timeout=self.JOIN_TIMEOUT)
+            if stage.is_alive():
+                print(f"[Warning] Stage {stage.name} tidak berhenti "
+                      f"dalam {self.JOIN_TIMEOUT:.0f} detik")
+
+    def get_stats(self) -> dict:
+        """Return stage counters."""
+        slot = self.inference.output
+        return {
+            'inference_frames': self.inference.steps,
+            'inference_overwritten': slot.overwritten,
+            'simulation_ticks': self.simulation.steps,
+            'late_ticks': self.simulation.late_ticks,
+        }
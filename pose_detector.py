@@ -3,8 +3,40 @@ Pose Detector Module
 Handles human pose detection and hand gesture recognition using MediaPipe.
 """
 
-import mediapipe as mp
-import cv2
+import threading
+import time
+
+from frame_context import FrameContext
+from profiler import profiler
+from inference_workers import ConcurrentInference
+from inference_server import InferenceClient
+from hand_roi import HandRoiCropper
+from model_autotuner import ModelAutotuner, tier_for
+from coordinate_transform import LetterboxResizer, map_landmarks, map_hands_result
+from gesture_classifier import (GestureClassifier, classify_batch, hands_to_array,
+                                FIST, GESTURE_NAMES)
+
+
+def preload_mediapipe():
+    """
+    Start importing MediaPipe (and OpenCV) on a background thread.
+
+    Lets the slow import overlap with window creation, camera opening and
+    asset loading; PoseDetector() then finds the modules already loaded.
+
+    Returns:
+        threading.Thread: The loader thread
+    """
+    def load():
+        try:
+            import cv2  # noqa: F401
+            import mediapipe  # noqa: F401
+        except ImportError as e:
+            print(f"[Warning] Preload MediaPipe gagal: {e}")
+
+    thread = threading.Thread(target=load, name="MediaPipePreload", daemon=True)
+    thread.start()
+    return thread
 
 
 class PoseDetector:
@@ -19,7 +51,18 @@ class PoseDetector:
         model_complexity=1,
         smooth_landmarks=True,
         min_detection_confidence=0.5,
-        min_tracking_confidence=0.5
+        min_tracking_confidence=0.5,
+        inference_mode='inline',
+        max_in_flight=1,
+        hand_roi=False,
+        scheduler=None,
+        hands_complexity=1,
+        latency_target_ms=None,
+        inference_size=None,
+        letterbox=True,
+        motion_gate=None,
+        hand_gate=None,
+        replay=False
     ):
         """
         Initialize the PoseDetector with both pose and hands detection.
@@ -30,25 +73,83 @@ class PoseDetector:
             smooth_landmarks: Whether to smooth landmarks across frames
             min_detection_confidence: Minimum confidence for detection
             min_tracking_confidence: Minimum confidence for tracking
+            inference_mode: 'inline' (pose then hands on the calling thread),
+                            'threads' (pose and hands in parallel workers) or
+                            'process' (both models in a separate process)
+            max_in_flight: Frames that may be queued in 'threads' mode. With 1,
+                           process_frame() waits for the current frame; with
+                           more, it returns the newest finished result.
+            hand_roi: Run Hands only on crops around the pose hand landmarks
+                      (falls back to the full frame without a pose). Not used
+                      in 'process' mode.
+            scheduler: InferenceScheduler deciding which models run on each
+                       frame; skipped results are predicted. None runs every
+                       model on every frame.
+            hands_complexity: Complexity of hands model (0 = lite, 1 = full)
+            latency_target_ms: Per-frame inference latency target; when set,
+                               Pose/Hands complexity is switched at runtime
+                               to stay inside it
+            inference_size: (width, height) the models run at; frames are
+                            resized into a reusable buffer. None uses the
+                            camera resolution.
+            letterbox: Keep the aspect ratio when resizing (pad with black)
+            motion_gate: MotionGate; while the image does not change, the
+                         previous result is reused instead of running the
+                         models
+            hand_gate: HandGate; Hands only runs when a hand is near an
+                       interactive region (or the hand state got too old),
+                       otherwise the last hand state is reused/predicted
+            replay: The frames come from a recording; 'threads' mode then
+                    waits for a free slot instead of skipping frames and
+                    'process' mode waits for each frame's result, so every
+                    frame is inferred and results are reproducible
         """
-        # Initialize MediaPipe Pose
-        self.mp_pose = mp.solutions.pose
-        self.pose = self.mp_pose.Pose(
+        if inference_mode not in ('inline', 'threads', 'process'):
+            raise ValueError(f"Unknown inference_mode: {inference_mode}")
+        self.inference_mode = inference_mode
+        self.replay = replay
+
+        self.pose_kwargs = dict(
             static_image_mode=static_image_mode,
             model_complexity=model_complexity,
             smooth_landmarks=smooth_landmarks,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence
         )
-        
-        # Initialize MediaPipe Hands
-        self.mp_hands = mp.solutions.hands
-        self.hands = self.mp_hands.Hands(
+        self.hands_kwargs = dict(
             static_image_mode=False,
             max_num_hands=2,
+            model_complexity=hands_complexity,
             min_detection_confidence=0.5,
             min_tracking_confidence=0.5
         )
+
+        # MediaPipe baru dimuat di sini, bukan saat modul di-import
+        import mediapipe as mp
+        self.mp_pose = mp.solutions.pose
+        self.mp_hands = mp.solutions.hands
+        self.pose = None
+        self.hands = None
+        self.client = None
+        self.roi_cropper = None
+        # Hands kedua khusus untuk crop, agar tracking full-frame tidak tercampur
+        self.hand_roi = hand_roi and inference_mode != 'process'
+
+        self._install_graphs(self._build_graphs(model_complexity, hands_complexity))
+
+        # Ganti kompleksitas model otomatis sesuai target latensi
+        self.autotuner = None
+        if latency_target_ms:
+            self.autotuner = ModelAutotuner(
+                latency_target_ms, self._build_tier,
+                start_tier=tier_for(model_complexity, hands_complexity))
+        self._last_landmarks = None
+        self._last_hand_info = None
+
+        # Cadence pose/hands + prediksi landmark di antara inference
+        self.scheduler = scheduler
+        self._last_result_seq = None
+        self._result_time = None
         
         # Hand landmark indices for fist detection
         self.WRIST = 0
@@ -58,97 +159,215 @@ class PoseDetector:
         self.RING_TIP = 16
         self.PINKY_TIP = 20
 
+        # Gesture per tangan dengan hysteresis (anti kedip kepalan)
+        self.gestures = GestureClassifier()
+
+        # Lewati inference saat gambar diam
+        self.motion_gate = motion_gate
+        self._gated_output = None
+
+        # Hands hanya saat relevan
+        self.hand_gate = hand_gate
+        self._fresh_hand_info = None
+
+        # Input model di resolusi tetap, landmark dipetakan balik ke kamera
+        self.resizer = None
+        if inference_size:
+            self.resizer = LetterboxResizer(
+                inference_size, letterbox=letterbox, buffers=max_in_flight + 1)
+
+        # Concurrent inference workers
+        self.workers = None
+        if inference_mode == 'threads':
+            self.workers = ConcurrentInference(self, max_in_flight=max_in_flight,
+                                               blocking=replay)
+
+    def _build_graphs(self, pose_complexity, hands_complexity):
+        """
+        Create the MediaPipe graphs for the given model complexities.
+
+        Returns:
+            dict: 'client' in process mode, otherwise 'pose', 'hands' and
+                  (with hand ROI) 'roi_hands'
+        """
+        pose_kwargs = dict(self.pose_kwargs, model_complexity=pose_complexity)
+        hands_kwargs = dict(self.hands_kwargs, model_complexity=hands_complexity)
+
+        if self.inference_mode == 'process':
+            # Graph MediaPipe hidup di proses terpisah
+            client = InferenceClient(pose_kwargs, hands_kwargs)
+            if threading.current_thread() is not threading.main_thread():
+                # Build autotuner: pastikan server benar-benar siap sebelum dipakai
+                try:
+                    client.wait_ready()
+                except RuntimeError:
+                    client.close()
+                    raise
+            return {'client': client}
+
+        graphs = {
+            'pose': self.mp_pose.Pose(**pose_kwargs),
+            'hands': self.mp_hands.Hands(**hands_kwargs),
+        }
+        if self.hand_roi:
+            graphs['roi_hands'] = self.mp_hands.Hands(**hands_kwargs)
+        return graphs
+
+    def _build_tier(self, tier):
+        """Autotuner build callback (runs on the builder thread)."""
+        return self._build_graphs(tier.pose_complexity, tier.hands_complexity)
+
+    def _install_graphs(self, graphs):
+        """
+        Make ``graphs`` the active models.
+
+        Returns:
+            dict: The graphs that were active before (to be closed)
+        """
+        old = {'pose': self.pose, 'hands': self.hands, 'client': self.client,
+               'roi_hands': self.roi_cropper.hands if self.roi_cropper else None}
+
+        self.pose = graphs.get('pose')
+        self.hands = graphs.get('hands')
+        self.client = graphs.get('client')
+        if self.client is not None:
+            # Client baru mulai dari seq 1
+            self._last_result_seq = None
+        if 'roi_hands' in graphs:
+            if self.roi_cropper is None:
+                self.roi_cropper = HandRoiCropper(graphs['roi_hands'])
+            else:
+                self.roi_cropper.hands = graphs['roi_hands']
+        return old
+
+    @staticmethod
+    def _close_graphs(graphs):
+        for name, graph in graphs.items():
+            if graph is not None:
+                graph.close()
+
+    def _apply_tier_switch(self):
+        """Swap in graphs built by the autotuner (between frames only)."""
+        result = self.autotuner.poll()
+        if result is None or result[1] is None:
+            return
+        if self.workers is not None:
+            # Worker masih memakai graph lama: selesaikan frame yang antri dulu.
+            # Dengan max_in_flight > 1 selalu ada frame in-flight, jadi
+            # menunggu sampai kosong sendiri tidak pernah terjadi
+            self.workers.drain()
+        self._close_graphs(self._install_graphs(result[1]))
+
+    @property
+    def model_tier(self):
+        """Label of the active model tier (None without autotuning)."""
+        if self.autotuner is None:
+            return None
+        return self.autotuner.tier.label()
+
     def detect_pose(self, frame):
         """
         Detect pose landmarks in the given frame.
 
         Args:
-            frame: Input BGR image from camera
+            frame: FrameContext, or input BGR image from camera
 
         Returns:
             tuple: (processed_frame, landmarks)
                 - processed_frame: RGB frame after processing
                 - landmarks: Detected pose landmarks or None
         """
-        # Convert BGR to RGB for MediaPipe
-        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Convert BGR to RGB for MediaPipe (shared via FrameContext)
+        frame_rgb = self._to_rgb(frame, bgr=True)
         
         # Process the frame
-        results = self.pose.process(frame_rgb)
-        
-        return frame_rgb, results.pose_landmarks
+        if not isinstance(frame, FrameContext):
+            frame = frame_rgb
+        return frame_rgb, self._run_pose(frame)
+
+    @staticmethod
+    def _to_rgb(frame, bgr=False):
+        """
+        Get the RGB image for a frame.
+
+        Args:
+            frame: FrameContext or numpy image
+            bgr: Whether a plain numpy image is BGR (needs conversion)
+        """
+        if isinstance(frame, FrameContext):
+            return frame.rgb
+        if bgr:
+            import cv2
+            return cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        return frame
+
+    def _model_input(self, frame):
+        """
+        Image the models run on, plus the transform back to the frame.
+
+        With an inference size the frame is resized into the resizer's
+        buffer, once per FrameContext.
+
+        Args:
+            frame: FrameContext or RGB image
+
+        Returns:
+            tuple: (image, transform) - transform is None without resizing
+        """
+        if isinstance(frame, FrameContext):
+            if frame.model_input is None:
+                frame.model_input = self._prepare_input(frame.rgb)
+            return frame.model_input
+        return self._prepare_input(frame)
+
+    def _prepare_input(self, frame_rgb):
+        if self.resizer is None:
+            return frame_rgb, None
+        return self.resizer.resize(frame_rgb)
 
     def detect_hands(self, frame_rgb):
         """
         Detect hand landmarks in the given frame.
 
         Args:
-            frame_rgb: Input RGB image
+            frame_rgb: FrameContext or input RGB image
 
         Returns:
             hands_results: MediaPipe hands results containing multi_hand_landmarks and multi_handedness
         """
-        results = self.hands.process(frame_rgb)
-        return results
+        image, transform = self._model_input(frame_rgb)
+        if self.client is not None:
+            _, results = self.client.process_frame(
+                image, run_pose=False, run_hands=True)
+        else:
+            results = self.hands.process(image)
+        return map_hands_result(results, transform)
 
     def is_fist(self, hand_landmarks):
         """
         Determine if a hand is making a fist gesture.
-        
-        Algorithm:
-        - Calculate distance from each fingertip to wrist
-        - Calculate distance from each fingertip to palm center (landmark 0)
-        - If all fingers are close to palm → FIST
-        - If fingers are extended → OPEN HAND
-        
+
+        Uses the scale-normalized gesture kernel (see gesture_classifier):
+        every finger except the thumb must be curled, i.e. its tip closer
+        to the wrist than its middle joint. Stateless; the live pipeline
+        additionally applies per-hand hysteresis.
+
         Args:
             hand_landmarks: MediaPipe hand landmarks
-            
+
         Returns:
             bool: True if hand is making a fist, False otherwise
         """
         if not hand_landmarks:
             return False
-        
-        # Get wrist position
-        wrist = hand_landmarks.landmark[self.WRIST]
-        
-        # Get fingertips
-        thumb_tip = hand_landmarks.landmark[self.THUMB_TIP]
-        index_tip = hand_landmarks.landmark[self.INDEX_TIP]
-        middle_tip = hand_landmarks.landmark[self.MIDDLE_TIP]
-        ring_tip = hand_landmarks.landmark[self.RING_TIP]
-        pinky_tip = hand_landmarks.landmark[self.PINKY_TIP]
-        
-        # Calculate distances from fingertips to wrist (normalized 0-1)
-        def distance(p1, p2):
-            return ((p1.x - p2.x)**2 + (p1.y - p2.y)**2 + (p1.z - p2.z)**2)**0.5
-        
-        # Threshold for fist detection
-        # If fingertips are close to wrist, it's a fist
-        FIST_THRESHOLD = 0.15  # Adjusted threshold
-        
-        index_dist = distance(index_tip, wrist)
-        middle_dist = distance(middle_tip, wrist)
-        ring_dist = distance(ring_tip, wrist)
-        pinky_dist = distance(pinky_tip, wrist)
-        
-        # Check if all fingers (except thumb) are close to wrist
-        fingers_closed = (
-            index_dist < FIST_THRESHOLD and
-            middle_dist < FIST_THRESHOLD and
-            ring_dist < FIST_THRESHOLD and
-            pinky_dist < FIST_THRESHOLD
-        )
-        
-        return fingers_closed
+        return bool(classify_batch(hands_to_array([hand_landmarks]))[0] == FIST)
 
     def get_hand_info(self, frame_rgb, frame_width, frame_height):
         """
         Get hand positions and fist status for both hands.
         
         Args:
-            frame_rgb: RGB frame
+            frame_rgb: FrameContext or RGB frame
             frame_width: Width of the frame in pixels
             frame_height: Height of the frame in pixels
             
@@ -157,54 +376,266 @@ class PoseDetector:
                 'left_hand': {
                     'position': (x, y) or None,
                     'is_fist': bool,
-                    'landmarks': hand_landmarks or None
+                    'gesture': 'none' | 'fist' | 'open' | 'pointing',
+                    'landmarks': hand_landmarks or None,
+                    'predicted': bool (True = extrapolated, not inferred)
                 },
-                'right_hand': {
-                    'position': (x, y) or None,
-                    'is_fist': bool,
-                    'landmarks': hand_landmarks or None
-                }
+                'right_hand': {...}
             }
         """
         hands_results = self.detect_hands(frame_rgb)
-        
-        hand_info = {
-            'left_hand': {'position': None, 'is_fist': False, 'landmarks': None},
-            'right_hand': {'position': None, 'is_fist': False, 'landmarks': None}
+        return self._build_hand_info(hands_results, frame_width, frame_height)
+
+    @staticmethod
+    def empty_hand_info():
+        """Hand info dict with no hand detected."""
+        return {
+            'left_hand': {'position': None, 'is_fist': False, 'gesture': 'none',
+                          'landmarks': None, 'predicted': False},
+            'right_hand': {'position': None, 'is_fist': False, 'gesture': 'none',
+                           'landmarks': None, 'predicted': False}
         }
+
+    def _build_hand_info(self, hands_results, frame_width, frame_height):
+        """Convert MediaPipe Hands results into the hand info dict."""
+        hand_info = self.empty_hand_info()
         
         if not hands_results.multi_hand_landmarks:
+            self.gestures.reset()
             return hand_info
         
-        # Process each detected hand
-        for idx, hand_landmarks in enumerate(hands_results.multi_hand_landmarks):
-            # Determine if it's left or right hand
-            handedness = hands_results.multi_handedness[idx].classification[0].label
-            
-            # Karena frame di-mirror di game_engine (cv2.flip), 
+        # Klasifikasi gesture semua tangan sekaligus (vectorized)
+        hand_types = [
+            # Karena frame di-mirror di game_engine (cv2.flip),
             # MediaPipe "Left" = tangan kiri user (tidak perlu swap)
-            # MediaPipe "Right" = tangan kanan user (tidak perlu swap)
-            hand_type = 'left_hand' if handedness == 'Left' else 'right_hand'
-            
+            'left_hand' if handed.classification[0].label == 'Left' else 'right_hand'
+            for handed in hands_results.multi_handedness
+        ]
+        gestures = self.gestures.classify(
+            hands_to_array(hands_results.multi_hand_landmarks), hand_types)
+
+        # Process each detected hand
+        for hand_landmarks, hand_type, gesture in zip(
+                hands_results.multi_hand_landmarks, hand_types, gestures):
             # Get wrist position (landmark 0) as hand position
             wrist = hand_landmarks.landmark[self.WRIST]
             hand_position = (
                 int(wrist.x * frame_width),
                 int(wrist.y * frame_height)
             )
-            
-            # Detect fist gesture
-            fist_detected = self.is_fist(hand_landmarks)
-            
+
             # Store hand info
             hand_info[hand_type] = {
                 'position': hand_position,
-                'is_fist': fist_detected,
-                'landmarks': hand_landmarks
+                'is_fist': gesture == FIST,
+                'gesture': GESTURE_NAMES[gesture],
+                'landmarks': hand_landmarks,
+                'predicted': False
             }
-        
+
         return hand_info
 
+    @profiler.timed('pose')
+    def _run_pose(self, frame_rgb):
+        """Run the Pose graph on a FrameContext or RGB image (worker entry point)."""
+        image, transform = self._model_input(frame_rgb)
+        if self.client is not None:
+            landmarks, _ = self.client.process_frame(
+                image, run_pose=True, run_hands=False)
+        else:
+            landmarks = self.pose.process(image).pose_landmarks
+        return map_landmarks(landmarks, transform)
+
+    @profiler.timed('hands')
+    def _run_hands(self, frame_rgb, pose_landmarks=None):
+        """
+        Run the Hands graph on an RGB image (worker entry point).
+
+        With hand ROI enabled and a pose available, only the crops around
+        the pose hands are processed. Returns the raw Hands results; the
+        hand info (and the gesture hysteresis) is built by the caller.
+        """
+        if self.roi_cropper is not None and pose_landmarks is not None:
+            hands_results = self.roi_cropper.detect(
+                self._to_rgb(frame_rgb), pose_landmarks)
+            if hands_results is not None:
+                return hands_results
+        return self.detect_hands(frame_rgb)
+
+    def process_frame(self, frame_ctx, frame_width, frame_height, with_hands=True):
+        """
+        Run pose and hand detection for one frame.
+
+        With a scheduler, models that are not due on this frame are skipped
+        and their results are predicted (flagged with ``predicted``).
+
+        Args:
+            frame_ctx: FrameContext of the current frame
+            frame_width: Width used for hand positions
+            frame_height: Height used for hand positions
+            with_hands: Also run hand detection
+
+        Returns:
+            tuple: (landmarks, hand_info)
+        """
+        if self.autotuner is not None:
+            self._apply_tier_switch()
+
+        if self.motion_gate is not None:
+            # Hasil lama hanya bisa dipakai jika memuat hands saat dibutuhkan
+            reusable = (self._gated_output is not None and
+                        (self._gated_output[2] or not with_hands))
+            if not reusable:
+                self.motion_gate.reset()
+            if not self.motion_gate.should_infer(frame_ctx):
+                landmarks, hand_info, _ = self._gated_output
+                return landmarks, hand_info if with_hands else self.empty_hand_info()
+
+        # Hands hanya jika tangan dekat sesuatu yang bisa disentuh
+        hands_gated = False
+        if with_hands and self.hand_gate is not None:
+            now = frame_ctx.timestamp if frame_ctx.timestamp is not None \
+                else time.perf_counter()
+            hands_gated = not self.hand_gate.needs_hands(
+                self._last_landmarks, frame_width, frame_height, now)
+
+        landmarks, hand_info = self._process_frame(
+            frame_ctx, frame_width, frame_height, with_hands and not hands_gated)
+        if hands_gated:
+            hand_info = self._reuse_hands(now, frame_width, frame_height)
+        elif with_hands:
+            self._fresh_hand_info = hand_info
+
+        if self.motion_gate is not None:
+            self._gated_output = (landmarks, hand_info, with_hands)
+        return landmarks, hand_info
+
+    def _reuse_hands(self, now, frame_width, frame_height):
+        """Hand state for a frame where Hands was gated off (flagged predicted)."""
+        if self.scheduler is not None:
+            # Scheduler mengekstrapolasi posisi dari riwayat tangan
+            return self.scheduler.hands_result(
+                self.empty_hand_info(), False, now, frame_width, frame_height)
+        if self._fresh_hand_info is None:
+            return self.empty_hand_info()
+        return {hand: dict(info, predicted=True)
+                for hand, info in self._fresh_hand_info.items()}
+
+    def _process_frame(self, frame_ctx, frame_width, frame_height, with_hands):
+        """Inference (or prediction) for one frame; see process_frame()."""
+        if self.scheduler is None:
+            landmarks, hand_info, fresh_pose, _ = self._infer(
+                frame_ctx, frame_width, frame_height, True, with_hands)
+            if (self.workers is not None or self.client is not None) and not fresh_pose:
+                # Belum ada hasil baru: pakai hasil terakhir
+                if self._last_hand_info is None:
+                    return None, self.empty_hand_info()
+                return self._last_landmarks, self._last_hand_info
+            self._last_landmarks = landmarks
+            self._last_hand_info = hand_info
+            return landmarks, hand_info
+
+        now = frame_ctx.timestamp if frame_ctx.timestamp is not None else time.perf_counter()
+        run_pose, run_hands = self.scheduler.plan(with_hands)
+        landmarks, hand_info, fresh_pose, fresh_hands = self._infer(
+            frame_ctx, frame_width, frame_height, run_pose, run_hands)
+
+        # Hasil mode threads milik frame yang lebih lama: pakai waktu frame itu
+        result_time = self._result_time if self._result_time is not None else now
+        if fresh_pose:
+            landmarks = self.scheduler.pose_result(landmarks, True, result_time)
+        else:
+            landmarks = self.scheduler.pose_result(None, False, now)
+
+        if not with_hands:
+            hand_info = self.empty_hand_info()
+        elif fresh_hands:
+            hand_info = self.scheduler.hands_result(
+                hand_info, True, result_time, frame_width, frame_height)
+        else:
+            hand_info = self.scheduler.hands_result(
+                hand_info, False, now, frame_width, frame_height)
+
+        self._last_landmarks = landmarks
+        return landmarks, hand_info
+
+    def _infer(self, frame_ctx, frame_width, frame_height, run_pose, run_hands):
+        """
+        Run the requested models with the configured inference mode.
+
+        Returns:
+            tuple: (landmarks, hand_info, fresh_pose, fresh_hands) where the
+                   fresh flags tell whether a new result was produced for
+                   each model. ``self._result_time`` is the capture time of
+                   the frame that result belongs to.
+        """
+        self._result_time = frame_ctx.timestamp
+        if not (run_pose or run_hands):
+            return None, self.empty_hand_info(), False, False
+
+        if self.client is not None:
+            # Satu permintaan ke proses inference untuk pose + hands; tanpa
+            # menunggu, kecuali replay (hasil harus milik frame ini)
+            image, transform = self._model_input(frame_ctx)
+            seq = self.client.submit(image, run_pose=run_pose, run_hands=run_hands,
+                                     context=(frame_ctx.timestamp, transform))
+            result = self.client.collect(wait_seq=seq if self.replay else None)
+            if result is None or result.seq == self._last_result_seq:
+                return None, self.empty_hand_info(), False, False
+            self._last_result_seq = result.seq
+            self._result_time, transform = result.context
+            self._record_cost(result.ran_pose, result.ran_hands, result.latency)
+            landmarks = map_landmarks(result.landmarks, transform)
+            hands_results = map_hands_result(result.hands_result, transform)
+            return (landmarks,
+                    self._build_hand_info(hands_results, frame_width, frame_height),
+                    result.ran_pose, result.ran_hands)
+
+        if self.workers is None:
+            landmarks = None
+            hand_info = self.empty_hand_info()
+            if run_pose:
+                start = time.perf_counter()
+                _, landmarks = self.detect_pose(frame_ctx)
+                self._record_cost(True, False, time.perf_counter() - start)
+            if run_hands:
+                start = time.perf_counter()
+                hands_results = self._run_hands(
+                    frame_ctx, landmarks if run_pose else self._last_landmarks)
+                hand_info = self._build_hand_info(
+                    hands_results, frame_width, frame_height)
+                self._record_cost(False, True, time.perf_counter() - start)
+            return landmarks, hand_info, run_pose, run_hands
+
+        # Hands berjalan paralel dengan pose, jadi crop memakai pose frame sebelumnya
+        seq = self.workers.submit(
+            frame_ctx, frame_width, frame_height, with_hands=run_hands,
+            pose_landmarks=self._last_landmarks, with_pose=run_pose)
+        # Satu frame in-flight = tunggu hasil frame ini (latensi = max, bukan jumlah)
+        wait_seq = seq if self.workers.max_in_flight == 1 else None
+        result = self.workers.collect(wait_seq=wait_seq)
+
+        if result is None or result.seq == self._last_result_seq:
+            return None, self.empty_hand_info(), False, False
+        self._last_result_seq = result.seq
+        self._result_time = result.timestamp
+        self._record_cost(result.ran_pose, result.ran_hands, result.latency)
+        return result.landmarks, result.hand_info, result.ran_pose, result.ran_hands
+
+    def _record_cost(self, ran_pose, ran_hands, seconds):
+        """
+        Report inference time to the scheduler and the autotuner (split
+        when both models ran).
+        """
+        share = seconds / (int(ran_pose) + int(ran_hands) or 1)
+        for stage, ran in (('pose', ran_pose), ('hands', ran_hands)):
+            if not ran:
+                continue
+            if self.scheduler is not None:
+                self.scheduler.record_cost(stage, share)
+            if self.autotuner is not None:
+                self.autotuner.observe(stage, share)
+
     def get_landmark_position(self, landmarks, landmark_id, frame_width, frame_height):
         """
         Get the pixel position of a specific landmark.
@@ -233,5 +664,10 @@ class PoseDetector:
 
     def close(self):
         """Release resources."""
-        self.pose.close()
-        self.hands.close()
+        if self.workers is not None:
+            self.workers.close()
+        if self.autotuner is not None:
+            unused = self.autotuner.close()
+            if unused:
+                self._close_graphs(unused)
+        self._close_graphs(self._install_graphs({}))
@@ -0,0 +1,85 @@
+"""
+Pose Frame Module
+Per-frame snapshot of the pose in normalized and screen coordinates.
+"""
+
+import numpy as np
+
+from body_model import BodyModel
+from coordinate_transform import normalized_to_screen
+from landmarks import PoseLandmark, landmarks_to_array
+
+
+class PoseFrame:
+    """
+    Pose landmarks decoded once per frame.
+
+    All 33 landmarks are converted in one vectorized pass; the engine, the
+    renderer and the menu cursor then read plain tuples instead of calling
+    ``PoseDetector.get_landmark_position`` on the protobuf again and again.
+
+    Attributes:
+        normalized: (33, 4) float32 array of x, y, z, visibility (0..1)
+        screen: (33, 4) float64 array with x/y (and z) scaled to the screen
+        points: List of (x, y) int tuples in screen pixels, one per landmark
+        body: BodyModel (head circle + capsules) shared by collision and
+              the stickman renderer
+        head_center / head_radius: Head circle (nose, 0.75 x ear distance)
+        neck / pelvis: Mid-shoulder and mid-hip points
+        left_wrist, left_elbow, left_index, right_*: Arm and hand points
+        predicted: True when the landmarks were extrapolated, not inferred
+    """
+
+    def __init__(self, landmarks, screen_width, screen_height, transform=None):
+        """
+        Args:
+            landmarks: Pose landmarks (protobuf or LandmarkList)
+            screen_width: Width of the target surface in pixels
+            screen_height: Height of the target surface in pixels
+            transform: Cached AffineTransform from normalized camera
+                       coordinates to the screen (default: plain scaling)
+        """
+        self.width = screen_width
+        self.height = screen_height
+        self.predicted = getattr(landmarks, 'predicted', False)
+        if transform is None:
+            transform = normalized_to_screen(screen_width, screen_height)
+
+        self.normalized = landmarks_to_array(landmarks)
+        # float64 agar hasil int() sama persis dengan get_landmark_position
+        self.screen = self.normalized.astype(np.float64)
+        self.screen[:, :2] = transform.apply(self.screen[:, :2])
+        self.screen[:, 2] *= transform.x_scale
+        screen_points = self.screen[:, :2].astype(np.int64)
+        self.points = [tuple(p) for p in screen_points.tolist()]
+
+        points = self.points
+        self.left_wrist = points[PoseLandmark.LEFT_WRIST]
+        self.right_wrist = points[PoseLandmark.RIGHT_WRIST]
+        self.left_elbow = points[PoseLandmark.LEFT_ELBOW]
+        self.right_elbow = points[PoseLandmark.RIGHT_ELBOW]
+        self.left_index = points[PoseLandmark.LEFT_INDEX]
+        self.right_index = points[PoseLandmark.RIGHT_INDEX]
+
+        # Kepala, leher, pinggul dan kapsul tubuh dihitung sekali di BodyModel
+        self.body = BodyModel(screen_points)
+        self.neck = self.body.neck
+        self.pelvis = self.body.pelvis
+        self.head_center = self.body.head_center
+        self.head_radius = self.body.head_radius
+
+    @classmethod
+    def from_landmarks(cls, landmarks, screen_width, screen_height, transform=None):
+        """
+        Build a PoseFrame, passing through None and existing PoseFrames.
+
+        Returns:
+            PoseFrame or None if there is no pose
+        """
+        if landmarks is None or isinstance(landmarks, PoseFrame):
+            return landmarks
+        return cls(landmarks, screen_width, screen_height, transform)
+
+    def point(self, landmark_id):
+        """Screen position (x, y) of one landmark."""
+        return self.points[landmark_id]
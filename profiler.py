@@ -0,0 +1,193 @@
+"""
+Profiler Module
+Per-stage frame timing with rolling percentiles, for the live overlay and
+for CSV/JSON export.
+"""
+
+import csv
+import functools
+import json
+import threading
+import time
+
+import numpy as np
+
+
+class _NullStage:
+    """Context manager that does nothing (profiler disabled)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Context manager timing one stage with perf_counter_ns."""
+
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, time.perf_counter_ns() - self.start)
+        return False
+
+
+class _StageRing:
+    """Fixed-size ring buffer of durations (ns) for one stage."""
+
+    __slots__ = ('samples', 'index', 'filled', 'count')
+
+    def __init__(self, size):
+        self.samples = np.zeros(size, dtype=np.int64)
+        self.index = 0
+        self.filled = 0
+        self.count = 0
+
+    def add(self, duration_ns):
+        self.samples[self.index] = duration_ns
+        self.index = (self.index + 1) % len(self.samples)
+        self.filled = min(self.filled + 1, len(self.samples))
+        self.count += 1
+
+    def values(self):
+        return self.samples[:self.filled]
+
+
+class Profiler:
+    """
+    Lightweight stage timer.
+
+    Stages are timed with ``with profiler.stage('name'):`` or the
+    ``@profiler.timed('name')`` decorator. Each stage keeps its last
+    ``window`` durations in a ring buffer, from which p50/p95/p99 are
+    computed on demand. While disabled, ``stage()`` returns a shared no-op
+    context manager and ``timed`` functions only pay one attribute check.
+    """
+
+    def __init__(self, enabled=False, window=300):
+        """
+        Args:
+            enabled: Start collecting immediately
+            window: Number of recent samples kept per stage
+        """
+        self.enabled = enabled
+        self.window = window
+        self._rings = {}
+        self._lock = threading.Lock()
+
+    def enable(self, enabled=True):
+        self.enabled = enabled
+
+    def reset(self):
+        """Drop all collected samples."""
+        with self._lock:
+            self._rings.clear()
+
+    def stage(self, name):
+        """Context manager timing the enclosed block as stage ``name``."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name)
+
+    def timed(self, name):
+        """Decorator timing every call of a function as stage ``name``."""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter_ns()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter_ns() - start)
+            return wrapper
+        return decorator
+
+    def record(self, name, duration_ns):
+        """
+        Add one measured duration.
+
+        Args:
+            name: Stage name
+            duration_ns: Duration in nanoseconds
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            ring = self._rings.get(name)
+            if ring is None:
+                ring = self._rings[name] = _StageRing(self.window)
+            ring.add(duration_ns)
+
+    def summary(self) -> dict:
+        """
+        Rolling statistics per stage.
+
+        Returns:
+            dict: {stage: {count, mean_ms, p50_ms, p95_ms, p99_ms, max_ms}}
+                  ordered by stage name
+        """
+        with self._lock:
+            snapshot = {name: (ring.values().copy(), ring.count)
+                        for name, ring in self._rings.items()}
+
+        stats = {}
+        for name in sorted(snapshot):
+            values, count = snapshot[name]
+            if not len(values):
+                continue
+            ms = values / 1e6
+            p50, p95, p99 = np.percentile(ms, (50, 95, 99))
+            stats[name] = {
+                'count': count,
+                'mean_ms': round(float(ms.mean()), 3),
+                'p50_ms': round(float(p50), 3),
+                'p95_ms': round(float(p95), 3),
+                'p99_ms': round(float(p99), 3),
+                'max_ms': round(float(ms.max()), 3),
+            }
+        return stats
+
+    def export(self, path):
+        """
+        Write the summary to ``path`` (.csv, otherwise JSON).
+
+        Returns:
+            bool: True if the file was written
+        """
+        stats = self.summary()
+        try:
+            if str(path).lower().endswith('.csv'):
+                fields = ['count', 'mean_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms']
+                with open(path, 'w', newline='') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(['stage'] + fields)
+                    for name, row in stats.items():
+                        writer.writerow([name] + [row[k] for k in fields])
+            else:
+                with open(path, 'w') as f:
+                    json.dump({'window': self.window, 'stages': stats}, f, indent=2)
+        except OSError as e:
+            print(f"[Error] Gagal menulis profil ke {path}: {e}")
+            return False
+        return True
+
+
+# Profiler bersama untuk semua modul; nonaktif sampai diaktifkan dari main
+profiler = Profiler()
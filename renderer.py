@@ -4,9 +4,12 @@ Handles all drawing operations for the Cam-Fu game.
 """
 
 import pygame
-import mediapipe as mp
 import os
 
+from camera_view import CameraBackgroundPresenter
+from frame_context import FrameContext
+from profiler import profiler
+
 
 class GameRenderer:
     """
@@ -41,6 +44,8 @@ class GameRenderer:
         self.font_medium = pygame.font.Font(None, 36)
         self.font_small = pygame.font.Font(None, 24)
         self.font_tiny = pygame.font.Font(None, 20)
+        # Monospace agar kolom overlay profiler rata
+        self.font_mono = pygame.font.SysFont('monospace', 14)
 
         # Load blood image for lives
         self.blood_image = None
@@ -93,8 +98,8 @@ class GameRenderer:
         else:
             print(f"[Warning] Menu button not found: {menu_path}")
 
-        # MediaPipe pose landmarks
-        self.mp_pose = mp.solutions.pose.PoseLandmark
+        # Background kamera untuk menu/guide/credits
+        self.camera_view = CameraBackgroundPresenter()
 
         self.game_over_played = False
 
@@ -127,24 +132,44 @@ class GameRenderer:
         else:
             self.screen.fill(self.BLACK)
 
-    def draw_game_objects(self, targets, obstacles, powerups):
-        """Draw all active game objects."""
+    @profiler.timed('draw.camera_bg')
+    def draw_camera_background(self, frame):
+        """
+        Draw the (mirrored) camera frame as a full-screen background.
+        Args:
+            frame: FrameContext or BGR image
+        """
+        bgr = frame.bgr if isinstance(frame, FrameContext) else frame
+        self.camera_view.present(
+            bgr, self.screen, (self.screen_width, self.screen_height))
+
+    @profiler.timed('draw.objects')
+    def draw_game_objects(self, targets, obstacles, powerups, positions=None):
+        """
+        Draw all active game objects.
+
+        Args:
+            targets, obstacles, powerups: Game object lists
+            positions: Optional {object: (x, y)} render positions
+                       (interpolated by the pipelined runtime)
+        """
+        positions = positions or {}
         for target in targets:
-            target.draw(self.screen)
+            target.draw(self.screen, positions.get(target))
 
         for obstacle in obstacles:
-            obstacle.draw(self.screen)
+            obstacle.draw(self.screen, positions.get(obstacle))
 
         for powerup in powerups:
-            powerup.draw(self.screen)
+            powerup.draw(self.screen, positions.get(powerup))
 
-    def draw_hand_indicators(self, hand_info, landmarks=None, pose_detector=None):
+    @profiler.timed('draw.hands')
+    def draw_hand_indicators(self, hand_info, pose_frame=None):
         """
         Draw visual indicators for hands and fist status.
         Args:
             hand_info: Dictionary containing left_hand and right_hand info
-            landmarks: Body pose landmarks (optional, for arm visualization)
-            pose_detector: PoseDetector instance (optional, for arm positions)
+            pose_frame: PoseFrame (optional, for arm visualization)
         """
         # Draw left hand indicator
         if hand_info['left_hand']['position']:
@@ -164,18 +189,9 @@ class GameRenderer:
                 self.screen.blit(fist_text, (pos[0] - 20, pos[1] - 50))
 
                 # Draw thick line on arm when fist (blocking stance)
-                if landmarks and pose_detector:
-                    left_wrist = pose_detector.get_landmark_position(
-                        landmarks, self.mp_pose.LEFT_WRIST.value,
-                        self.screen_width, self.screen_height
-                    )
-                    left_elbow = pose_detector.get_landmark_position(
-                        landmarks, self.mp_pose.LEFT_ELBOW.value,
-                        self.screen_width, self.screen_height
-                    )
-                    if left_wrist and left_elbow:
-                        pygame.draw.line(self.screen, self.ORANGE,
-                                         left_wrist, left_elbow, 15)
+                if pose_frame is not None:
+                    elbow, wrist, _ = pose_frame.body.capsule('left_forearm')
+                    pygame.draw.line(self.screen, self.ORANGE, wrist, elbow, 15)
 
         # Draw right hand indicator
         if hand_info['right_hand']['position']:
@@ -195,22 +211,20 @@ class GameRenderer:
                 self.screen.blit(fist_text, (pos[0] - 20, pos[1] - 50))
 
                 # Draw thick line on arm when fist (blocking stance)
-                if landmarks and pose_detector:
-                    right_wrist = pose_detector.get_landmark_position(
-                        landmarks, self.mp_pose.RIGHT_WRIST.value,
-                        self.screen_width, self.screen_height
-                    )
-                    right_elbow = pose_detector.get_landmark_position(
-                        landmarks, self.mp_pose.RIGHT_ELBOW.value,
-                        self.screen_width, self.screen_height
-                    )
-                    if right_wrist and right_elbow:
-                        pygame.draw.line(self.screen, self.ORANGE,
-                                         right_wrist, right_elbow, 15)
-
-    def draw_ui(self, score_manager, clock, hand_info):
+                if pose_frame is not None:
+                    elbow, wrist, _ = pose_frame.body.capsule('right_forearm')
+                    pygame.draw.line(self.screen, self.ORANGE, wrist, elbow, 15)
+
+    @profiler.timed('draw.ui')
+    def draw_ui(self, score_manager, clock, hand_info, model_tier=None):
         """
         Draw UI elements (score, lives, hand status, etc.).
+
+        Args:
+            score_manager: ScoreManager with score, lives and power-ups
+            clock: pygame Clock (for the FPS counter)
+            hand_info: Hand tracking information with fist status
+            model_tier: Label of the active model tier (optional)
         """
         # === BLOOD/LIVES (TOP LEFT CORNER) ===
         blood_size = 50  # Ukuran blood (50x50 px)
@@ -242,6 +256,13 @@ class GameRenderer:
         fps_y = self.screen_height - fps_text.get_height() - 20
         self.screen.blit(fps_text, (fps_x, fps_y))
 
+        # Tier model aktif (autotuner) di atas FPS
+        if model_tier:
+            tier_text = self.font_tiny.render(
+                f"MODEL: {model_tier}", True, self.GREEN)
+            tier_x = self.screen_width - tier_text.get_width() - 20
+            self.screen.blit(tier_text, (tier_x, fps_y - tier_text.get_height() - 5))
+
         # === ACTIVE POWER-UPS (BELOW BLOOD - TOP LEFT) ===
         y_offset = blood_start_y + blood_size + 15  # Start below blood icons
         if score_manager.shield_active:
@@ -307,6 +328,30 @@ class GameRenderer:
         inst_y = self.screen_height - 25
         self.screen.blit(inst_text, (inst_x, inst_y))
 
+    def draw_profiler_overlay(self, stats):
+        """
+        Draw per-stage timing (p50/p95/p99) as a panel in the top center.
+
+        Args:
+            stats: Profiler.summary() dict
+        """
+        lines = [f"{'STAGE':<16}{'p50':>8}{'p95':>8}{'p99':>8}  ms"]
+        for name, row in stats.items():
+            lines.append(f"{name:<16}{row['p50_ms']:>8.2f}"
+                         f"{row['p95_ms']:>8.2f}{row['p99_ms']:>8.2f}")
+
+        font = self.font_mono
+        line_h = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 20
+        height = line_h * len(lines) + 20
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            color = self.YELLOW if i == 0 else self.WHITE
+            panel.blit(font.render(line, True, color), (10, 10 + i * line_h))
+        self.screen.blit(panel, (self.screen_width // 2 - width // 2, 10))
+
+    @profiler.timed('draw.game_over')
     def draw_game_over_screen(self, score_manager, play_duration=0, phase=1):
         """
         Draws the Game Over screen with sequential animation.
@@ -368,140 +413,31 @@ class GameRenderer:
                 self.screen.blit(self.menu_button,
                                  (30, self.screen_height - 130))
 
-    def draw_stickman(self, landmarks, pose_detector):
+    @profiler.timed('draw.stickman')
+    def draw_stickman(self, pose_frame):
         """
         Draw stickman overlay on game screen.
-        (KEMBALI KE KODE ORIGINAL PANJANG)
+
+        The stickman is the PoseFrame's BodyModel drawn as-is (capsules and
+        head circle), so it matches the collision hitbox exactly.
+
+        Args:
+            pose_frame: PoseFrame of the current frame, or None
         """
-        if not landmarks:
+        if pose_frame is None:
             return
 
         BODY_COLOR = self.WHITE
-        LINE_THICKNESS = 65
-        JOINT_RADIUS = LINE_THICKNESS // 2
-
-        # Get landmarks explicitly
-        nose = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.NOSE.value, self.screen_width, self.screen_height)
-        left_ear = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_EAR.value, self.screen_width, self.screen_height)
-        right_ear = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_EAR.value, self.screen_width, self.screen_height)
-
-        left_shoulder = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_SHOULDER.value, self.screen_width, self.screen_height)
-        right_shoulder = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_SHOULDER.value, self.screen_width, self.screen_height)
-        left_hip = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_HIP.value, self.screen_width, self.screen_height)
-        right_hip = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_HIP.value, self.screen_width, self.screen_height)
-
-        left_elbow = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_ELBOW.value, self.screen_width, self.screen_height)
-        left_wrist = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_WRIST.value, self.screen_width, self.screen_height)
-        right_elbow = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_ELBOW.value, self.screen_width, self.screen_height)
-        right_wrist = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_WRIST.value, self.screen_width, self.screen_height)
-
-        left_knee = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_KNEE.value, self.screen_width, self.screen_height)
-        left_ankle = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.LEFT_ANKLE.value, self.screen_width, self.screen_height)
-        right_knee = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_KNEE.value, self.screen_width, self.screen_height)
-        right_ankle = pose_detector.get_landmark_position(
-            landmarks, self.mp_pose.RIGHT_ANKLE.value, self.screen_width, self.screen_height)
-
-        neck_point = None
-        pelvis_point = None
-
-        if left_shoulder and right_shoulder:
-            neck_point = (
-                (left_shoulder[0] + right_shoulder[0]) // 2,
-                (left_shoulder[1] + right_shoulder[1]) // 2
-            )
+        body = pose_frame.body
 
-        if left_hip and right_hip:
-            pelvis_point = (
-                (left_hip[0] + right_hip[0]) // 2,
-                (left_hip[1] + right_hip[1]) // 2
-            )
+        # Kapsul = persegi panjang selebar 2r tegak lurus segmen + ujung bulat
+        # (lingkaran di sendi); garis tebal pygame tidak tegak lurus
+        for quad in body.capsule_outlines().tolist():
+            pygame.draw.polygon(self.screen, BODY_COLOR, quad)
+
+        joint_radius = int(body.radii.max())
+        for joint in body.joints.tolist():
+            pygame.draw.circle(self.screen, BODY_COLOR, joint, joint_radius)
 
-        head_center = None
-        head_radius = 30
-
-        if nose:
-            head_center_x_calc = nose[0]
-            head_center_y_calc = nose[1]
-
-            if left_ear and right_ear:
-                ear_distance = abs(left_ear[0] - right_ear[0])
-                head_radius = int(ear_distance * 0.75)
-
-            head_center_y_calc = nose[1]
-            head_center = (head_center_x_calc, head_center_y_calc)
-            pygame.draw.circle(self.screen, BODY_COLOR,
-                               head_center, head_radius)
-
-        if neck_point and pelvis_point:
-            pygame.draw.line(self.screen, BODY_COLOR,
-                             neck_point, pelvis_point, LINE_THICKNESS)
-
-            if head_center:
-                pygame.draw.line(self.screen, BODY_COLOR,
-                                 head_center, neck_point, LINE_THICKNESS)
-
-        if neck_point:
-            if left_elbow:
-                pygame.draw.line(self.screen, BODY_COLOR,
-                                 neck_point, left_elbow, LINE_THICKNESS)
-                if left_wrist:
-                    pygame.draw.line(self.screen, BODY_COLOR,
-                                     left_elbow, left_wrist, LINE_THICKNESS)
-
-            if right_elbow:
-                pygame.draw.line(self.screen, BODY_COLOR,
-                                 neck_point, right_elbow, LINE_THICKNESS)
-                if right_wrist:
-                    pygame.draw.line(self.screen, BODY_COLOR,
-                                     right_elbow, right_wrist, LINE_THICKNESS)
-
-        if pelvis_point:
-            if left_knee:
-                pygame.draw.line(self.screen, BODY_COLOR,
-                                 pelvis_point, left_knee, LINE_THICKNESS)
-                if left_ankle:
-                    pygame.draw.line(self.screen, BODY_COLOR,
-                                     left_knee, left_ankle, LINE_THICKNESS)
-
-            if right_knee:
-                pygame.draw.line(self.screen, BODY_COLOR,
-                                 pelvis_point, right_knee, LINE_THICKNESS)
-                if right_ankle:
-                    pygame.draw.line(self.screen, BODY_COLOR,
-                                     right_knee, right_ankle, LINE_THICKNESS)
-
-        all_joints = [
-            neck_point,
-            pelvis_point,
-            left_elbow,
-            right_elbow,
-            left_knee,
-            right_knee,
-            left_wrist,
-            right_wrist,
-            left_ankle,
-            right_ankle
-        ]
-
-        for joint in all_joints:
-            if joint:
-                pygame.draw.circle(self.screen, BODY_COLOR,
-                                   joint, JOINT_RADIUS)
-
-        if head_center:
-            pygame.draw.circle(self.screen, BODY_COLOR,
-                               head_center, head_radius)
+        pygame.draw.circle(self.screen, BODY_COLOR,
+                           body.head_center, body.head_radius)
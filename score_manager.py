@@ -32,6 +32,9 @@ class ScoreManager:
         # Stats
         self.targets_hit = 0
         self.obstacles_dodged = 0
+        self.punches = 0
+        self.max_punch_speed = 0.0
+        self.total_punch_speed = 0.0
         self.start_time = time.time()
 
     def add_score(self, points: int, sound_manager=None):
@@ -77,6 +80,13 @@ class ScoreManager:
 
         return True
 
+    def record_punch(self, speed: float):
+        """Record the impact speed (pixels/second) of a punch that hit."""
+        speed = float(speed)
+        self.punches += 1
+        self.total_punch_speed += speed
+        self.max_punch_speed = max(self.max_punch_speed, speed)
+
     def add_life(self):
         """Increase life (not exceeding max)."""
         self.lives = min(self.max_lives, self.lives + 1)
@@ -123,6 +133,9 @@ class ScoreManager:
 
         self.targets_hit = 0
         self.obstacles_dodged = 0
+        self.punches = 0
+        self.max_punch_speed = 0.0
+        self.total_punch_speed = 0.0
 
         self.shield_active = False
         self.double_score_active = False
@@ -143,6 +156,9 @@ class ScoreManager:
             'lives': self.lives,
             'targets_hit': self.targets_hit,
             'obstacles_dodged': self.obstacles_dodged,
+            'max_punch_speed': round(self.max_punch_speed, 1),
+            'avg_punch_speed': round(self.total_punch_speed / self.punches, 1)
+            if self.punches else 0.0,
             'play_time': self.get_play_time(),
             'level': self.level
         }
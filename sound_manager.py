@@ -216,6 +216,12 @@ class SoundManager:
             fade_out_ms: Fade-out duration
             fade_in_ms: Fade-in duration
         """
+        # Musik yang tidak tersedia/dimatikan tidak perlu ditunggu fade-nya
+        # (dipanggil tiap frame di menu sampai musik benar-benar berputar)
+        if not self.music_enabled or new_state not in self.music_files:
+            self.stop_music()
+            return
+
         self.stop_music(fade_ms=fade_out_ms)
         pygame.time.wait(fade_out_ms)
         self.play_music(new_state, fade_ms=fade_in_ms)
@@ -273,5 +279,8 @@ class SoundManager:
 
     def cleanup(self):
         """Clean up pygame mixer."""
+        # Mixer bisa sudah ditutup oleh SoundManager lain (main + GameEngine)
+        if not pygame.mixer.get_init():
+            return
         self.stop_music()
         pygame.mixer.quit()
\ No newline at end of file
@@ -0,0 +1,181 @@
+"""
+Spatial Hash Module
+Uniform grid broadphase: game objects are filed under the screen cell
+holding their center, so collision checks only look at objects near
+the player's hands, head and arms.
+"""
+
+import math
+
+import numpy as np
+
+from entity_store import KINDS
+
+
+class SpatialHash:
+    """
+    Uniform grid of square screen cells over the slots of an EntityStore.
+
+    Every slot is filed under the one cell that holds its center, in a
+    separate bucket per entity kind. Queries grow their boxes by the
+    largest radius filed, so an object reaching into a box from a
+    neighbouring cell is still found. ``update()`` only re-files the slots
+    whose bucket changed (or that spawned or died), which is a small
+    fraction of them per tick. Query results come back in
+    allocation order, so they line up with the engine's lists.
+    """
+
+    def __init__(self, store, cell_size=128):
+        """
+        Args:
+            store: EntityStore whose active slots are filed
+            cell_size: Cell edge length in pixels
+        """
+        self.store = store
+        self.cell_size = cell_size
+        self._cells = {}
+        # Per slot: terdaftar?, kunci bucket
+        self._filed = np.zeros(0, dtype=bool)
+        self._key = np.zeros(0, dtype=np.int64)
+        # Radius terbesar yang pernah didaftarkan (margin query)
+        self.max_radius = 0.0
+
+        # Counters
+        self.refiled = 0
+        self.queries = 0
+        self.candidates = 0
+
+    def __len__(self):
+        return int(self._filed.sum())
+
+    def _fit(self, capacity):
+        grow = capacity - len(self._filed)
+        if grow > 0:
+            def grown(array):
+                return np.concatenate([array, np.zeros(grow, dtype=array.dtype)])
+            self._filed = grown(self._filed)
+            self._key = grown(self._key)
+
+    @staticmethod
+    def _bucket_key(kind, cell_x, cell_y):
+        """One integer per (kind, cell); works on scalars and arrays alike."""
+        return (cell_x * 65536 + cell_y) * len(KINDS) + kind
+
+    def update(self):
+        """Re-file every slot whose center cell changed since the last update."""
+        store = self.store
+        n = store.size
+        self._fit(store.capacity)
+        live = store.alive[:n] & store.active[:n]
+        # Hanya slot yang hidup atau masih terdaftar yang perlu dilihat;
+        # slot mati yang sudah dikeluarkan tidak disentuh lagi
+        slots = np.flatnonzero(live | self._filed[:n])
+        live = live[slots]
+        filed = self._filed[slots]
+        # Slot yang dipakai ulang cukup dibandingkan kuncinya: yang tersimpan
+        # tetap benar selama sel dan jenisnya sama
+        keys = self._bucket_key(store.kind[slots],
+                                np.floor(store.x[slots] / self.cell_size),
+                                np.floor(store.y[slots] / self.cell_size))
+        keys = keys.astype(np.int64)
+        stay = live & filed & (keys == self._key[slots])
+        moved = live & ~stay
+        leaving = filed & ~stay
+        if not (moved.any() or leaving.any()):
+            return
+        self.refiled += int((moved & filed).sum())
+
+        cells = self._cells
+        gone = slots[leaving]
+        for slot, key in zip(gone.tolist(), self._key[gone].tolist()):
+            bucket = cells[key]
+            bucket.discard(slot)
+            if not bucket:
+                del cells[key]
+        self._filed[gone] = False
+
+        entering = slots[moved]
+        keys = keys[moved]
+        for slot, key in zip(entering.tolist(), keys.tolist()):
+            bucket = cells.get(key)
+            if bucket is None:
+                cells[key] = {slot}
+            else:
+                bucket.add(slot)
+        self._filed[entering] = True
+        self._key[entering] = keys
+        if len(entering):
+            self.max_radius = max(self.max_radius, float(store.radius[entering].max()))
+
+    def clear(self):
+        self._cells.clear()
+        self._filed[:] = False
+        self.max_radius = 0.0
+
+    def query(self, boxes, kind=None):
+        """
+        Slots whose center cell lies within any of the given boxes grown by
+        the largest filed radius.
+
+        Args:
+            boxes: Iterable of (min_x, min_y, max_x, max_y) in pixels
+            kind: Only slots of this entity kind (default: all)
+
+        Returns:
+            numpy.ndarray: Active candidate slots in allocation order
+        """
+        cells = self._cells
+        kinds = KINDS if kind is None else (kind,)
+        size = self.cell_size
+        margin = self.max_radius
+        # Sel yang tumpang tindih antar kotak (kapsul bersebelahan) cukup
+        # dilihat sekali
+        near = set()
+        for min_x, min_y, max_x, max_y in boxes:
+            y0 = math.floor((min_y - margin) / size)
+            y1 = math.floor((max_y + margin) / size)
+            for cx in range(math.floor((min_x - margin) / size),
+                            math.floor((max_x + margin) / size) + 1):
+                base = cx * 65536
+                near.update(range(base + y0, base + y1 + 1))
+        found = set()
+        stride = len(KINDS)
+        for cell in near:
+            for k in kinds:
+                bucket = cells.get(cell * stride + k)
+                if bucket:
+                    found.update(bucket)
+        self.queries += 1
+        if not found:
+            return np.zeros(0, dtype=np.int64)
+        store = self.store
+        slots = np.fromiter(found, dtype=np.int64, count=len(found))
+        slots = slots[store.active[slots]]
+        self.candidates += len(slots)
+        return store.in_order(slots)
+
+    @staticmethod
+    def box_around(points, margin):
+        """
+        Bounding box of ``points`` (None skipped) grown by ``margin``.
+
+        Returns:
+            tuple or None: (min_x, min_y, max_x, max_y), None without points
+        """
+        points = [p for p in points if p is not None]
+        if not points:
+            return None
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        return (min(xs) - margin, min(ys) - margin, max(xs) + margin, max(ys) + margin)
+
+    def get_stats(self) -> dict:
+        """Return grid counters."""
+        return {
+            'objects': len(self),
+            'cells': len(self._cells),
+            'refiled': self.refiled,
+            'queries': self.queries,
+            'avg_candidates': round(self.candidates / self.queries, 1)
+            if self.queries else 0.0,
+        }
@@ -19,6 +19,8 @@ class SpawnManager:
         """
         self.screen_width = screen_width
         self.screen_height = screen_height
+        # EntityStore untuk objek baru (diisi oleh GameEngine; None = store bawaan)
+        self.entity_store = None
 
         # Timers for spawning
         self.target_spawn_timer = 0
@@ -71,7 +73,8 @@ class SpawnManager:
         """Spawn a new target and add it to the list."""
         x = random.randint(100, self.screen_width - 100)
         y = random.randint(100, self.screen_height - 100)
-        targets.append(Target(x, y, self.screen_width, self.screen_height))
+        targets.append(Target(x, y, self.screen_width, self.screen_height,
+                              store=self.entity_store))
 
     def spawn_obstacle(self, obstacles):
         """Spawn a new obstacle from random edge and add it to the list."""
@@ -90,10 +93,12 @@ class SpawnManager:
             x = self.screen_width + 50
             y = random.randint(0, self.screen_height)
         
-        obstacles.append(Obstacle(x, y, self.screen_width, self.screen_height))
+        obstacles.append(Obstacle(x, y, self.screen_width, self.screen_height,
+                                  store=self.entity_store))
 
     def spawn_powerup(self, powerups):
         """Spawn a new power-up and add it to the list."""
         x = random.randint(100, self.screen_width - 100)
         y = random.randint(100, self.screen_height - 100)
-        powerups.append(PowerUp(x, y, self.screen_width, self.screen_height))
\ No newline at end of file
+        powerups.append(PowerUp(x, y, self.screen_width, self.screen_height,
+                                store=self.entity_store))
\ No newline at end of file